@@ -0,0 +1,6 @@
+-- Add spec_hash column to api_endpoints for incremental endpoint syncs
+ALTER TABLE public.api_endpoints
+ADD COLUMN IF NOT EXISTS spec_hash TEXT;
+
+-- Add comment to explain the column
+COMMENT ON COLUMN public.api_endpoints.spec_hash IS 'Hash of the endpoint spec last synced from api_endpoints.py (see endpoint_sync.py)';
@@ -0,0 +1,3 @@
+"""
+Per-service API endpoint definitions, loaded lazily by api_endpoints.py
+"""
@@ -0,0 +1,262 @@
+"""
+Asana API endpoint definitions
+"""
+
+ASANA_ENDPOINTS = {
+    "workspaces": {
+        "list": {
+            "method": "GET",
+            "path": "/workspaces",
+            "parameters": {
+                "limit": "integer"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "100 requests per minute"
+        }
+    },
+    "projects": {
+        "list": {
+            "method": "GET",
+            "path": "/projects",
+            "parameters": {
+                "workspace": "string",
+                "limit": "integer"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "100 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/projects/{projectGid}",
+            "parameters": {
+                "projectGid": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "100 requests per minute"
+        },
+        "task_counts": {
+            "method": "GET",
+            "path": "/projects/{projectGid}/task_counts",
+            "parameters": {
+                "projectGid": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "100 requests per minute"
+        },
+        "sections": {
+            "method": "GET",
+            "path": "/projects/{projectGid}/sections",
+            "parameters": {
+                "projectGid": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "100 requests per minute"
+        },
+        "statuses": {
+            "method": "GET",
+            "path": "/projects/{projectGid}/project_statuses",
+            "parameters": {
+                "projectGid": "string",
+                "limit": "integer",
+                "offset": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "100 requests per minute"
+        }
+    },
+    "tasks": {
+        "list": {
+            "method": "GET",
+            "path": "/tasks",
+            "parameters": {
+                "project": "string",
+                "workspace": "string",
+                "assignee": "string",
+                "completed": "boolean",
+                "limit": "integer",
+                "modified_since": "string",
+                "opt_fields": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "100 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/tasks/{taskGid}",
+            "parameters": {
+                "taskGid": "string",
+                "opt_fields": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "100 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/tasks",
+            "parameters": {
+                "data": {
+                    "name": "string",
+                    "notes": "string",
+                    "html_notes": "string",
+                    "due_on": "string",
+                    "assignee": "string",
+                    "followers": "array",
+                    "parent": "string",
+                    "projects": "array",
+                    "workspace": "string",
+                    "approval_status": "string",
+                    "assignee_status": "string",
+                    "completed": "boolean",
+                    "external": "object",
+                    "is_rendered_as_separator": "boolean",
+                    "liked": "boolean"
+                }
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "100 requests per minute"
+        },
+        "update": {
+            "method": "PUT",
+            "path": "/tasks/{taskGid}",
+            "parameters": {
+                "taskGid": "string",
+                "data": {
+                    "name": "string",
+                    "notes": "string",
+                    "html_notes": "string",
+                    "due_on": "string",
+                    "assignee": "string",
+                    "completed": "boolean"
+                }
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "100 requests per minute"
+        },
+        "delete": {
+            "method": "DELETE",
+            "path": "/tasks/{taskGid}",
+            "parameters": {
+                "taskGid": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "100 requests per minute"
+        },
+        "stories": {
+            "list": {
+                "method": "GET",
+                "path": "/tasks/{taskGid}/stories",
+                "parameters": {
+                    "taskGid": "string",
+                    "opt_fields": "string"
+                },
+                "auth": {
+                    "type": "Bearer",
+                    "key": "access_token"
+                },
+                "rate_limit": "100 requests per minute"
+            },
+            "create": {
+                "method": "POST",
+                "path": "/tasks/{taskGid}/stories",
+                "parameters": {
+                    "taskGid": "string",
+                    "data": {
+                        "text": "string"
+                    }
+                },
+                "auth": {
+                    "type": "Bearer",
+                    "key": "access_token"
+                },
+                "rate_limit": "100 requests per minute"
+            }
+        },
+        "dependencies": {
+            "add": {
+                "method": "POST",
+                "path": "/tasks/{taskGid}/dependencies",
+                "parameters": {
+                    "taskGid": "string",
+                    "data": {
+                        "dependencies": "array"
+                    }
+                },
+                "auth": {
+                    "type": "Bearer",
+                    "key": "access_token"
+                },
+                "rate_limit": "100 requests per minute"
+            }
+        },
+        "dependents": {
+            "add": {
+                "method": "POST",
+                "path": "/tasks/{taskGid}/dependents",
+                "parameters": {
+                    "taskGid": "string",
+                    "data": {
+                        "dependents": "array"
+                    }
+                },
+                "auth": {
+                    "type": "Bearer",
+                    "key": "access_token"
+                },
+                "rate_limit": "100 requests per minute"
+            }
+        },
+        "subtasks": {
+            "create": {
+                "method": "POST",
+                "path": "/tasks/{taskGid}/subtasks",
+                "parameters": {
+                    "taskGid": "string",
+                    "data": {
+                        "name": "string",
+                        "notes": "string",
+                        "due_on": "string",
+                        "assignee": "string"
+                    }
+                },
+                "auth": {
+                    "type": "Bearer",
+                    "key": "access_token"
+                },
+                "rate_limit": "100 requests per minute"
+            }
+        }
+    }
+}
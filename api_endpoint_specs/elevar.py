@@ -0,0 +1,128 @@
+"""
+Elevar API endpoint definitions
+"""
+
+ELEVAR_ENDPOINTS = {
+    "account": {
+        "get": {
+            "method": "GET",
+            "path": "/v1/account",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "shops": {
+        "get": {
+            "method": "GET",
+            "path": "/v1/shops/{shop_id}",
+            "parameters": {
+                "shop_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "tracking": {
+        "issues": {
+            "method": "GET",
+            "path": "/v1/tracking/issues",
+            "parameters": {
+                "shop_id": "string",
+                "start_date": "string",
+                "end_date": "string",
+                "severity": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "analytics": {
+        "overview": {
+            "method": "GET",
+            "path": "/v1/analytics/overview",
+            "parameters": {
+                "shop_id": "string",
+                "start_date": "string",
+                "end_date": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "attribution": {
+        "get": {
+            "method": "GET",
+            "path": "/v1/attribution",
+            "parameters": {
+                "shop_id": "string",
+                "start_date": "string",
+                "end_date": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "monitoring": {
+        "data_quality": {
+            "method": "GET",
+            "path": "/v1/monitoring/data-quality",
+            "parameters": {
+                "shop_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "campaigns": {
+        "performance": {
+            "method": "GET",
+            "path": "/v1/campaigns/performance",
+            "parameters": {
+                "shop_id": "string",
+                "start_date": "string",
+                "end_date": "string",
+                "platform": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "channels": {
+        "performance": {
+            "method": "GET",
+            "path": "/channels/performance",
+            "parameters": {
+                "shop_id": "string",
+                "start_date": "string",  # YYYY-MM-DD format
+                "end_date": "string"     # YYYY-MM-DD format
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    }
+}
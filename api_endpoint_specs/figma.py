@@ -0,0 +1,35 @@
+"""
+Figma API endpoint definitions
+"""
+
+FIGMA_ENDPOINTS = {
+    "files": {
+        "get": {
+            "method": "GET",
+            "path": "/v1/files/{file_key}",
+            "parameters": {
+                "file_key": "string",
+                "version": "string",
+                "ids": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get_nodes": {
+            "method": "GET",
+            "path": "/v1/files/{file_key}/nodes",
+            "parameters": {
+                "file_key": "string",
+                "ids": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "access_token"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    }
+}
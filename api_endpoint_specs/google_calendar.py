@@ -0,0 +1,198 @@
+"""
+Google Calendar API endpoint definitions
+"""
+
+GOOGLE_CALENDAR_ENDPOINTS = {
+    "auth": {
+        "authenticate": {
+            "method": "GET",
+            "path": "/oauth2/auth",
+            "parameters": {},
+            "auth": {
+                "type": "None"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        },
+        "callback": {
+            "method": "POST",
+            "path": "/oauth2/token",
+            "parameters": {
+                "code": "string",
+                "state": "string"
+            },
+            "auth": {
+                "type": "None"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        }
+    },
+    "calendars": {
+        "list": {
+            "method": "GET",
+            "path": "/users/me/calendarList",
+            "parameters": {
+                "maxResults": "integer",
+                "pageToken": "string",
+                "showDeleted": "boolean",
+                "showHidden": "boolean"
+            },
+            "auth": {
+                "type": "OAuth2",
+                "key": "access_token"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/calendars/{calendarId}",
+            "parameters": {
+                "calendarId": "string"
+            },
+            "auth": {
+                "type": "OAuth2",
+                "key": "access_token"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        }
+    },
+    "events": {
+        "list": {
+            "method": "GET",
+            "path": "/calendars/{calendarId}/events",
+            "parameters": {
+                "calendarId": "string",
+                "timeMin": "string",
+                "timeMax": "string",
+                "maxResults": "integer",
+                "singleEvents": "boolean",
+                "orderBy": "string",
+                "q": "string",
+                "pageToken": "string",
+                "timeZone": "string",
+                "updatedMin": "string",
+                "showDeleted": "boolean",
+                "iCalUID": "string"
+            },
+            "auth": {
+                "type": "OAuth2",
+                "key": "access_token"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/calendars/{calendarId}/events/{eventId}",
+            "parameters": {
+                "calendarId": "string",
+                "eventId": "string",
+                "timeZone": "string"
+            },
+            "auth": {
+                "type": "OAuth2",
+                "key": "access_token"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/calendars/{calendarId}/events",
+            "parameters": {
+                "calendarId": "string",
+                "summary": "string",
+                "description": "string",
+                "start": {
+                    "dateTime": "string",
+                    "timeZone": "string"
+                },
+                "end": {
+                    "dateTime": "string",
+                    "timeZone": "string"
+                },
+                "location": "string",
+                "attendees": "array",
+                "recurrence": "array",
+                "reminders": {
+                    "useDefault": "boolean",
+                    "overrides": "array"
+                },
+                "conferenceData": "object",
+                "visibility": "string",
+                "transparency": "string",
+                "colorId": "string"
+            },
+            "auth": {
+                "type": "OAuth2",
+                "key": "access_token"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        },
+        "update": {
+            "method": "PUT",
+            "path": "/calendars/{calendarId}/events/{eventId}",
+            "parameters": {
+                "calendarId": "string",
+                "eventId": "string",
+                "summary": "string",
+                "description": "string",
+                "start": {
+                    "dateTime": "string",
+                    "timeZone": "string"
+                },
+                "end": {
+                    "dateTime": "string",
+                    "timeZone": "string"
+                },
+                "location": "string",
+                "attendees": "array",
+                "recurrence": "array",
+                "reminders": {
+                    "useDefault": "boolean",
+                    "overrides": "array"
+                },
+                "conferenceData": "object",
+                "visibility": "string",
+                "transparency": "string",
+                "colorId": "string"
+            },
+            "auth": {
+                "type": "OAuth2",
+                "key": "access_token"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        },
+        "delete": {
+            "method": "DELETE",
+            "path": "/calendars/{calendarId}/events/{eventId}",
+            "parameters": {
+                "calendarId": "string",
+                "eventId": "string",
+                "sendNotifications": "boolean",
+                "sendUpdates": "string"
+            },
+            "auth": {
+                "type": "OAuth2",
+                "key": "access_token"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        },
+        "instances": {
+            "method": "GET",
+            "path": "/calendars/{calendarId}/events/{eventId}/instances",
+            "parameters": {
+                "calendarId": "string",
+                "eventId": "string",
+                "maxResults": "integer",
+                "pageToken": "string",
+                "timeMin": "string",
+                "timeMax": "string",
+                "timeZone": "string",
+                "showDeleted": "boolean"
+            },
+            "auth": {
+                "type": "OAuth2",
+                "key": "access_token"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        }
+    }
+}
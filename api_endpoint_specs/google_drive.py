@@ -0,0 +1,37 @@
+"""
+Google Drive API endpoint definitions
+"""
+
+GOOGLE_DRIVE_ENDPOINTS = {
+    "files": {
+        "list": {
+            "method": "GET",
+            "path": "/drive/v3/files",
+            "parameters": {
+                "q": "string",
+                "pageSize": "integer",
+                "fields": "string",
+                "orderBy": "string"
+            },
+            "auth": {
+                "type": "OAuth2",
+                "key": "access_token"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/upload/drive/v3/files",
+            "parameters": {
+                "name": "string",
+                "mimeType": "string",
+                "parents": "array"
+            },
+            "auth": {
+                "type": "OAuth2",
+                "key": "access_token"
+            },
+            "rate_limit": "1000 requests per 100 seconds"
+        }
+    }
+}
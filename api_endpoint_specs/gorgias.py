@@ -0,0 +1,176 @@
+"""
+Gorgias API endpoint definitions
+"""
+
+GORGIAS_ENDPOINTS = {
+    "account": {
+        "info": {
+            "method": "GET",
+            "path": "/account",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "tickets": {
+        "list": {
+            "method": "GET",
+            "path": "/tickets",
+            "parameters": {
+                "limit": "integer",      # Default: 20
+                "offset": "integer",     # Default: 0
+                "status": "string",      # Optional: filter by status
+                "order_by": "string",    # Optional: field to order by
+                "order_dir": "string"    # Optional: asc or desc
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/tickets/{ticket_id}",
+            "parameters": {
+                "ticket_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/tickets",
+            "parameters": {
+                "subject": "string",
+                "message": "string",
+                "customer_email": "string",
+                "priority": "string"     # Optional: normal, high, urgent
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "update": {
+            "method": "PUT",
+            "path": "/tickets/{ticket_id}",
+            "parameters": {
+                "ticket_id": "string",
+                "status": "string",
+                "priority": "string",
+                "subject": "string",
+                "tags": "array"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "customers": {
+        "list": {
+            "method": "GET",
+            "path": "/customers",
+            "parameters": {
+                "limit": "integer",      # Default: 20
+                "offset": "integer",     # Default: 0
+                "email": "string"        # Optional: filter by email
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/customers/{customer_id}",
+            "parameters": {
+                "customer_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "analytics": {
+        "satisfaction": {
+            "method": "GET",
+            "path": "/analytics/satisfaction",
+            "parameters": {
+                "start_date": "string",  # YYYY-MM-DD format
+                "end_date": "string"     # YYYY-MM-DD format
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "performance": {
+            "metrics": {
+                "method": "GET",
+                "path": "/analytics/satisfaction",
+                "parameters": {
+                    "days": "integer"        # Optional: number of days to analyze
+                },
+                "auth": {
+                    "type": "Bearer",
+                    "key": "api_key"
+                },
+                "rate_limit": "60 requests per minute"
+            },
+            "summary": {
+                "method": "GET",
+                "path": "/analytics/summary",
+                "parameters": {},
+                "auth": {
+                    "type": "Bearer",
+                    "key": "api_key"
+                },
+                "rate_limit": "60 requests per minute"
+            }
+        },
+        "satisfaction_surveys": {
+            "list": {
+                "method": "GET",
+                "path": "/satisfaction-surveys",
+                "parameters": {
+                    "limit": "integer",      # Default: 20
+                    "offset": "integer"      # Default: 0
+                },
+                "auth": {
+                    "type": "Bearer",
+                    "key": "api_key"
+                },
+                "rate_limit": "60 requests per minute"
+            }
+        },
+        "integrations": {
+            "list": {
+                "method": "GET",
+                "path": "/integrations",
+                "parameters": {
+                    "limit": "integer",      # Default: 20
+                    "offset": "integer"      # Default: 0
+                },
+                "auth": {
+                    "type": "Bearer",
+                    "key": "api_key"
+                },
+                "rate_limit": "60 requests per minute"
+            }
+        }
+    }
+}
@@ -0,0 +1,778 @@
+"""
+Klaviyo API endpoint definitions
+"""
+
+KLAVIYO_ENDPOINTS = {
+    "profiles": {
+        "list": {
+            "method": "GET",
+            "path": "/profiles",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/profiles/{id}",
+            "parameters": {
+                "id": "string",
+                "include": "string",
+                "fields": "object"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/profiles",
+            "parameters": {
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "update": {
+            "method": "PATCH",
+            "path": "/profiles/{id}",
+            "parameters": {
+                "id": "string",
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "delete": {
+            "method": "DELETE",
+            "path": "/profiles/{id}",
+            "parameters": {
+                "id": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "lists": {
+        "list": {
+            "method": "GET",
+            "path": "/lists",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/lists/{id}",
+            "parameters": {
+                "id": "string",
+                "include": "string",
+                "fields": "object"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/lists",
+            "parameters": {
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "add_profiles": {
+            "method": "POST",
+            "path": "/lists/{id}/relationships/profiles",
+            "parameters": {
+                "id": "string",
+                "data": "array"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "segments": {
+        "list": {
+            "method": "GET",
+            "path": "/segments",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/segments/{id}",
+            "parameters": {
+                "id": "string",
+                "include": "string",
+                "fields": "object"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "events": {
+        "list": {
+            "method": "GET",
+            "path": "/events",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/events",
+            "parameters": {
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "metrics": {
+        "list": {
+            "method": "GET",
+            "path": "/metrics",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/metrics/{id}",
+            "parameters": {
+                "id": "string",
+                "include": "string",
+                "fields": "object"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "campaigns": {
+        "list": {
+            "method": "GET",
+            "path": "/campaigns",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/campaigns/{id}",
+            "parameters": {
+                "id": "string",
+                "include": "string",
+                "fields": "object"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/campaigns",
+            "parameters": {
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "send": {
+            "method": "POST",
+            "path": "/campaign-send-jobs",
+            "parameters": {
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get_send_job": {
+            "method": "GET",
+            "path": "/campaign-send-jobs/{id}",
+            "parameters": {
+                "id": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "flows": {
+        "list": {
+            "method": "GET",
+            "path": "/flows",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/flows/{id}",
+            "parameters": {
+                "id": "string",
+                "include": "string",
+                "fields": "object"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/flows",
+            "parameters": {
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "update_status": {
+            "method": "PATCH",
+            "path": "/flows/{id}",
+            "parameters": {
+                "id": "string",
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "templates": {
+        "list": {
+            "method": "GET",
+            "path": "/templates",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/templates/{id}",
+            "parameters": {
+                "id": "string",
+                "include": "string",
+                "fields": "object"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/templates",
+            "parameters": {
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "catalogs": {
+        "list": {
+            "method": "GET",
+            "path": "/catalogs",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/catalogs/{id}",
+            "parameters": {
+                "id": "string",
+                "include": "string",
+                "fields": "object"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "items": {
+            "list": {
+                "method": "GET",
+                "path": "/catalog-items",
+                "parameters": {
+                    "filter": "string",
+                    "page_size": "integer",
+                    "page_cursor": "string",
+                    "include": "string",
+                    "fields": "object",
+                    "sort": "string"
+                },
+                "auth": {
+                    "type": "Header",
+                    "key": "Klaviyo-API-Key"
+                },
+                "rate_limit": "60 requests per minute"
+            },
+            "get": {
+                "method": "GET",
+                "path": "/catalog-items/{id}",
+                "parameters": {
+                    "id": "string",
+                    "include": "string",
+                    "fields": "object"
+                },
+                "auth": {
+                    "type": "Header",
+                    "key": "Klaviyo-API-Key"
+                },
+                "rate_limit": "60 requests per minute"
+            },
+            "create": {
+                "method": "POST",
+                "path": "/catalog-items",
+                "parameters": {
+                    "data": {
+                        "type": "string",
+                        "attributes": {
+                            "external_id": "string",
+                            "title": "string",
+                            "description": "string",
+                            "url": "string",
+                            "price": "number",
+                            "image_full_url": "string",
+                            "image_thumbnail_url": "string",
+                            "images": "array",
+                            "catalog_type": "string",
+                            "custom_metadata": "object",
+                            "published": "boolean"
+                        }
+                    }
+                },
+                "auth": {
+                    "type": "Header",
+                    "key": "Klaviyo-API-Key"
+                },
+                "rate_limit": "60 requests per minute"
+            },
+            "delete": {
+                "method": "DELETE",
+                "path": "/catalog-items/{id}",
+                "parameters": {
+                    "id": "string"
+                },
+                "auth": {
+                    "type": "Header",
+                    "key": "Klaviyo-API-Key"
+                },
+                "rate_limit": "60 requests per minute"
+            }
+        }
+    },
+    "tags": {
+        "list": {
+            "method": "GET",
+            "path": "/tags",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/tags",
+            "parameters": {
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "add_to_resource": {
+            "method": "POST",
+            "path": "/tags/{id}/relationships/resources",
+            "parameters": {
+                "id": "string",
+                "data": "array"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "webhooks": {
+        "list": {
+            "method": "GET",
+            "path": "/webhooks",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/webhooks",
+            "parameters": {
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "delete": {
+            "method": "DELETE",
+            "path": "/webhooks/{id}",
+            "parameters": {
+                "id": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "data_privacy": {
+        "request_deletion": {
+            "method": "POST",
+            "path": "/data-privacy-deletion-jobs",
+            "parameters": {
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "coupons": {
+        "list": {
+            "method": "GET",
+            "path": "/coupons",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create_code": {
+            "method": "POST",
+            "path": "/coupon-codes",
+            "parameters": {
+                "data": {
+                    "type": "string",
+                    "attributes": "object"
+                }
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "forms": {
+        "list": {
+            "method": "GET",
+            "path": "/forms",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/forms/{id}",
+            "parameters": {
+                "id": "string",
+                "include": "string",
+                "fields": "object"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "reviews": {
+        "list": {
+            "method": "GET",
+            "path": "/product-reviews",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/product-reviews/{id}",
+            "parameters": {
+                "id": "string",
+                "include": "string",
+                "fields": "object"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "images": {
+        "list": {
+            "method": "GET",
+            "path": "/images",
+            "parameters": {
+                "filter": "string",
+                "page_size": "integer",
+                "page_cursor": "string",
+                "include": "string",
+                "fields": "object",
+                "sort": "string"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/images/{id}",
+            "parameters": {
+                "id": "string",
+                "include": "string",
+                "fields": "object"
+            },
+            "auth": {
+                "type": "Header",
+                "key": "Klaviyo-API-Key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    }
+}
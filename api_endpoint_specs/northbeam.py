@@ -0,0 +1,109 @@
+"""
+Northbeam API endpoint definitions
+"""
+
+NORTHBEAM_ENDPOINTS = {
+    "account": {
+        "info": {
+            "method": "GET",
+            "path": "/account",
+            "parameters": {},
+            "auth": {
+                "type": "Header",
+                "key": "X-API-KEY"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "metrics": {
+        "performance": {
+            "method": "GET",
+            "path": "/metrics/performance",
+            "parameters": {
+                "start_date": "string",  # YYYY-MM-DD format
+                "end_date": "string"     # YYYY-MM-DD format
+            },
+            "auth": {
+                "type": "Header",
+                "key": "X-API-KEY"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "channels": {
+            "method": "GET",
+            "path": "/metrics/channels",
+            "parameters": {
+                "start_date": "string",  # YYYY-MM-DD format
+                "end_date": "string",    # YYYY-MM-DD format
+                "channel": "string"      # Optional: specific channel to filter by
+            },
+            "auth": {
+                "type": "Header",
+                "key": "X-API-KEY"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "campaigns": {
+            "method": "GET",
+            "path": "/metrics/campaigns",
+            "parameters": {
+                "start_date": "string",  # YYYY-MM-DD format
+                "end_date": "string",    # YYYY-MM-DD format
+                "platform": "string"     # Optional: specific platform to filter by
+            },
+            "auth": {
+                "type": "Header",
+                "key": "X-API-KEY"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "roas": {
+            "method": "GET",
+            "path": "/metrics/roas",
+            "parameters": {
+                "start_date": "string",  # YYYY-MM-DD format
+                "end_date": "string",    # YYYY-MM-DD format
+                "channel": "string"      # Optional: specific channel to filter by
+            },
+            "auth": {
+                "type": "Header",
+                "key": "X-API-KEY"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "attribution": {
+        "get": {
+            "method": "GET",
+            "path": "/attribution",
+            "parameters": {
+                "start_date": "string",  # YYYY-MM-DD format
+                "end_date": "string",    # YYYY-MM-DD format
+                "model": "string"        # Optional: attribution model (default, first_touch, last_touch, linear, position_based, time_decay)
+            },
+            "auth": {
+                "type": "Header",
+                "key": "X-API-KEY"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "query": {
+        "execute": {
+            "method": "POST",
+            "path": "/query",
+            "parameters": {
+                "brand": "string",
+                "start_date": "string",  # YYYY-MM-DD format
+                "end_date": "string",    # YYYY-MM-DD format
+                "metrics": "array",      # Array of metric names
+                "dimensions": "array"    # Array of dimension names
+            },
+            "auth": {
+                "type": "Header",
+                "key": "X-API-KEY"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    }
+}
@@ -0,0 +1,242 @@
+"""
+Notion API endpoint definitions
+"""
+
+NOTION_ENDPOINTS = {
+    "blocks": {
+        "append_children": {
+            "method": "PATCH",
+            "path": "/v1/blocks/{block_id}/children",
+            "parameters": {
+                "block_id": "string",      # Required: Parent block ID
+                "children": "array"        # Required: Array of block objects
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        },
+        "retrieve": {
+            "method": "GET",
+            "path": "/v1/blocks/{block_id}",
+            "parameters": {
+                "block_id": "string"       # Required: Block ID
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        },
+        "retrieve_children": {
+            "method": "GET",
+            "path": "/v1/blocks/{block_id}/children",
+            "parameters": {
+                "block_id": "string",      # Required: Parent block ID
+                "page_size": "integer",    # Optional: Number of blocks to retrieve (max: 100)
+                "start_cursor": "string"   # Optional: Cursor for pagination
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        },
+        "delete": {
+            "method": "DELETE",
+            "path": "/v1/blocks/{block_id}",
+            "parameters": {
+                "block_id": "string"       # Required: Block ID
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        }
+    },
+    "pages": {
+        "retrieve": {
+            "method": "GET",
+            "path": "/v1/pages/{page_id}",
+            "parameters": {
+                "page_id": "string"        # Required: Page ID
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        },
+        "update": {
+            "method": "PATCH",
+            "path": "/v1/pages/{page_id}",
+            "parameters": {
+                "page_id": "string",       # Required: Page ID
+                "properties": "object"     # Required: Properties to update
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        }
+    },
+    "databases": {
+        "list": {
+            "method": "GET",
+            "path": "/v1/databases",
+            "parameters": {
+                "page_size": "integer",    # Optional: Number of databases to retrieve
+                "start_cursor": "string"     # Optional: Cursor for pagination
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/v1/databases",
+            "parameters": {
+                "parent": "object",        # Required: Parent object
+                "title": "array",          # Required: Title as rich text array
+                "properties": "object"     # Required: Property schema
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        },
+        "query": {
+            "method": "POST",
+            "path": "/v1/databases/{database_id}/query",
+            "parameters": {
+                "database_id": "string",   # Required: Database ID
+                "filter": "object",        # Optional: Filter conditions
+                "sorts": "array",          # Optional: Sorting conditions
+                "page_size": "integer",    # Optional: Number of results (max: 100)
+                "start_cursor": "string"   # Optional: Cursor for pagination
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        },
+        "retrieve": {
+            "method": "GET",
+            "path": "/v1/databases/{database_id}",
+            "parameters": {
+                "database_id": "string"    # Required: Database ID
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        },
+        "update": {
+            "method": "PATCH",
+            "path": "/v1/databases/{database_id}",
+            "parameters": {
+                "database_id": "string",   # Required: Database ID
+                "title": "array",          # Optional: New title
+                "description": "array",    # Optional: New description
+                "properties": "object"     # Optional: Updated property schema
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        }
+    },
+    "users": {
+        "list": {
+            "method": "GET",
+            "path": "/v1/users",
+            "parameters": {
+                "page_size": "integer",    # Optional: Number of users to retrieve
+                "start_cursor": "string"   # Optional: Cursor for pagination
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        },
+        "retrieve": {
+            "method": "GET",
+            "path": "/v1/users/{user_id}",
+            "parameters": {
+                "user_id": "string"        # Required: User ID
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        },
+        "retrieve_bot": {
+            "method": "GET",
+            "path": "/v1/users/me",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        }
+    },
+    "comments": {
+        "create": {
+            "method": "POST",
+            "path": "/v1/comments",
+            "parameters": {
+                "parent": "object",        # Required: Parent object (page or block)
+                "rich_text": "array"       # Required: Comment content as rich text
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        },
+        "retrieve": {
+            "method": "GET",
+            "path": "/v1/comments",
+            "parameters": {
+                "block_id": "string",      # Required: Block or page ID
+                "page_size": "integer",    # Optional: Number of comments (max: 100)
+                "start_cursor": "string"   # Optional: Cursor for pagination
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        }
+    },
+    "search": {
+        "query": {
+            "method": "POST",
+            "path": "/v1/search",
+            "parameters": {
+                "query": "string",         # Optional: Search text
+                "filter": "object",        # Optional: Filter criteria
+                "sort": "object",          # Optional: Sort criteria
+                "page_size": "integer",    # Optional: Number of results (max: 100)
+                "start_cursor": "string"   # Optional: Cursor for pagination
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "notion_token"
+            },
+            "rate_limit": "3 requests per second"
+        }
+    }
+}
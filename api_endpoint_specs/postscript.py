@@ -0,0 +1,217 @@
+"""
+Postscript API endpoint definitions
+"""
+
+POSTSCRIPT_ENDPOINTS = {
+    "account": {
+        "get": {
+            "method": "GET",
+            "path": "/v1/account",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "shops": {
+        "list": {
+            "method": "GET",
+            "path": "/v1/shops",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/v1/shops/{shop_id}",
+            "parameters": {
+                "shop_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "subscribers": {
+        "list": {
+            "method": "GET",
+            "path": "/v1/subscribers",
+            "parameters": {
+                "limit": "integer",
+                "page": "integer"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "search": {
+            "method": "GET",
+            "path": "/v1/subscribers/search",
+            "parameters": {
+                "phone": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/v1/subscribers",
+            "parameters": {
+                "phone": "string",
+                "email": "string",
+                "first_name": "string",
+                "last_name": "string",
+                "tags": "array",
+                "custom_attributes": "object"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "update": {
+            "method": "PUT",
+            "path": "/v1/subscribers/{subscriber_id}",
+            "parameters": {
+                "subscriber_id": "string",
+                "email": "string",
+                "first_name": "string",
+                "last_name": "string",
+                "tags": "array",
+                "custom_attributes": "object"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "campaigns": {
+        "list": {
+            "method": "GET",
+            "path": "/v1/campaigns",
+            "parameters": {
+                "limit": "integer",
+                "page": "integer"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/v1/campaigns/{campaign_id}",
+            "parameters": {
+                "campaign_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/v1/campaigns",
+            "parameters": {
+                "name": "string",
+                "message": "string",
+                "audience_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "messages": {
+        "list": {
+            "method": "GET",
+            "path": "/v1/messages",
+            "parameters": {
+                "limit": "integer",
+                "page": "integer"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "send": {
+            "method": "POST",
+            "path": "/v1/messages",
+            "parameters": {
+                "phone": "string",
+                "message": "string",
+                "type": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "keywords": {
+        "list": {
+            "method": "GET",
+            "path": "/v1/keywords",
+            "parameters": {
+                "limit": "integer",
+                "page": "integer"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "audiences": {
+        "list": {
+            "method": "GET",
+            "path": "/v1/audiences",
+            "parameters": {
+                "limit": "integer",
+                "page": "integer"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "analytics": {
+        "get": {
+            "method": "GET",
+            "path": "/v1/analytics",
+            "parameters": {
+                "period": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "apiKey"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    }
+}
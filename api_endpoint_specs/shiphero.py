@@ -0,0 +1,186 @@
+"""
+ShipHero API endpoint definitions
+"""
+
+SHIPHERO_ENDPOINTS = {
+    "orders": {
+        "list": {
+            "method": "GET",
+            "path": "/api/v1/orders",
+            "parameters": {
+                "page": "integer",
+                "per_page": "integer",
+                "status": "string",
+                "created_at_from": "string",
+                "created_at_to": "string",
+                "order_number": "string",
+                "customer_email": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/api/v1/orders/{order_id}",
+            "parameters": {
+                "order_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "update": {
+            "method": "PUT",
+            "path": "/api/v1/orders/{order_id}",
+            "parameters": {
+                "order_id": "string",
+                "status": "string",
+                "shipping_method": "string",
+                "tracking_number": "string",
+                "notes": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "shipments": {
+        "list": {
+            "method": "GET",
+            "path": "/api/v1/shipments",
+            "parameters": {
+                "page": "integer",
+                "per_page": "integer",
+                "status": "string",
+                "created_at_from": "string",
+                "created_at_to": "string",
+                "order_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/api/v1/shipments/{shipment_id}",
+            "parameters": {
+                "shipment_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/api/v1/shipments",
+            "parameters": {
+                "order_id": "string",
+                "carrier": "string",
+                "service": "string",
+                "tracking_number": "string",
+                "shipping_date": "string",
+                "items": "array"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "void": {
+            "method": "POST",
+            "path": "/api/v1/shipments/{shipment_id}/void",
+            "parameters": {
+                "shipment_id": "string",
+                "reason": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "inventory": {
+        "list": {
+            "method": "GET",
+            "path": "/api/v1/inventory",
+            "parameters": {
+                "page": "integer",
+                "per_page": "integer",
+                "sku": "string",
+                "warehouse_id": "string",
+                "status": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/api/v1/inventory/{sku}",
+            "parameters": {
+                "sku": "string",
+                "warehouse_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "update": {
+            "method": "PUT",
+            "path": "/api/v1/inventory/{sku}",
+            "parameters": {
+                "sku": "string",
+                "warehouse_id": "string",
+                "quantity": "integer",
+                "location": "string",
+                "note": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "warehouses": {
+        "list": {
+            "method": "GET",
+            "path": "/api/v1/warehouses",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/api/v1/warehouses/{warehouse_id}",
+            "parameters": {
+                "warehouse_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "Authorization"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    }
+}
@@ -0,0 +1,282 @@
+"""
+ShipStation API endpoint definitions
+"""
+
+SHIPSTATION_ENDPOINTS = {
+    "orders": {
+        "list": {
+            "method": "GET",
+            "path": "/orders",
+            "parameters": {
+                "page": "integer",
+                "pageSize": "integer",
+                "sortBy": "string",
+                "sortDir": "string",
+                "orderStatus": "string",
+                "orderNumber": "string",
+                "customerName": "string",
+                "itemKeyword": "string",
+                "createDateStart": "string",
+                "createDateEnd": "string",
+                "modifyDateStart": "string",
+                "modifyDateEnd": "string",
+                "orderDateStart": "string",
+                "orderDateEnd": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/orders/{orderId}",
+            "parameters": {
+                "orderId": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/orders/createorder",
+            "parameters": {
+                "orderNumber": "string",
+                "orderDate": "string",
+                "orderStatus": "string",
+                "customerName": "string",
+                "customerEmail": "string",
+                "items": "array",
+                "amountPaid": "number",
+                "taxAmount": "number",
+                "shippingAmount": "number",
+                "shippingAddress": "object",
+                "billingAddress": "object",
+                "tagIds": "array"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "update": {
+            "method": "PUT",
+            "path": "/orders/{orderId}",
+            "parameters": {
+                "orderId": "string",
+                "orderNumber": "string",
+                "orderDate": "string",
+                "orderStatus": "string",
+                "customerName": "string",
+                "customerEmail": "string",
+                "items": "array",
+                "amountPaid": "number",
+                "taxAmount": "number",
+                "shippingAmount": "number",
+                "shippingAddress": "object",
+                "billingAddress": "object",
+                "tagIds": "array"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "delete": {
+            "method": "DELETE",
+            "path": "/orders/{orderId}",
+            "parameters": {
+                "orderId": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        }
+    },
+    "shipments": {
+        "list": {
+            "method": "GET",
+            "path": "/shipments",
+            "parameters": {
+                "page": "integer",
+                "pageSize": "integer",
+                "sortBy": "string",
+                "sortDir": "string",
+                "shipDateStart": "string",
+                "shipDateEnd": "string",
+                "deliveryDateStart": "string",
+                "deliveryDateEnd": "string",
+                "trackingNumber": "string",
+                "orderNumber": "string",
+                "orderId": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/shipments/{shipmentId}",
+            "parameters": {
+                "shipmentId": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/shipments/createshipment",
+            "parameters": {
+                "orderId": "string",
+                "carrierCode": "string",
+                "serviceCode": "string",
+                "packageCode": "string",
+                "confirmation": "string",
+                "shipDate": "string",
+                "weight": "object",
+                "dimensions": "object",
+                "insuranceOptions": "object",
+                "internationalOptions": "object",
+                "advancedOptions": "object",
+                "testLabel": "boolean"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "void": {
+            "method": "POST",
+            "path": "/shipments/voidlabel",
+            "parameters": {
+                "shipmentId": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        }
+    },
+    "warehouses": {
+        "list": {
+            "method": "GET",
+            "path": "/warehouses",
+            "parameters": {},
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/warehouses/{warehouseId}",
+            "parameters": {
+                "warehouseId": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/warehouses/createwarehouse",
+            "parameters": {
+                "warehouseName": "string",
+                "warehouseCode": "string",
+                "address": "object",
+                "contactName": "string",
+                "contactEmail": "string",
+                "contactPhone": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "update": {
+            "method": "PUT",
+            "path": "/warehouses/{warehouseId}",
+            "parameters": {
+                "warehouseId": "string",
+                "warehouseName": "string",
+                "warehouseCode": "string",
+                "address": "object",
+                "contactName": "string",
+                "contactEmail": "string",
+                "contactPhone": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        }
+    },
+    "inventory": {
+        "list": {
+            "method": "GET",
+            "path": "/inventory",
+            "parameters": {
+                "page": "integer",
+                "pageSize": "integer",
+                "sortBy": "string",
+                "sortDir": "string",
+                "sku": "string",
+                "productName": "string",
+                "warehouseId": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/inventory/{sku}",
+            "parameters": {
+                "sku": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        },
+        "update": {
+            "method": "PUT",
+            "path": "/inventory/updateinventory",
+            "parameters": {
+                "sku": "string",
+                "warehouseId": "string",
+                "quantity": "integer",
+                "location": "string",
+                "note": "string"
+            },
+            "auth": {
+                "type": "Basic",
+                "key": "Authorization"
+            },
+            "rate_limit": "40 requests per minute"
+        }
+    }
+}
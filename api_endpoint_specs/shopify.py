@@ -0,0 +1,425 @@
+"""
+Shopify API endpoint definitions
+"""
+
+SHOPIFY_ENDPOINTS = {
+    "shop": {
+        "get": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/shop.json",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "get_details": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/shop/details.json",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "load_storefronts": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/shop.json",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        }
+    },
+    "products": {
+        "list": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/products.json",
+            "parameters": {
+                "limit": "integer",
+                "title": "string",
+                "fields": "string",
+                "created_at_min": "string",
+                "created_at_max": "string",
+                "updated_at_min": "string",
+                "updated_at_max": "string",
+                "published_at_min": "string",
+                "published_at_max": "string",
+                "published_status": "string",
+                "collection_id": "string",
+                "handle": "string",
+                "product_type": "string",
+                "vendor": "string",
+                "status": "string",
+                "after_cursor": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/products/{product_id}.json",
+            "parameters": {
+                "product_id": "string",
+                "fields": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "get_by_collection": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/collections/{collection_id}/products.json",
+            "parameters": {
+                "collection_id": "string",
+                "limit": "integer",
+                "fields": "string",
+                "after_cursor": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "get_by_ids": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/products.json",
+            "parameters": {
+                "ids": "array",
+                "fields": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "search": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/products.json",
+            "parameters": {
+                "query": "string",
+                "limit": "integer",
+                "fields": "string",
+                "after_cursor": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        }
+    },
+    "orders": {
+        "list": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/orders.json",
+            "parameters": {
+                "limit": "integer",
+                "status": "string",
+                "financial_status": "string",
+                "fulfillment_status": "string",
+                "created_at_min": "string",
+                "created_at_max": "string",
+                "updated_at_min": "string",
+                "updated_at_max": "string",
+                "processed_at_min": "string",
+                "processed_at_max": "string",
+                "fields": "string",
+                "page_info": "string",
+                "query": "string",
+                "cursor": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/orders/{order_id}.json",
+            "parameters": {
+                "order_id": "string",
+                "fields": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "get_sales": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/orders.json",
+            "parameters": {
+                "created_at_min": "string",
+                "created_at_max": "string",
+                "limit": "integer",
+                "cursor": "string",
+                "fields": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        }
+    },
+    "customers": {
+        "list": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/customers.json",
+            "parameters": {
+                "limit": "integer",
+                "fields": "string",
+                "page_info": "string",
+                "next": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/customers/{customer_id}.json",
+            "parameters": {
+                "customer_id": "string",
+                "fields": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "tag": {
+            "method": "PUT",
+            "path": "/admin/api/2023-10/customers/{customer_id}.json",
+            "parameters": {
+                "customer_id": "string",
+                "tags": "array"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        }
+    },
+    "draft_orders": {
+        "create": {
+            "method": "POST",
+            "path": "/admin/api/2023-10/draft_orders.json",
+            "parameters": {
+                "line_items": "array",
+                "email": "string",
+                "shipping_address": "object",
+                "note": "string",
+                "tags": "string",
+                "tax_exempt": "boolean",
+                "applied_discount": "object",
+                "customer": "object",
+                "use_customer_default_address": "boolean"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "complete": {
+            "method": "PUT",
+            "path": "/admin/api/2023-10/draft_orders/{draft_order_id}/complete.json",
+            "parameters": {
+                "draft_order_id": "string",
+                "payment_pending": "boolean"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        }
+    },
+    "discounts": {
+        "create": {
+            "method": "POST",
+            "path": "/admin/api/2023-10/price_rules.json",
+            "parameters": {
+                "title": "string",
+                "code": "string",
+                "value_type": "string",
+                "value": "number",
+                "starts_at": "string",
+                "ends_at": "string",
+                "applies_once_per_customer": "boolean",
+                "usage_limit": "integer",
+                "customer_selection": "string",
+                "target_type": "string",
+                "target_selection": "string",
+                "allocation_method": "string",
+                "prerequisite_subtotal_range": "object",
+                "prerequisite_quantity_range": "object",
+                "prerequisite_shipping_price_range": "object"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "create_code": {
+            "method": "POST",
+            "path": "/admin/api/2023-10/discount_codes.json",
+            "parameters": {
+                "code": "string",
+                "price_rule_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        }
+    },
+    "collections": {
+        "list": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/custom_collections.json",
+            "parameters": {
+                "limit": "integer",
+                "name": "string",
+                "product_id": "string",
+                "handle": "string",
+                "updated_at_min": "string",
+                "updated_at_max": "string",
+                "published_at_min": "string",
+                "published_at_max": "string",
+                "published_status": "string",
+                "fields": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        }
+    },
+    "variants": {
+        "list": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/products/{product_id}/variants.json",
+            "parameters": {
+                "product_id": "string",
+                "limit": "integer",
+                "fields": "string",
+                "since_id": "string",
+                "presentment_currencies": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "get": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/variants/{variant_id}.json",
+            "parameters": {
+                "variant_id": "string",
+                "fields": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "get_by_ids": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/variants.json",
+            "parameters": {
+                "ids": "array",
+                "fields": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        }
+    },
+    "webhooks": {
+        "list": {
+            "method": "GET",
+            "path": "/admin/api/2023-10/webhooks.json",
+            "parameters": {
+                "limit": "integer",
+                "since_id": "string",
+                "fields": "string",
+                "topic": "string",
+                "address": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "create": {
+            "method": "POST",
+            "path": "/admin/api/2023-10/webhooks.json",
+            "parameters": {
+                "topic": "string",
+                "address": "string",
+                "format": "string",
+                "fields": "array",
+                "metafield_namespaces": "array"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "delete": {
+            "method": "DELETE",
+            "path": "/admin/api/2023-10/webhooks/{webhook_id}.json",
+            "parameters": {
+                "webhook_id": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        },
+        "manage": {
+            "method": "POST",
+            "path": "/admin/api/2023-10/webhooks.json",
+            "parameters": {
+                "action": "string",  # subscribe, find, unsubscribe
+                "topic": "string",
+                "address": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "X-Shopify-Access-Token"
+            },
+            "rate_limit": "2 requests per second"
+        }
+    }
+}
@@ -0,0 +1,38 @@
+"""
+Slack API endpoint definitions
+"""
+
+SLACK_ENDPOINTS = {
+    "chat": {
+        "postMessage": {
+            "method": "POST",
+            "path": "/api/chat.postMessage",
+            "parameters": {
+                "channel": "string",
+                "text": "string",
+                "blocks": "array",
+                "attachments": "array"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "bot_token"
+            },
+            "rate_limit": "1 request per second"
+        },
+        "update": {
+            "method": "POST",
+            "path": "/api/chat.update",
+            "parameters": {
+                "channel": "string",
+                "ts": "string",
+                "text": "string",
+                "blocks": "array"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "bot_token"
+            },
+            "rate_limit": "1 request per second"
+        }
+    }
+}
@@ -0,0 +1,175 @@
+"""
+Triple Whale API endpoint definitions
+"""
+
+TRIPLE_WHALE_ENDPOINTS = {
+    "account": {
+        "info": {
+            "method": "GET",
+            "path": "/account/info",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "analytics": {
+        "sales": {
+            "method": "GET",
+            "path": "/analytics/sales",
+            "parameters": {
+                "from": "string",  # YYYY-MM-DD format
+                "to": "string"     # YYYY-MM-DD format
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "attribution": {
+        "overview": {
+            "method": "GET",
+            "path": "/attribution/overview",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "source": {
+            "method": "GET",
+            "path": "/attribution/sources/{source}",
+            "parameters": {
+                "source": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "campaigns": {
+        "list": {
+            "method": "GET",
+            "path": "/campaigns",
+            "parameters": {},
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "platform": {
+            "method": "GET",
+            "path": "/campaigns/{platform}",
+            "parameters": {
+                "platform": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "cohorts": {
+        "analysis": {
+            "method": "GET",
+            "path": "/cohorts/analysis",
+            "parameters": {
+                "days": "integer"  # Default: 30
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "blended_stats": {
+        "table": {
+            "method": "POST",
+            "path": "/shops/{shopId}/blended-stats-table",
+            "parameters": {
+                "dateRange": {
+                    "start": "string",  # YYYY-MM-DD format
+                    "end": "string"     # YYYY-MM-DD format
+                },
+                "comparisonDateRange": {
+                    "start": "string",  # YYYY-MM-DD format
+                    "end": "string"     # YYYY-MM-DD format
+                },
+                "metrics": [
+                    {
+                        "id": "string",
+                        "name": "string"
+                    }
+                ],
+                "dimensions": [
+                    {
+                        "id": "string",
+                        "name": "string"
+                    }
+                ],
+                "filters": [
+                    {
+                        "dimension": "string",
+                        "operator": "string",
+                        "value": "string|number"
+                    }
+                ],
+                "limit": "integer",
+                "offset": "integer"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    },
+    "shop": {
+        "info": {
+            "method": "GET",
+            "path": "/shops/{shopId}",
+            "parameters": {
+                "shopId": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "metrics": {
+            "method": "GET",
+            "path": "/shops/{shopId}/metrics",
+            "parameters": {
+                "shopId": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        },
+        "dimensions": {
+            "method": "GET",
+            "path": "/shops/{shopId}/dimensions",
+            "parameters": {
+                "shopId": "string"
+            },
+            "auth": {
+                "type": "Bearer",
+                "key": "api_key"
+            },
+            "rate_limit": "60 requests per minute"
+        }
+    }
+}
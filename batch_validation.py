@@ -0,0 +1,263 @@
+"""
+Batch validation over whole training_data exports
+
+Computes the checks made one dict at a time by
+QualityValidator.validate_quality, validate_training_data_regular and
+TrainingDataVerifier.analyze_query_quality for every row of an export at
+once. Rows are held as columns (lists of query/response/systems/...), numeric
+features such as lengths and word counts are NumPy arrays, and every flag
+and score is combined with array operations. Text matching uses the
+compiled PhraseMatcher, and chunks can be fanned out across cores.
+
+Like the scalar checks, a field counts as present when the row has the key,
+even if its value is null. The execution_details (validate_endpoint) and
+applied_guidelines structure checks of validate_training_data_regular are
+included; its guideline id references are not, since they need the
+system_training guidelines rather than the export alone.
+
+Usage:
+    columns = load_export_columns(["training_data_export.jsonl"])
+    flags = validate_columns(columns, workers=8)
+    print(summarize(flags))
+
+    python batch_validation.py training_data_export.jsonl --workers 8 --output flags.npz
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from quality_validator import QualityValidator
+
+COLUMNS = ("id", "tool", "intent", "query", "response", "systems", "workflow",
+           "execution_details", "applied_guidelines")
+PRESENT = "present"  # Per row, the COLUMNS keys the row has
+REQUIRED_FIELDS = ("tool", "intent", "query", "response")  # validate_training_data_regular
+QUALITY_REQUIRED_FIELDS = ("tool", "intent", "query", "response", "systems", "workflow")  # validate_quality
+ENDPOINT_REQUIRED_FIELDS = ("service", "resource", "action", "method", "path")  # validate_endpoint
+VALID_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH")
+GUIDELINE_CATEGORIES = ("general_guidelines", "domain_guidelines", "system_guidelines")
+DEFAULT_CHUNK_SIZE = 50000
+
+_validator: Optional[QualityValidator] = None
+
+def _get_validator() -> QualityValidator:
+    """One validator (and compiled matcher) per process"""
+    global _validator
+    if _validator is None:
+        _validator = QualityValidator()
+    return _validator
+
+def rows_to_columns(rows: Iterable[Dict[str, Any]]) -> Dict[str, List[Any]]:
+    """Turn training_data rows into one list per column, plus which keys each row has"""
+    columns = {name: [] for name in COLUMNS + (PRESENT,)}
+    for row in rows:
+        for name in COLUMNS:
+            columns[name].append(row.get(name))
+        columns[PRESENT].append(frozenset(name for name in COLUMNS if name in row))
+    return columns
+
+def load_export_columns(paths: Sequence[str]) -> Dict[str, List[Any]]:
+    """Load JSON or JSONL exports of training_data into columns"""
+    rows = []
+    for path in paths:
+        with open(path) as f:
+            if path.endswith(".jsonl"):
+                rows.extend(json.loads(line) for line in f if line.strip())
+            else:
+                rows.extend(json.load(f))
+    return rows_to_columns(rows)
+
+def _texts(values: Sequence[Any]) -> List[str]:
+    return [v if isinstance(v, str) else "" for v in values]
+
+def _bool_array(values: Iterable[bool], count: int) -> np.ndarray:
+    return np.fromiter(values, dtype=bool, count=count)
+
+def _int_array(values: Iterable[int], count: int) -> np.ndarray:
+    return np.fromiter(values, dtype=np.int32, count=count)
+
+def _workflow_ok(workflow: Any) -> bool:
+    return isinstance(workflow, list) and all(
+        isinstance(step, dict) and 'action' in step and isinstance(step.get('parameters'), dict)
+        for step in workflow
+    )
+
+def _endpoint_ok(endpoint: Any) -> bool:
+    if not isinstance(endpoint, dict):
+        return False
+    if not all(endpoint.get(field) for field in ENDPOINT_REQUIRED_FIELDS):
+        return False
+    if endpoint["method"] not in VALID_METHODS or not str(endpoint["path"]).startswith("/"):
+        return False
+    return not endpoint.get("parameters") or isinstance(endpoint["parameters"], dict)
+
+def _execution_details_ok(execution_details: Any) -> bool:
+    if not execution_details:
+        return True
+    return isinstance(execution_details, list) and all(map(_endpoint_ok, execution_details))
+
+def _applied_guidelines_ok(applied_guidelines: Any) -> bool:
+    if not applied_guidelines:
+        return True
+    return isinstance(applied_guidelines, dict) and all(
+        isinstance(applied_guidelines.get(category), list) for category in GUIDELINE_CATEGORIES
+    )
+
+def _mentions_all_systems(query: str, systems: Any) -> bool:
+    query_lower = query.lower()
+    return all(str(s).lower() in query_lower for s in (systems or []))
+
+def _validate_chunk(columns: Dict[str, Sequence[Any]]) -> Dict[str, np.ndarray]:
+    """Compute every flag for one chunk of columns"""
+    matcher = _get_validator().matcher
+    queries = _texts(columns["query"])
+    responses = _texts(columns["response"])
+    n = len(responses)
+
+    # Numeric features
+    response_length = _int_array(map(len, responses), n)
+    response_words = _int_array((len(r.split()) for r in responses), n)
+    query_words = _int_array((len(q.split()) for q in queries), n)
+
+    # Phrase flags, one matcher pass per response
+    found = [matcher.scan(r) for r in responses]
+    flag = {category: _bool_array((category in f for f in found), n) for category in matcher.categories}
+    has_technical_terms = flag["technical"]
+    has_external_references = flag["external_reference"]
+    has_step_by_step = flag["step"]
+    has_actionable_steps = has_step_by_step & flag["action"]
+
+    # QualityValidator.calculate_response_parameters
+    points = (
+        (~has_technical_terms).astype(np.int8) + (~has_external_references) + has_step_by_step
+        + flag["example"] + has_actionable_steps
+    )
+    quality_score = np.round(points * 0.2, 1)
+
+    # QualityValidator.validate_quality
+    has_quality_fields = np.ones(n, dtype=bool)
+    for field in QUALITY_REQUIRED_FIELDS:
+        has_quality_fields &= _bool_array((field in present for present in columns[PRESENT]), n)
+    workflow_valid = _bool_array(map(_workflow_ok, columns["workflow"]), n)
+    passes_quality = (
+        has_quality_fields & (response_length >= 50) & ~has_technical_terms
+        & ~has_external_references & has_step_by_step & workflow_valid
+    )
+
+    # validate_training_data_regular required fields
+    missing = {f"missing_{field}": _bool_array((not v for v in columns[field]), n) for field in REQUIRED_FIELDS}
+    has_required_fields = ~np.logical_or.reduce(list(missing.values()))
+    execution_details_valid = _bool_array(map(_execution_details_ok, columns["execution_details"]), n)
+    applied_guidelines_valid = _bool_array(map(_applied_guidelines_ok, columns["applied_guidelines"]), n)
+
+    # TrainingDataVerifier.analyze_query_quality
+    query_length_ok = (query_words >= 5) & (query_words <= 50)
+    mentions_all_systems = _bool_array(map(_mentions_all_systems, queries, columns["systems"]), n)
+    response_complete = response_words > 100
+
+    return {
+        "response_length": response_length,
+        "response_word_count": response_words,
+        "query_word_count": query_words,
+        "has_technical_terms": has_technical_terms,
+        "has_external_references": has_external_references,
+        "has_step_by_step_guidance": has_step_by_step,
+        "has_practical_examples": flag["example"],
+        "has_actionable_steps": has_actionable_steps,
+        "has_error_handling": flag["error"],
+        "is_user_friendly": ~has_technical_terms & ~has_external_references,
+        "quality_score": quality_score,
+        "is_valid_quality_score": points >= 4,
+        "workflow_valid": workflow_valid,
+        "passes_quality_validation": passes_quality,
+        **missing,
+        "has_required_fields": has_required_fields,
+        "execution_details_valid": execution_details_valid,
+        "applied_guidelines_valid": applied_guidelines_valid,
+        "passes_structure_validation": has_required_fields & execution_details_valid & applied_guidelines_valid,
+        "query_length_ok": query_length_ok,
+        "mentions_all_systems": mentions_all_systems,
+        "response_complete": response_complete,
+        "query_quality_score": (
+            query_length_ok.astype(np.int8) + mentions_all_systems + response_complete
+        ).astype(np.int8)
+    }
+
+def validate_columns(columns: Dict[str, Sequence[Any]], workers: int = 1,
+                     chunk_size: int = DEFAULT_CHUNK_SIZE) -> Dict[str, np.ndarray]:
+    """
+    Validate every row of a columnar export.
+
+    Args:
+        columns (dict): Column name -> values, as returned by rows_to_columns; without
+            a "present" column, every supplied column counts as present in every row
+        workers (int): Processes to fan chunks out to (1 = in this process)
+        chunk_size (int): Rows per chunk
+
+    Returns:
+        dict: Flag/feature name -> array with one entry per row
+    """
+    total = len(columns["response"])
+    if not columns.get(PRESENT):
+        # Plain columns: a row has every column that was supplied
+        supplied = frozenset(name for name in COLUMNS if columns.get(name) is not None)
+        columns = dict(columns, **{PRESENT: [supplied] * total})
+    columns = {name: columns.get(name) or [None] * total for name in COLUMNS + (PRESENT,)}
+    if total == 0:
+        return _validate_chunk(columns)
+
+    chunks = [
+        {name: values[start:start + chunk_size] for name, values in columns.items()}
+        for start in range(0, total, chunk_size)
+    ]
+    if workers > 1 and len(chunks) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_validate_chunk, chunks))
+    else:
+        results = [_validate_chunk(chunk) for chunk in chunks]
+
+    return {name: np.concatenate([r[name] for r in results]) for name in results[0]}
+
+def summarize(flags: Dict[str, np.ndarray]) -> Dict[str, Any]:
+    """Counts of every boolean flag plus mean scores"""
+    total = len(flags["quality_score"])
+    summary: Dict[str, Any] = {"total_entries": total}
+    for name, values in flags.items():
+        if values.dtype == bool:
+            summary[name] = int(values.sum())
+    if total:
+        summary["mean_quality_score"] = round(float(flags["quality_score"].mean()), 3)
+        summary["mean_query_quality_score"] = round(float(flags["query_quality_score"].mean()), 3)
+    return summary
+
+def main():
+    parser = argparse.ArgumentParser(description="Validate a whole training_data export in one batch")
+    parser.add_argument("paths", nargs="+", help="JSON/JSONL exports of training_data")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes to fan validation out to")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="Rows per chunk")
+    parser.add_argument("--output", help="Save per-row flags to this .npz file")
+    args = parser.parse_args()
+
+    columns = load_export_columns(args.paths)
+    start = time.perf_counter()
+    flags = validate_columns(columns, workers=args.workers, chunk_size=args.chunk_size)
+    elapsed = time.perf_counter() - start
+
+    summary = summarize(flags)
+    print(json.dumps(summary, indent=2))
+    print(f"Validated {summary['total_entries']} rows in {elapsed:.2f}s "
+          f"({summary['total_entries'] / max(elapsed, 1e-9):.0f} rows/s)")
+
+    if args.output:
+        np.savez_compressed(args.output, ids=np.array([str(i) for i in columns["id"]]), **flags)
+        print(f"Saved per-row flags to {args.output}")
+
+if __name__ == "__main__":
+    main()
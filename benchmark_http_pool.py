@@ -0,0 +1,79 @@
+"""
+Micro-benchmark: per-call overhead of unpooled vs pooled HTTP clients
+
+Starts a local mock of the Together inference endpoint and times N POSTs
+made three ways:
+1. requests.post(...) with no session (new connection per call, as before)
+2. the shared pooled requests.Session from http_client.get_session()
+3. the shared pooled httpx.Client from http_client.get_httpx_client()
+
+The mock server is plain HTTP on localhost, so the numbers only show the
+TCP connection setup saved; against api.together.xyz each unpooled call
+also pays a TLS handshake, so the real saving is larger.
+
+Usage:
+    python benchmark_http_pool.py --calls 500
+"""
+
+import argparse
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import requests
+
+from http_client import get_session, get_httpx_client
+
+RESPONSE_BODY = json.dumps({
+    "output": {"choices": [{"text": "[{\"query\": \"q\", \"response\": \"r\"}]"}]}
+}).encode()
+
+class MockInferenceHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Allow keep-alive
+    disable_nagle_algorithm = True  # Avoid delayed-ACK stalls on reused connections
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(RESPONSE_BODY)))
+        self.end_headers()
+        self.wfile.write(RESPONSE_BODY)
+
+    def log_message(self, format, *args):
+        pass
+
+def time_calls(post, url, calls):
+    payload = {"model": "mock", "prompt": "Say hello!", "max_tokens": 10}
+    start = time.perf_counter()
+    for _ in range(calls):
+        response = post(url, json=payload, timeout=10)
+        response.raise_for_status()
+    return (time.perf_counter() - start) / calls
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pooled vs unpooled HTTP calls")
+    parser.add_argument("--calls", type=int, default=500, help="Number of calls per client")
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), MockInferenceHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/inference"
+
+    try:
+        results = {
+            "requests.post (no session)": time_calls(requests.post, url, args.calls),
+            "pooled requests.Session": time_calls(get_session().post, url, args.calls),
+            "pooled httpx.Client": time_calls(get_httpx_client().post, url, args.calls),
+        }
+    finally:
+        server.shutdown()
+
+    baseline = results["requests.post (no session)"]
+    print(f"{'client':<30} {'ms/call':>10} {'saved':>10}")
+    for name, per_call in results.items():
+        print(f"{name:<30} {per_call * 1000:>10.3f} {(baseline - per_call) * 1000:>9.3f}ms")
+
+if __name__ == "__main__":
+    main()
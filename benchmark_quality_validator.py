@@ -0,0 +1,115 @@
+"""
+Micro-benchmark: per-response cost of QualityValidator flag detection
+
+Times calculate_response_parameters with the old approach (one `in`
+substring scan per technical term, forbidden phrase and marker) against the
+compiled single-pass PhraseMatcher QualityValidator now uses.
+
+Responses are read from JSON/JSONL exports of stored training data (any
+objects with a "response" field) when --input is given, otherwise synthetic
+responses are generated from realistic fragments.
+
+Usage:
+    python benchmark_quality_validator.py --responses 100000
+    python benchmark_quality_validator.py --input training_data_export.jsonl
+"""
+
+import argparse
+import json
+import random
+import time
+
+from quality_validator import QualityValidator
+
+FRAGMENTS = [
+    "First, open your Shopify admin and go to the Orders page.",
+    "Next, filter the list by fulfillment status to find delayed orders.",
+    "For example, you can sort by date to see the oldest unfulfilled orders first.",
+    "Your sales were up 12% compared to last week, driven mostly by repeat customers.",
+    "Follow these steps to send the campaign to your VIP segment.",
+    "If something goes wrong, the order stays in its current state and nothing is charged.",
+    "I've scheduled the meeting with the marketing team for Thursday at 2pm.",
+    "The API token for the webhook integration needs to be refreshed.",
+    "Inventory for the blue hoodie is running low, with 14 units left across both warehouses.",
+    "Like last month, most refunds came from sizing issues on the new collection.",
+    "Do this for each product you want to feature on the homepage.",
+    "Check out the summary below for the top performing channels by ROAS.",
+    "Your top three products this month were the linen shirt, the canvas tote and the summer dress.",
+    "Average order value rose to $84, up from $77 in the previous period.",
+    "Three customers asked about delivery times today, and all three tickets are now resolved.",
+    "The welcome flow converted 4.2% of new subscribers into first-time buyers.",
+    "Once the discount code is live, share it with your newsletter subscribers on Friday morning.",
+    "The Asana task for the product photoshoot is assigned to Maya and due next Tuesday.",
+    "Email open rates dipped slightly on weekends, so weekday sends are performing better.",
+    "You have 23 orders waiting to ship, most of them placed in the last 48 hours.",
+]
+
+def legacy_response_parameters(validator, response):
+    """calculate_response_parameters as it was: one substring scan per phrase"""
+    response_lower = response.lower()
+    has_technical_terms = any(term in response_lower for term in validator.technical_terms)
+    has_external_references = any(phrase in response_lower for phrase in validator.forbidden_phrases)
+    has_step_by_step = 'step' in response_lower or 'first' in response_lower or 'next' in response_lower
+    has_practical_examples = 'example' in response_lower or 'for instance' in response_lower or 'like' in response_lower
+    uses_simple_language = not has_technical_terms and len(response.split()) > 0
+    has_actionable_steps = has_step_by_step and ('do this' in response_lower or 'follow these' in response_lower)
+
+    quality_score = 0.2 * sum([not has_technical_terms, not has_external_references, has_step_by_step,
+                               has_practical_examples, has_actionable_steps])
+    return {
+        "is_user_friendly": not has_technical_terms and not has_external_references,
+        "has_step_by_step_guidance": has_step_by_step,
+        "has_practical_examples": has_practical_examples,
+        "uses_simple_language": uses_simple_language,
+        "has_actionable_steps": has_actionable_steps,
+        "is_self_contained": not has_external_references,
+        "has_external_references": has_external_references,
+        "has_technical_terms": has_technical_terms,
+        "response_length": len(response),
+        "has_error_handling": "error" in response_lower or "if something goes wrong" in response_lower,
+        "quality_score": quality_score,
+        "validation_status": "valid" if quality_score >= 0.8 else "needs_improvement"
+    }
+
+def load_responses(paths):
+    responses = []
+    for path in paths:
+        with open(path) as f:
+            if path.endswith(".jsonl"):
+                rows = [json.loads(line) for line in f if line.strip()]
+            else:
+                rows = json.load(f)
+        responses.extend(row["response"] for row in rows if isinstance(row, dict) and row.get("response"))
+    return responses
+
+def synthetic_responses(count, seed=0):
+    rng = random.Random(seed)
+    return [" ".join(rng.sample(FRAGMENTS, rng.randint(3, 8))) for _ in range(count)]
+
+def time_per_response(fn, responses):
+    start = time.perf_counter()
+    for response in responses:
+        fn(response)
+    return (time.perf_counter() - start) / len(responses)
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark QualityValidator flag detection")
+    parser.add_argument("--responses", type=int, default=100000, help="Number of synthetic responses")
+    parser.add_argument("--input", nargs="+", help="JSON/JSONL files of stored examples to validate instead")
+    args = parser.parse_args()
+
+    responses = load_responses(args.input) if args.input else synthetic_responses(args.responses)
+    validator = QualityValidator()
+
+    legacy = time_per_response(lambda r: legacy_response_parameters(validator, r), responses)
+    compiled = time_per_response(validator.calculate_response_parameters, responses)
+
+    print(f"Validated {len(responses)} responses "
+          f"(avg {sum(map(len, responses)) / len(responses):.0f} chars)")
+    print(f"{'method':<28} {'us/response':>12}")
+    print(f"{'per-phrase substring scans':<28} {legacy * 1e6:>12.2f}")
+    print(f"{'compiled PhraseMatcher':<28} {compiled * 1e6:>12.2f}")
+    print(f"Speedup: {legacy / compiled:.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ from datetime import datetime
 import openai
 import logging
 import argparse
+from rate_control import get_rate_limiter
+from http_client import get_session, get_httpx_client
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Set up logging
@@ -22,6 +24,10 @@ logging.basicConfig(
 
 # Configure OpenAI API - fetch from environment variable
 openai.api_key = os.getenv("OPENAI_API_KEY")
+openai.http_client = get_httpx_client()  # Reuse pooled keep-alive connections
+
+# Shared adaptive rate limiter for generation calls (learns the rate from 429s)
+LLM_LIMITER = get_rate_limiter("openai", "gpt-4o")
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
@@ -193,7 +199,8 @@ def generate_cross_service_queries(scenario_obj, count, batch_size=5):
             system_prompt = create_prompt(batch_count)
             
             # Using GPT-4o for complex cross-service scenarios
-            response = openai.chat.completions.create(
+            response = LLM_LIMITER.call(
+                openai.chat.completions.with_raw_response.create,
                 model="gpt-4o",  # Using GPT-4o for more sophisticated cross-service understanding
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -263,10 +270,6 @@ def generate_cross_service_queries(scenario_obj, count, batch_size=5):
             try:
                 batch_items = process_batch(batch_idx)
                 all_items.extend(batch_items)
-                # Sleep between batches to avoid rate limiting
-                if batch_idx < num_batches - 1:
-                    sleep_time = 2.0 + random.random()  # 2-3 second sleep (longer for GPT-4o)
-                    time.sleep(sleep_time)
                 break  # Success, exit retry loop
             except Exception as e:
                 if retry < max_retries - 1:
@@ -348,7 +351,7 @@ def insert_cross_service_data(scenario_obj, items, batch_id=None):
         for retry in range(max_retries):
             try:
                 # Use our API endpoint instead of direct Supabase access
-                r = requests.post("http://localhost:5000/api/training", json=payload, timeout=10)
+                r = get_session().post("http://localhost:5000/api/training", json=payload, timeout=10)
                 
                 if r.status_code in [200, 201]:
                     success += 1
@@ -386,14 +389,14 @@ def save_to_json(all_data):
     print(f"\n📝 Saved backup to {filename}")
     return filename
 
-def run_cross_service_generation(examples_per_scenario=5, batch_size=5, sleep_time=3, dry_run=False, specific_scenarios=None):
+def run_cross_service_generation(examples_per_scenario=5, batch_size=5, sleep_time=0, dry_run=False, specific_scenarios=None):
     """
     Run cross-service training data generation
     
     Args:
         examples_per_scenario (int): Number of examples to generate per scenario
         batch_size (int): Size of batches for generation
-        sleep_time (int): Sleep time between scenarios
+        sleep_time (int): Extra sleep time between scenarios (pacing is handled by LLM_LIMITER)
         dry_run (bool): If True, don't insert into database
         specific_scenarios (list): Optional list of specific scenario indexes to run
         
@@ -441,8 +444,8 @@ def run_cross_service_generation(examples_per_scenario=5, batch_size=5, sleep_ti
             
             total_generated += len(items)
             
-            # Sleep between scenarios to avoid rate limiting
-            if idx < len(scenarios_to_process) - 1:
+            # Optional extra pause between scenarios
+            if sleep_time > 0 and idx < len(scenarios_to_process) - 1:
                 print(f"😴 Sleeping for {sleep_time} seconds before next scenario...")
                 time.sleep(sleep_time)
                 
@@ -456,6 +459,7 @@ def run_cross_service_generation(examples_per_scenario=5, batch_size=5, sleep_ti
     print(f"\n✅ Cross-service training data generation complete!")
     print(f"📊 Generated {total_generated} examples across {len(scenarios_to_process)} scenarios")
     print(f"📝 Data saved to {json_path}")
+    print(f"⏱️ Rate: {LLM_LIMITER.format_stats()}")
     
     return json_path
 
@@ -471,7 +475,7 @@ if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Generate cross-service training data for MCP")
     parser.add_argument('--count', type=int, default=5, help='Number of examples per scenario')
     parser.add_argument('--batch', type=int, default=5, help='Batch size for generation')
-    parser.add_argument('--sleep', type=int, default=3, help='Sleep time between scenarios')
+    parser.add_argument('--sleep', type=int, default=0, help='Extra sleep time between scenarios (rate is adapted automatically)')
     parser.add_argument('--dry-run', action='store_true', help='Run without inserting into database')
     parser.add_argument('--scenarios', type=str, help='Comma-separated list of scenario indexes to run (0-based)')
     parser.add_argument('--list-scenarios', action='store_true', help='List all available scenarios and exit')
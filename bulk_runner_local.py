@@ -6,14 +6,20 @@ import random
 import uuid
 from datetime import datetime
 from openai import OpenAI
+from rate_control import get_rate_limiter
+from http_client import get_httpx_client
 
 # Configure Together AI API
 TOGETHER_API_KEY = os.getenv("TOGETHER_API_KEY") or "74419c1e494c4265e1e519411ecaed493f1dd0cd1fed16e2c8d00035870f5b51"
 client = OpenAI(
     api_key=TOGETHER_API_KEY,
-    base_url="https://api.together.xyz/v1"
+    base_url="https://api.together.xyz/v1",
+    http_client=get_httpx_client()  # Reuse pooled keep-alive connections
 )
 
+# Shared adaptive rate limiter for generation calls (learns the rate from 429s)
+LLM_LIMITER = get_rate_limiter("together", "meta-llama/Llama-3.3-70B-Instruct-Turbo")
+
 # Directory for local storage
 LOCAL_STORAGE_DIR = "training_data_local"
 os.makedirs(LOCAL_STORAGE_DIR, exist_ok=True)
@@ -76,7 +82,8 @@ def generate_queries(tool, intent, count):
         """
         
         # Call DeepSeek via Together AI to generate the queries and responses
-        response = client.chat.completions.create(
+        response = LLM_LIMITER.call(
+            client.chat.completions.with_raw_response.create,
             model="meta-llama/Llama-3.3-70B-Instruct-Turbo",  # Using Meta's Llama 3.3 70B Instruct Turbo via Together AI
             messages=[
                 {"role": "system", "content": system_prompt},
@@ -173,7 +180,7 @@ def save_to_json(all_data):
     return filename
 
 # Main runner
-def run_bulk(count_per_intent=10, sleep_time=2):
+def run_bulk(count_per_intent=10, sleep_time=0):
     total_saved = 0
     all_data = []
     
@@ -214,7 +221,8 @@ def run_bulk(count_per_intent=10, sleep_time=2):
                 if len(items) > 0:
                     print(f"📝 Sample: \"{items[0]['query']}\" → \"{items[0]['response'][:60]}...\"")
                 
-                time.sleep(sleep_time)
+                if sleep_time > 0:
+                    time.sleep(sleep_time)
     
     filename = save_to_json(all_data)
     
@@ -225,6 +233,7 @@ def run_bulk(count_per_intent=10, sleep_time=2):
     print(f"• Total saved locally: {total_saved}")
     print(f"• Backup saved to: {filename}")
     print(f"• Data directory: {LOCAL_STORAGE_DIR}")
+    print(f"• Rate: {LLM_LIMITER.format_stats()}")
     print(f"{'=' * 60}")
     
     return filename
@@ -8,6 +8,9 @@ from datetime import datetime
 import openai
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
+from rate_control import get_rate_limiter
+from http_client import get_session, get_httpx_client
+from generation_spool import GenerationSpool
 
 # Set up logging
 logging.basicConfig(
@@ -21,9 +24,19 @@ logging.basicConfig(
 
 # Configure OpenAI API - fetch from environment variable
 openai.api_key = os.getenv("OPENAI_API_KEY")
+openai.http_client = get_httpx_client()  # Reuse pooled keep-alive connections
 SUPABASE_URL = os.getenv("SUPABASE_URL")
 SUPABASE_KEY = os.getenv("SUPABASE_SERVICE_ROLE_KEY")
 
+# Shared adaptive rate limiter for generation calls (learns the rate from 429s)
+LLM_LIMITER = get_rate_limiter("openai", "gpt-3.5-turbo")
+
+# Training data ingestion API
+TRAINING_API_URL = "http://localhost:5000/api/training"
+TRAINING_BATCH_API_URL = "http://localhost:5000/api/training/batch"
+INSERT_CHUNK_SIZE = 50  # Rows per batch insert request
+MAX_TRAINING_BATCH_SIZE = 1000  # Server-side limit of /api/training/batch (server/routes.ts)
+
 # Define all tool intents combinations we want to generate data for
 # Full version (commented out for quick demo)
 """
@@ -242,7 +255,8 @@ def generate_queries(tool, intent, count, batch_size=50):
             system_prompt = create_prompt(batch_count)
             
             # Call GPT-3.5-turbo instead of GPT-4o (cheaper for mass generation)
-            response = openai.chat.completions.create(
+            response = LLM_LIMITER.call(
+                openai.chat.completions.with_raw_response.create,
                 model="gpt-3.5-turbo",  # Using 3.5 for cost efficiency with large-scale generation
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -306,10 +320,6 @@ def generate_queries(tool, intent, count, batch_size=50):
             try:
                 batch_items = process_batch(batch_idx)
                 all_items.extend(batch_items)
-                # Sleep between batches to avoid rate limiting
-                if batch_idx < num_batches - 1:
-                    sleep_time = 1.0 + random.random()  # 1-2 second sleep
-                    time.sleep(sleep_time)
                 break  # Success, exit retry loop
             except Exception as e:
                 if retry < max_retries - 1:
@@ -339,10 +349,120 @@ def generate_queries(tool, intent, count, batch_size=50):
     logging.info(f"Completed generation of {len(all_items)} items for {tool}/{intent}")
     return all_items
 
-def insert_to_supabase(tool, intent, items, batch_id=None):
+def build_training_payload(tool, intent, item, batch_id=None):
+    """Build the /api/training payload for one generated item"""
+    return {
+        "tool": tool,
+        "intent": intent,
+        "query": item["query"],
+        "response": item["response"],
+        "metadata": {
+            "generation_date": datetime.now().isoformat(),
+            "model": "gpt-3.5-turbo",  # Using 3.5 for large-scale generation
+            "batch_id": batch_id or f"{tool}_{intent}_{datetime.now().strftime('%Y%m%d%H%M%S')}",
+            "complexity": "auto_generated"
+        }
+    }
+
+def training_row_id(batch_id, index):
+    """Stable id for the index-th row of a batch, so resent rows are recognized by the server"""
+    return str(uuid.uuid5(uuid.NAMESPACE_URL, f"training_data/{batch_id}/{index}"))
+
+def post_training_chunk(payloads, max_retries=3):
+    """
+    POST a chunk of rows to the batch ingestion endpoint
+    
+    Only connection errors, 429 and 5xx responses are retried. Other 4xx
+    responses won't succeed on a resend, and after a read timeout the server
+    may still be inserting the chunk, so both fail the chunk straight away.
+    Payloads carry their own ids and the server skips ids it already has, so
+    a retried or resumed chunk doesn't duplicate rows.
+    
+    Args:
+        payloads (list): Training data payloads
+        max_retries (int): Attempts before giving up on the whole chunk
+        
+    Returns:
+        list: Per-row results ({"index", "status", "id"/"error"}), indexed like payloads
+    """
+    error = f"Chunk failed after {max_retries} attempts"
+    for retry in range(max_retries):
+        wait_time = (2 ** retry) + random.random()  # Exponential backoff with jitter
+        try:
+            r = get_session().post(TRAINING_BATCH_API_URL, json={"items": payloads}, timeout=60)
+        except requests.exceptions.ConnectionError as e:
+            logging.error(f"Connection error during batch insertion: {str(e)}")
+        except Exception as e:
+            logging.error(f"Exception during batch insertion, not retrying: {str(e)}")
+            error = str(e)
+            break
+        else:
+            if r.status_code in [200, 201, 207]:
+                return r.json()["results"]
+            logging.warning(f"Batch API error: {r.status_code} - {r.text[:100]}...")
+            if r.status_code != 429 and r.status_code < 500:
+                error = f"Batch API error {r.status_code}: {r.text[:200]}"
+                break
+            retry_after = r.headers.get("Retry-After", "")
+            if r.status_code == 429 and retry_after.isdigit():
+                wait_time = float(retry_after)
+        if retry < max_retries - 1:
+            logging.info(f"Retrying chunk in {wait_time:.1f}s (attempt {retry+1}/{max_retries})")
+            time.sleep(wait_time)
+    
+    return [{"index": idx, "status": "failed", "error": error}
+            for idx in range(len(payloads))]
+
+def insert_to_supabase(tool, intent, items, batch_id=None, chunk_size=None):
     """
     Insert items into Supabase database through the API
     
+    Args:
+        tool (str): The tool name
+        intent (str): The intent
+        items (list): List of items to insert
+        batch_id (str): Optional batch identifier for logging
+        chunk_size (int): Rows per batch request (defaults to INSERT_CHUNK_SIZE,
+            at most MAX_TRAINING_BATCH_SIZE); 1 falls back to one request per row
+        
+    Returns:
+        int: Number of successfully inserted items
+    """
+    chunk_size = chunk_size or INSERT_CHUNK_SIZE
+    if chunk_size > MAX_TRAINING_BATCH_SIZE:
+        logging.warning(f"Chunk size {chunk_size} exceeds the batch API limit; using {MAX_TRAINING_BATCH_SIZE}")
+        chunk_size = MAX_TRAINING_BATCH_SIZE
+    if chunk_size <= 1:
+        return insert_items_individually(tool, intent, items, batch_id)
+    
+    success = 0
+    errors = 0
+    batch_info = f"batch {batch_id}" if batch_id else ""
+    
+    logging.info(f"Inserting {len(items)} items for {tool}/{intent} {batch_info} in chunks of {chunk_size}")
+    
+    for start in range(0, len(items), chunk_size):
+        chunk = items[start:start + chunk_size]
+        payloads = [build_training_payload(tool, intent, item, batch_id) for item in chunk]
+        for offset, payload in enumerate(payloads):
+            payload["id"] = training_row_id(payload["metadata"]["batch_id"], start + offset)
+        
+        for result in post_training_chunk(payloads):
+            if result["status"] == "inserted":
+                success += 1
+            else:
+                errors += 1
+                logging.error(f"Failed to insert item {start + result['index']}: {result.get('error')}")
+        
+        logging.info(f"Insertion progress: {min(start + chunk_size, len(items))}/{len(items)} for {tool}/{intent}")
+    
+    logging.info(f"Insertion complete: {success} successful, {errors} failed for {tool}/{intent}")
+    return success
+
+def insert_items_individually(tool, intent, items, batch_id=None):
+    """
+    Insert items one request at a time through the single-row API
+    
     Args:
         tool (str): The tool name
         intent (str): The intent
@@ -359,25 +479,14 @@ def insert_to_supabase(tool, intent, items, batch_id=None):
     logging.info(f"Inserting {len(items)} items for {tool}/{intent} {batch_info}")
     
     for idx, item in enumerate(items):
-        payload = {
-            "tool": tool,
-            "intent": intent,
-            "query": item["query"],
-            "response": item["response"],
-            "metadata": {
-                "generation_date": datetime.now().isoformat(),
-                "model": "gpt-3.5-turbo",  # Using 3.5 for large-scale generation
-                "batch_id": batch_id or f"{tool}_{intent}_{datetime.now().strftime('%Y%m%d%H%M%S')}",
-                "complexity": "auto_generated"
-            }
-        }
+        payload = build_training_payload(tool, intent, item, batch_id)
         
         # Use exponential backoff for API requests
         max_retries = 3
         for retry in range(max_retries):
             try:
                 # Use our API endpoint instead of direct Supabase access
-                r = requests.post("http://localhost:5000/api/training", json=payload, timeout=10)
+                r = get_session().post(TRAINING_API_URL, json=payload, timeout=10)
                 
                 if r.status_code in [200, 201]:
                     success += 1
@@ -453,7 +562,8 @@ def calculate_distribution(target_count, tools_intents):
     return distribution
 
 # Main runner with scaling capabilities
-def run_bulk(count_per_intent=10, total_target=None, batch_size=50, sleep_time=2, dry_run=False):
+def run_bulk(count_per_intent=10, total_target=None, batch_size=50, sleep_time=0, dry_run=False,
+             insert_chunk_size=INSERT_CHUNK_SIZE, resume=False):
     """
     Run the bulk generation process
     
@@ -461,8 +571,11 @@ def run_bulk(count_per_intent=10, total_target=None, batch_size=50, sleep_time=2
         count_per_intent (int): Number of examples to generate per intent if total_target is None
         total_target (int): Target total number of examples to generate across all intents
         batch_size (int): Number of examples to generate in a single API call
-        sleep_time (float): Time to sleep between batches
+        sleep_time (float): Extra time to sleep between intents (pacing is handled by LLM_LIMITER)
         dry_run (bool): If True, don't insert into database
+        insert_chunk_size (int): Rows per batch insert request (1 = one request per row)
+        resume (bool): Continue the last spooled run, skipping tool-intents already
+            generated and inserting any that were generated but not inserted
         
     Returns:
         str: Path to the saved JSON file
@@ -470,6 +583,8 @@ def run_bulk(count_per_intent=10, total_target=None, batch_size=50, sleep_time=2
     start_time = datetime.now()
     total_inserted = 0
     all_data = []
+    spool = GenerationSpool.open("bulk_runner_with_log", resume=resume)
+    logging.info(f"Spooling generated batches to {spool.path} (run {spool.run_id})")
     
     # Set up distribution of examples
     if total_target is not None:
@@ -505,33 +620,49 @@ def run_bulk(count_per_intent=10, total_target=None, batch_size=50, sleep_time=2
     
     # Process tools and intents
     for (tool, intent), count in distribution.items():
-        batch_id = f"{tool}_{intent}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        work_key = f"{tool}/{intent}"
         logging.info(f"\n📊 Processing: {tool} - {intent} ({count} examples)")
         print(f"\n📊 Tool: {tool} - {intent}")
         print(f"{'=' * 40}")
         
-        # Generate queries in batches
-        items = generate_queries(tool, intent, count, batch_size)
+        records = spool.get_rows(work_key, 0)
+        if records is not None:
+            print(f"↺ Reusing {len(records)} spooled examples")
+        else:
+            batch_id = f"{tool}_{intent}_{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            
+            # Generate queries in batches
+            items = generate_queries(tool, intent, count, batch_size)
+            records = [{
+                "tool": tool,
+                "intent": intent,
+                "query": item["query"],
+                "response": item["response"],
+                "metadata": {
+                    "generation_date": datetime.now().isoformat(),
+                    "model": "gpt-3.5-turbo",
+                    "batch_id": batch_id,
+                    "complexity": "auto_generated"
+                }
+            } for item in items]
+            if records:
+                spool.record_generated(work_key, 0, records)
         
-        if items:
-            # Add to the all_data collection with proper metadata
-            for item in items:
-                all_data.append({
-                    "tool": tool,
-                    "intent": intent,
-                    "query": item["query"],
-                    "response": item["response"],
-                    "metadata": {
-                        "generation_date": datetime.now().isoformat(),
-                        "model": "gpt-3.5-turbo",
-                        "batch_id": batch_id,
-                        "complexity": "auto_generated"
-                    }
-                })
+        if records:
+            items = [{"query": r["query"], "response": r["response"]} for r in records]
+            batch_id = records[0]["metadata"]["batch_id"]
+            all_data.extend(records)
             
             # Insert into database if not dry run
-            if not dry_run:
-                inserted = insert_to_supabase(tool, intent, items, batch_id)
+            if not dry_run and spool.is_inserted(work_key, 0):
+                print(f"✓ Already inserted in a previous run")
+            elif not dry_run:
+                inserted = insert_to_supabase(tool, intent, items, batch_id, chunk_size=insert_chunk_size)
+                # Only a fully written batch counts; otherwise --resume sends it again
+                if inserted == len(items):
+                    spool.mark_inserted(work_key, 0, inserted)
+                else:
+                    logging.warning(f"Batch {batch_id} only inserted {inserted}/{len(items)} records; left pending in the spool")
                 total_inserted += inserted
                 print(f"✅ Inserted {inserted}/{len(items)} records")
             else:
@@ -552,6 +683,8 @@ def run_bulk(count_per_intent=10, total_target=None, batch_size=50, sleep_time=2
     
     # Final JSON backup
     filename = save_to_json(all_data)
+    spool_summary = spool.summary()
+    spool.close()
     
     # Calculate time taken
     end_time = datetime.now()
@@ -566,7 +699,9 @@ def run_bulk(count_per_intent=10, total_target=None, batch_size=50, sleep_time=2
     if not dry_run:
         print(f"• Total inserted into database: {total_inserted}")
     print(f"• Backup saved to: {filename}")
+    print(f"• Spool: {spool_summary['batches']} batches, {spool_summary['inserted_batches']} inserted (run {spool.run_id})")
     print(f"• Time taken: {int(hours)}h {int(minutes)}m {int(seconds)}s")
+    print(f"• Rate: {LLM_LIMITER.format_stats()}")
     print(f"{'=' * 60}")
     
     logging.info(f"\n{'=' * 60}")
@@ -597,10 +732,14 @@ if __name__ == "__main__":
     
     parser.add_argument("--batch-size", type=int, default=50,
                         help="Number of examples to generate in a single API call")
-    parser.add_argument("--sleep", type=float, default=1.0,
-                        help="Sleep time between batches in seconds")
+    parser.add_argument("--sleep", type=float, default=0,
+                        help="Extra sleep time between intents in seconds (rate is adapted automatically)")
+    parser.add_argument("--insert-chunk-size", type=int, default=INSERT_CHUNK_SIZE,
+                        help="Rows per batch insert request (1 = one request per row)")
     parser.add_argument("--tools", nargs="+", 
                         help="Only generate for specific tools (space-separated)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume the last run from the generation spool, skipping completed tool-intents")
     parser.add_argument("--live", action="store_true", 
                         help="Run in live mode (will insert into database)")
     parser.add_argument("--quick-test", action="store_true", 
@@ -680,7 +819,9 @@ if __name__ == "__main__":
     # Run the generator
     if args.total:
         # Run with total target distribution
-        run_bulk(total_target=args.total, batch_size=args.batch_size, sleep_time=args.sleep, dry_run=dry_run)
+        run_bulk(total_target=args.total, batch_size=args.batch_size, sleep_time=args.sleep, dry_run=dry_run,
+                 insert_chunk_size=args.insert_chunk_size, resume=args.resume)
     else:
         # Run with fixed per-intent count
-        run_bulk(count_per_intent=count_per_intent, batch_size=args.batch_size, sleep_time=args.sleep, dry_run=dry_run)
\ No newline at end of file
+        run_bulk(count_per_intent=count_per_intent, batch_size=args.batch_size, sleep_time=args.sleep, dry_run=dry_run,
+                 insert_chunk_size=args.insert_chunk_size, resume=args.resume)
\ No newline at end of file
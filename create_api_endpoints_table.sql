@@ -10,6 +10,7 @@ CREATE TABLE IF NOT EXISTS public.api_endpoints (
     auth_type TEXT NOT NULL,
     auth_key TEXT NOT NULL,
     rate_limit TEXT NOT NULL,
+    spec_hash TEXT,
     created_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
     UNIQUE(service, resource, action)
@@ -45,4 +46,5 @@ COMMENT ON COLUMN public.api_endpoints.path IS 'The API endpoint path';
 COMMENT ON COLUMN public.api_endpoints.parameters IS 'Required parameters for the endpoint';
 COMMENT ON COLUMN public.api_endpoints.auth_type IS 'The type of authentication required';
 COMMENT ON COLUMN public.api_endpoints.auth_key IS 'The key used for authentication';
-COMMENT ON COLUMN public.api_endpoints.rate_limit IS 'The rate limit for the endpoint'; 
\ No newline at end of file
+COMMENT ON COLUMN public.api_endpoints.rate_limit IS 'The rate limit for the endpoint'; 
+COMMENT ON COLUMN public.api_endpoints.spec_hash IS 'Hash of the endpoint spec last synced from api_endpoints.py (see endpoint_sync.py)';
\ No newline at end of file
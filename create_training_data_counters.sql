@@ -0,0 +1,130 @@
+-- Create training_data_counters table: row counts of training_data kept up to date by triggers,
+-- so monitoring reads a handful of rows instead of scanning training_data
+CREATE TABLE IF NOT EXISTS public.training_data_counters (
+    dimension TEXT NOT NULL,  -- 'total', 'tool' or 'intent'
+    value TEXT NOT NULL,      -- tool or intent name ('' for the total)
+    count BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP WITH TIME ZONE DEFAULT NOW(),
+    PRIMARY KEY (dimension, value)
+);
+
+-- Index used by the monitor's created_at/id watermark polling
+CREATE INDEX IF NOT EXISTS idx_training_data_created_at_id ON public.training_data (created_at, id);
+
+-- Contention trade-off: every statement that inserts or deletes training_data
+-- rows updates the single ('total', '') counter row, plus its tools' and
+-- intents' rows, inside the writing transaction. Concurrent writers (parallel
+-- generators, /training/batch) therefore serialize on those rows until they
+-- commit. That is cheap for the batched, statement-level inserts used here,
+-- but it would throttle many small concurrent transactions. Every upsert
+-- below sorts its rows by (dimension, value), so all writers lock counter
+-- rows in the same order and wait on each other instead of deadlocking.
+
+-- Count rows added by a statement (statement-level, so bulk inserts update each counter once)
+CREATE OR REPLACE FUNCTION public.add_training_data_counters()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO public.training_data_counters AS c (dimension, value, count)
+    SELECT dimension, value, count FROM (
+        SELECT 'total' AS dimension, '' AS value, COUNT(*) AS count FROM new_rows HAVING COUNT(*) > 0
+        UNION ALL
+        SELECT 'tool', COALESCE(tool, ''), COUNT(*) FROM new_rows GROUP BY COALESCE(tool, '')
+        UNION ALL
+        SELECT 'intent', COALESCE(intent, ''), COUNT(*) FROM new_rows GROUP BY COALESCE(intent, '')
+    ) AS delta
+    ORDER BY dimension, value
+    ON CONFLICT (dimension, value) DO UPDATE
+        SET count = c.count + EXCLUDED.count,
+            updated_at = NOW();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Uncount rows removed by a statement
+CREATE OR REPLACE FUNCTION public.subtract_training_data_counters()
+RETURNS TRIGGER AS $$
+BEGIN
+    INSERT INTO public.training_data_counters AS c (dimension, value, count)
+    SELECT dimension, value, count FROM (
+        SELECT 'total' AS dimension, '' AS value, -COUNT(*) AS count FROM old_rows HAVING COUNT(*) > 0
+        UNION ALL
+        SELECT 'tool', COALESCE(tool, ''), -COUNT(*) FROM old_rows GROUP BY COALESCE(tool, '')
+        UNION ALL
+        SELECT 'intent', COALESCE(intent, ''), -COUNT(*) FROM old_rows GROUP BY COALESCE(intent, '')
+    ) AS delta
+    ORDER BY dimension, value
+    ON CONFLICT (dimension, value) DO UPDATE
+        SET count = c.count + EXCLUDED.count,
+            updated_at = NOW();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Move counts for rows whose tool or intent changed in an UPDATE
+CREATE OR REPLACE FUNCTION public.move_training_data_counters()
+RETURNS TRIGGER AS $$
+BEGIN
+    WITH moved AS (
+        SELECT o.tool AS old_tool, o.intent AS old_intent, n.tool AS new_tool, n.intent AS new_intent
+        FROM old_rows o
+        JOIN new_rows n ON n.id = o.id
+        WHERE o.tool IS DISTINCT FROM n.tool OR o.intent IS DISTINCT FROM n.intent
+    ),
+    delta AS (
+        SELECT 'tool' AS dimension, COALESCE(old_tool, '') AS value, -1 AS count FROM moved
+        UNION ALL
+        SELECT 'tool', COALESCE(new_tool, ''), 1 FROM moved
+        UNION ALL
+        SELECT 'intent', COALESCE(old_intent, ''), -1 FROM moved
+        UNION ALL
+        SELECT 'intent', COALESCE(new_intent, ''), 1 FROM moved
+    )
+    INSERT INTO public.training_data_counters AS c (dimension, value, count)
+    SELECT dimension, value, SUM(count) FROM delta GROUP BY dimension, value HAVING SUM(count) <> 0
+    ORDER BY dimension, value
+    ON CONFLICT (dimension, value) DO UPDATE
+        SET count = c.count + EXCLUDED.count,
+            updated_at = NOW();
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Triggers (transition tables cannot be combined with UPDATE OF column lists,
+-- so the update trigger filters unchanged rows itself)
+DROP TRIGGER IF EXISTS training_data_counters_insert ON public.training_data;
+CREATE TRIGGER training_data_counters_insert
+    AFTER INSERT ON public.training_data
+    REFERENCING NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.add_training_data_counters();
+
+DROP TRIGGER IF EXISTS training_data_counters_update ON public.training_data;
+CREATE TRIGGER training_data_counters_update
+    AFTER UPDATE ON public.training_data
+    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.move_training_data_counters();
+
+DROP TRIGGER IF EXISTS training_data_counters_delete ON public.training_data;
+CREATE TRIGGER training_data_counters_delete
+    AFTER DELETE ON public.training_data
+    REFERENCING OLD TABLE AS old_rows
+    FOR EACH STATEMENT
+    EXECUTE FUNCTION public.subtract_training_data_counters();
+
+-- Backfill from the current contents (rerun after TRUNCATE, which the triggers don't see)
+BEGIN;
+LOCK TABLE public.training_data IN SHARE MODE;
+DELETE FROM public.training_data_counters;
+INSERT INTO public.training_data_counters (dimension, value, count)
+SELECT 'total', '', COUNT(*) FROM public.training_data
+UNION ALL
+SELECT 'tool', COALESCE(tool, ''), COUNT(*) FROM public.training_data GROUP BY COALESCE(tool, '')
+UNION ALL
+SELECT 'intent', COALESCE(intent, ''), COUNT(*) FROM public.training_data GROUP BY COALESCE(intent, '');
+COMMIT;
+
+-- Comments for documentation
+COMMENT ON TABLE public.training_data_counters IS 'Trigger-maintained training_data row counts (total, per tool, per intent)';
+COMMENT ON COLUMN public.training_data_counters.dimension IS 'What is counted: total, tool or intent';
+COMMENT ON COLUMN public.training_data_counters.value IS 'Tool or intent name; empty for the total';
@@ -0,0 +1,38 @@
+-- Create function returning the training data statistics used by verify_training_data.py
+-- in a single aggregation, so clients receive only the aggregate numbers
+CREATE OR REPLACE FUNCTION public.get_training_stats()
+RETURNS JSONB AS $$
+    WITH base AS MATERIALIZED (
+        SELECT query, systems, metadata, workflow
+        FROM public.training_data
+    ),
+    totals AS (
+        SELECT
+            COUNT(*) AS total_examples,
+            COUNT(DISTINCT query) AS unique_queries,
+            COALESCE(ROUND(AVG(COALESCE(cardinality(workflow), 0))::numeric, 2), 0) AS average_workflow_length
+        FROM base
+    ),
+    systems_count AS (
+        SELECT system, COUNT(*) AS count
+        FROM base, unnest(base.systems) AS system
+        GROUP BY system
+    ),
+    scenarios_count AS (
+        SELECT metadata->>'scenario' AS scenario, COUNT(*) AS count
+        FROM base
+        WHERE COALESCE(metadata->>'scenario', '') <> ''
+        GROUP BY metadata->>'scenario'
+    )
+    SELECT jsonb_build_object(
+        'total_examples', totals.total_examples,
+        'unique_queries', totals.unique_queries,
+        'average_workflow_length', totals.average_workflow_length,
+        'systems_distribution', COALESCE((SELECT jsonb_object_agg(system, count) FROM systems_count), '{}'::jsonb),
+        'scenarios_distribution', COALESCE((SELECT jsonb_object_agg(scenario, count) FROM scenarios_count), '{}'::jsonb)
+    )
+    FROM totals;
+$$ LANGUAGE sql STABLE;
+
+-- Comments for documentation
+COMMENT ON FUNCTION public.get_training_stats() IS 'Total/unique counts, systems and scenarios distributions and average workflow length of training_data in one scan';
@@ -0,0 +1,145 @@
+"""
+Process-local catalog of the api_endpoints table
+
+Resolving endpoints for a tool/intent used to query api_endpoints and then
+scan every endpoint against every intent keyword on each call. The catalog
+loads the whole table once (paginated), groups it by service, and keeps an
+inverted (service, keyword) -> endpoints index plus a memo of resolved
+tool/intent pairs, so repeat lookups are dictionary hits with no round-trip.
+
+Freshness: after `ttl_seconds` the catalog asks the table for its version
+(row count + latest updated_at) and only reloads when that has changed.
+
+Usage:
+    catalog = get_endpoint_catalog(supabase)
+    endpoints = catalog.endpoints_for("Shopify", "Check Order Status")
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Dict, FrozenSet, List, Optional, Tuple
+
+ENDPOINT_CATALOG_TTL_SECONDS = float(os.getenv("ENDPOINT_CATALOG_TTL_SECONDS", "300"))
+PAGE_SIZE = 1000
+
+class EndpointCatalog:
+    """
+    Cached, indexed view of api_endpoints.
+
+    Args:
+        supabase: Supabase client used to load the table
+        ttl_seconds (float): How long to trust the loaded catalog before checking its version
+        table (str): Table holding the endpoint definitions
+    """
+
+    def __init__(self, supabase, ttl_seconds: float = ENDPOINT_CATALOG_TTL_SECONDS, table: str = "api_endpoints"):
+        self.supabase = supabase
+        self.ttl_seconds = ttl_seconds
+        self.table = table
+        self._lock = threading.Lock()
+        self._version: Optional[Tuple[Any, Any]] = None
+        self._checked_at = float("-inf")
+        self._endpoints_by_service: Dict[str, List[Dict[str, Any]]] = {}
+        self._keyword_index: Dict[Tuple[str, str], FrozenSet[int]] = {}
+        self._resolved: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self.stats = {"loads": 0, "version_checks": 0, "hits": 0, "misses": 0}
+
+    def _fetch_version(self) -> Tuple[Any, Any]:
+        result = (
+            self.supabase.table(self.table)
+            .select("updated_at", count="exact")
+            .order("updated_at", desc=True)
+            .limit(1)
+            .execute()
+        )
+        return result.count, (result.data[0].get("updated_at") if result.data else None)
+
+    def _load(self):
+        rows = []
+        start = 0
+        while True:
+            page = (
+                self.supabase.table(self.table)
+                .select("*")
+                .order("id")
+                .range(start, start + PAGE_SIZE - 1)
+                .execute()
+                .data
+            ) or []
+            rows.extend(page)
+            if len(page) < PAGE_SIZE:
+                break
+            start += PAGE_SIZE
+
+        endpoints_by_service: Dict[str, List[Dict[str, Any]]] = {}
+        for row in rows:
+            endpoints_by_service.setdefault(row.get("service"), []).append(row)
+        self._endpoints_by_service = endpoints_by_service
+        self._keyword_index = {}
+        self._resolved = {}
+        self.stats["loads"] += 1
+        logging.info(f"Loaded {len(rows)} endpoints for {len(endpoints_by_service)} services into the catalog")
+
+    def _ensure_fresh(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.ttl_seconds:
+            return
+        self.stats["version_checks"] += 1
+        version = self._fetch_version()
+        if version != self._version:
+            self._load()
+            self._version = version
+        self._checked_at = now
+
+    def _positions_for(self, service: str, keyword: str) -> FrozenSet[int]:
+        """Positions of the service's endpoints whose action or resource contains `keyword`"""
+        key = (service, keyword)
+        positions = self._keyword_index.get(key)
+        if positions is None:
+            positions = frozenset(
+                i for i, endpoint in enumerate(self._endpoints_by_service.get(service, []))
+                if keyword in (endpoint.get("action") or "").lower()
+                or keyword in (endpoint.get("resource") or "").lower()
+            )
+            self._keyword_index[key] = positions
+        return positions
+
+    def endpoints_for(self, tool: str, intent: str) -> List[Dict[str, Any]]:
+        """Endpoints of `tool` whose action or resource matches any word of `intent`"""
+        with self._lock:
+            self._ensure_fresh()
+            key = (tool, intent.lower())
+            resolved = self._resolved.get(key)
+            if resolved is None:
+                self.stats["misses"] += 1
+                positions = set()
+                for keyword in intent.lower().split():
+                    positions |= self._positions_for(tool, keyword)
+                endpoints = self._endpoints_by_service.get(tool, [])
+                resolved = [endpoints[i] for i in sorted(positions)]
+                self._resolved[key] = resolved
+            else:
+                self.stats["hits"] += 1
+            return list(resolved)
+
+    def services(self) -> List[str]:
+        with self._lock:
+            self._ensure_fresh()
+            return sorted(s for s in self._endpoints_by_service if s is not None)
+
+    def invalidate(self):
+        """Force a version check (and reload if changed) on the next lookup"""
+        with self._lock:
+            self._checked_at = float("-inf")
+
+_catalogs: Dict[int, EndpointCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+def get_endpoint_catalog(supabase, **kwargs) -> EndpointCatalog:
+    """Return the process-wide catalog for a Supabase client"""
+    with _catalogs_lock:
+        if id(supabase) not in _catalogs:
+            _catalogs[id(supabase)] = EndpointCatalog(supabase, **kwargs)
+        return _catalogs[id(supabase)]
@@ -0,0 +1,138 @@
+"""
+Incremental sync of api_endpoints.py definitions into the api_endpoints table
+
+store_endpoints used to upsert every endpoint row one request at a time on
+every run. sync_endpoints instead hashes each endpoint spec, fetches the
+stored hashes for the synced services in one query, and only writes the
+delta: new and changed rows are bulk-upserted, rows whose spec was removed
+are deleted in one request, and unchanged rows are skipped. Re-running a
+migration with nothing changed costs a single select.
+
+Hashes are kept in the api_endpoints.spec_hash column
+(add_api_endpoints_spec_hash.sql). Rows stored before that column existed
+have no hash and are rewritten once.
+
+Usage:
+    stats = sync_endpoints(supabase, ["Shopify", "Klaviyo"])
+    print(stats)  # {"inserted": 0, "updated": 2, "deleted": 0, "skipped": 181, ...}
+"""
+
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Iterable, List, Tuple
+
+from api_endpoints import get_service_endpoints
+
+TABLE = "api_endpoints"
+PAGE_SIZE = 1000
+UPSERT_BATCH_SIZE = 500
+HASHED_FIELDS = ("method", "path", "parameters", "auth_type", "auth_key", "rate_limit")
+
+def endpoint_rows(service: str, endpoints: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Flatten one service's endpoint definitions into api_endpoints rows.
+
+    Nested structures that aren't endpoints themselves are skipped.
+    """
+    rows = []
+    for resource, actions in endpoints.items():
+        if not isinstance(actions, dict):
+            continue
+        for action, details in actions.items():
+            if not isinstance(details, dict) or "method" not in details:
+                logging.debug(f"Skipping nested endpoint: {service} - {resource} - {action}")
+                continue
+            auth = details.get("auth") or {}
+            row = {
+                "service": service,
+                "resource": resource,
+                "action": action,
+                "method": details["method"],
+                "path": details["path"],
+                "parameters": details.get("parameters", {}),
+                "auth_type": auth.get("type") or "Unknown",
+                "auth_key": auth.get("key") or "Unknown",
+                "rate_limit": details.get("rate_limit") or "Not specified"
+            }
+            row["spec_hash"] = spec_hash(row)
+            rows.append(row)
+    return rows
+
+def spec_hash(row: Dict[str, Any]) -> str:
+    """Stable hash of the stored fields of an endpoint row"""
+    content = json.dumps({field: row.get(field) for field in HASHED_FIELDS}, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha1(content.encode("utf-8")).hexdigest()
+
+def fetch_stored_hashes(supabase, services: Iterable[str]) -> Dict[Tuple[str, str, str], Tuple[Any, Any]]:
+    """(service, resource, action) -> (id, spec_hash) for the stored rows of `services`"""
+    stored = {}
+    start = 0
+    while True:
+        page = (
+            supabase.table(TABLE)
+            .select("id, service, resource, action, spec_hash")
+            .in_("service", list(services))
+            .order("id")
+            .range(start, start + PAGE_SIZE - 1)
+            .execute()
+            .data
+        ) or []
+        for row in page:
+            stored[(row["service"], row["resource"], row["action"])] = (row["id"], row.get("spec_hash"))
+        if len(page) < PAGE_SIZE:
+            break
+        start += PAGE_SIZE
+    return stored
+
+def sync_endpoints(supabase, services: Iterable[str], delete_removed: bool = True,
+                   dry_run: bool = False) -> Dict[str, int]:
+    """
+    Bring the api_endpoints rows of `services` in line with api_endpoints.py.
+
+    Args:
+        supabase: Supabase client
+        services (list): Service names as used in api_endpoints.SERVICE_MODULES
+        delete_removed (bool): Delete stored rows of these services that no longer have a spec
+        dry_run (bool): Compute the delta without writing it
+
+    Returns:
+        dict: Counts of inserted, updated, deleted and skipped (unchanged) rows
+    """
+    services = list(services)
+    desired = {}
+    for service in services:
+        for row in endpoint_rows(service, get_service_endpoints(service)):
+            desired[(row["service"], row["resource"], row["action"])] = row
+
+    stored = fetch_stored_hashes(supabase, services)
+
+    to_upsert = []
+    stats = {"inserted": 0, "updated": 0, "deleted": 0, "skipped": 0}
+    for key, row in desired.items():
+        if key not in stored:
+            stats["inserted"] += 1
+        elif stored[key][1] != row["spec_hash"]:
+            stats["updated"] += 1
+        else:
+            stats["skipped"] += 1
+            continue
+        to_upsert.append(row)
+    removed_ids = [stored[key][0] for key in stored.keys() - desired.keys()] if delete_removed else []
+    stats["deleted"] = len(removed_ids)
+
+    if not dry_run:
+        for start in range(0, len(to_upsert), UPSERT_BATCH_SIZE):
+            supabase.table(TABLE).upsert(
+                to_upsert[start:start + UPSERT_BATCH_SIZE],
+                on_conflict="service,resource,action"
+            ).execute()
+        if removed_ids:
+            supabase.table(TABLE).delete().in_("id", removed_ids).execute()
+
+    logging.info(
+        f"{'Would sync' if dry_run else 'Synced'} {len(desired)} endpoints for {len(services)} services: "
+        f"{stats['inserted']} inserted, {stats['updated']} updated, {stats['deleted']} deleted, "
+        f"{stats['skipped']} unchanged rows skipped"
+    )
+    return stats
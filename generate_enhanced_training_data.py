@@ -34,6 +34,7 @@ from api_endpoints import (
     SLACK_ENDPOINTS,
     NOTION_ENDPOINTS
 )
+from quality_validator import QualityValidator
 
 # Model configuration
 OPENAI_MODEL = "meta-llama/Llama-3.3-70B-Instruct-Turbo"  # Using Meta's Llama 3.3 70B Instruct Turbo via Together AI
@@ -183,6 +184,7 @@ class EnhancedTrainingDataGenerator:
             base_url="https://api.together.xyz/v1"
         )
         self.session = None
+        self.validator = QualityValidator()
         
     async def initialize(self):
         """Initialize async session"""
@@ -542,8 +544,7 @@ IMPORTANT: Follow the format exactly as shown above. Your response MUST use the
         example = self._parse_response(response.choices[0].message.content)
         
         # Validate the example meets our quality standards
-        validator = QualityValidator()
-        if not validator.validate_quality(example):
+        if not self.validator.validate_quality(example):
             raise ValueError("Generated example does not meet quality standards")
         
         return example
@@ -15,9 +15,11 @@ import random
 from datetime import datetime
 import openai
 from supabase import create_client, Client
+from http_client import get_httpx_client
 
 # Initialize API clients
 openai.api_key = os.environ.get("OPENAI_API_KEY")
+openai.http_client = get_httpx_client()  # Reuse pooled keep-alive connections
 supabase_url = os.environ.get("SUPABASE_URL")
 supabase_key = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
 supabase: Client = create_client(supabase_url, supabase_key)
@@ -6,16 +6,24 @@ track applied guidelines, and store everything in the training_data table.
 
 import os
 import json
+import time
 import uuid
 import pytz
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
-from typing import Dict, List, Any
+from functools import lru_cache
+from typing import Dict, List, Any, Optional
 from supabase import create_client, Client
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
+GUIDELINE_CACHE_TTL_SECONDS = float(os.getenv("GUIDELINE_CACHE_TTL_SECONDS", "300"))
+INSERT_BATCH_SIZE = 500
+
 def connect_to_supabase() -> Client:
     """Connect to Supabase using environment variables"""
     supabase_url = os.getenv("SUPABASE_URL")
@@ -30,6 +38,54 @@ def connect_to_supabase() -> Client:
         supabase_key
     )
 
+# Fallback when system_training has no executive_perspective guidelines
+DEFAULT_EXECUTIVE_GUIDELINES = {
+    'query_transformation': {
+        'operational_indicators': [
+            'how do i', 'how to', 'what is', 'where is', 'when should i',
+            'step by step', 'tutorial', 'guide', 'instructions',
+            'help me', 'tell me how', 'show me how'
+        ],
+        'executive_indicators': [
+            'strategy', 'roi', 'cost', 'revenue', 'growth',
+            'risk', 'performance', 'metrics', 'trends',
+            'optimization', 'efficiency', 'scale', 'expansion',
+            'competitive', 'market', 'strategic', 'investment',
+            'our', 'we', 'business', 'company'
+        ],
+        'transformations': {
+            'how do i': 'how can we',
+            'what is': "what's our strategy for",
+            'how to': 'how should we approach',
+            'tell me': 'what are our options for',
+            'show me': 'how can we analyze',
+            'where is': 'how should we track',
+            'when should i': 'when should our team',
+            'help me': 'what strategies exist for',
+            'i need': 'we need',
+            'my': 'our',
+            'i want': 'we aim',
+            'can i': 'can we'
+        }
+    }
+}
+
+def _system_guidelines_from_rows(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Guidelines keyed by category, keeping the first 'system' entry"""
+    guidelines = {}
+    for entry in rows:
+        # Skip duplicate system entries
+        if entry['category'] == 'system' and 'system' in guidelines:
+            continue
+        guidelines[entry['category']] = entry
+    return guidelines
+
+def _executive_guidelines_from_rows(rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+    for entry in rows:
+        if entry['category'] == 'executive_perspective':
+            return entry['guidelines']
+    raise Exception("No executive perspective guidelines found in system_training")
+
 def get_system_guidelines(supabase: Client) -> Dict[str, Any]:
     """Fetch all system training guidelines"""
     print("\nFetching system guidelines...")
@@ -38,13 +94,9 @@ def get_system_guidelines(supabase: Client) -> Dict[str, Any]:
     if hasattr(result, 'error') and result.error:
         raise Exception(f"Error fetching system guidelines: {result.error}")
         
-    guidelines = {}
-    for entry in result.data:
-        # Skip duplicate system entries
-        if entry['category'] == 'system' and 'system' in guidelines:
-            continue
-        guidelines[entry['category']] = entry
-        print(f"Found guidelines for category: {entry['category']}")
+    guidelines = _system_guidelines_from_rows(result.data)
+    for category in guidelines:
+        print(f"Found guidelines for category: {category}")
     return guidelines
 
 def get_executive_guidelines(supabase: Client) -> Dict[str, Any]:
@@ -52,44 +104,95 @@ def get_executive_guidelines(supabase: Client) -> Dict[str, Any]:
     print("\nFetching executive perspective guidelines...")
     try:
         result = supabase.table('system_training').select('*').eq('category', 'executive_perspective').execute()
-        
-        if not result.data:
-            raise Exception("No executive perspective guidelines found in system_training")
-            
-        return result.data[0]['guidelines']
+        return _executive_guidelines_from_rows(result.data)
     except Exception as e:
         print(f"Error fetching executive guidelines: {str(e)}")
         # Return default guidelines as fallback
-        return {
-            'query_transformation': {
-                'operational_indicators': [
-                    'how do i', 'how to', 'what is', 'where is', 'when should i',
-                    'step by step', 'tutorial', 'guide', 'instructions',
-                    'help me', 'tell me how', 'show me how'
-                ],
-                'executive_indicators': [
-                    'strategy', 'roi', 'cost', 'revenue', 'growth',
-                    'risk', 'performance', 'metrics', 'trends',
-                    'optimization', 'efficiency', 'scale', 'expansion',
-                    'competitive', 'market', 'strategic', 'investment',
-                    'our', 'we', 'business', 'company'
-                ],
-                'transformations': {
-                    'how do i': 'how can we',
-                    'what is': "what's our strategy for",
-                    'how to': 'how should we approach',
-                    'tell me': 'what are our options for',
-                    'show me': 'how can we analyze',
-                    'where is': 'how should we track',
-                    'when should i': 'when should our team',
-                    'help me': 'what strategies exist for',
-                    'i need': 'we need',
-                    'my': 'our',
-                    'i want': 'we aim',
-                    'can i': 'can we'
-                }
-            }
-        }
+        return DEFAULT_EXECUTIVE_GUIDELINES
+
+class GuidelineCache:
+    """
+    Versioned in-process cache of system_training.
+
+    Loads the whole table in one query and serves both the system and the
+    executive guidelines from it. After `ttl_seconds` it checks the table's
+    version (row count + latest updated_at) and only reloads when that changed.
+
+    Args:
+        supabase: Supabase client
+        ttl_seconds (float): How long to trust the loaded guidelines before checking the version
+    """
+
+    def __init__(self, supabase: Client, ttl_seconds: float = GUIDELINE_CACHE_TTL_SECONDS):
+        self.supabase = supabase
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._version = None
+        self._checked_at = float("-inf")
+        self._system_guidelines: Dict[str, Any] = {}
+        self._executive_guidelines: Dict[str, Any] = DEFAULT_EXECUTIVE_GUIDELINES
+
+    def _fetch_version(self):
+        result = (
+            self.supabase.table('system_training')
+            .select('updated_at', count='exact')
+            .order('updated_at', desc=True)
+            .limit(1)
+            .execute()
+        )
+        return result.count, (result.data[0].get('updated_at') if result.data else None)
+
+    def _load(self):
+        print("\nLoading system_training guidelines...")
+        result = self.supabase.table('system_training').select('*').execute()
+        if hasattr(result, 'error') and result.error:
+            raise Exception(f"Error fetching system guidelines: {result.error}")
+        self._system_guidelines = _system_guidelines_from_rows(result.data)
+        try:
+            self._executive_guidelines = _executive_guidelines_from_rows(result.data)
+        except Exception as e:
+            print(f"Error fetching executive guidelines: {str(e)}")
+            self._executive_guidelines = DEFAULT_EXECUTIVE_GUIDELINES
+        print(f"Loaded guidelines for {len(self._system_guidelines)} categories")
+
+    def _ensure_fresh(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.ttl_seconds:
+            return
+        version = self._fetch_version()
+        if version != self._version:
+            self._load()
+            self._version = version
+        self._checked_at = now
+
+    @property
+    def version(self):
+        with self._lock:
+            self._ensure_fresh()
+            return self._version
+
+    def system_guidelines(self) -> Dict[str, Any]:
+        with self._lock:
+            self._ensure_fresh()
+            return self._system_guidelines
+
+    def executive_guidelines(self) -> Dict[str, Any]:
+        with self._lock:
+            self._ensure_fresh()
+            return self._executive_guidelines
+
+_supabase: Optional[Client] = None
+_guideline_cache: Optional[GuidelineCache] = None
+_shared_lock = threading.Lock()
+
+def get_guideline_cache() -> GuidelineCache:
+    """Return the process-wide Supabase client's guideline cache"""
+    global _supabase, _guideline_cache
+    with _shared_lock:
+        if _guideline_cache is None:
+            _supabase = connect_to_supabase()
+            _guideline_cache = GuidelineCache(_supabase)
+        return _guideline_cache
 
 def validate_executive_perspective(query: str, guidelines: Dict[str, Any]) -> bool:
     """
@@ -225,10 +328,9 @@ def determine_applicable_guidelines(query: str, guidelines: Dict[str, Any]) -> D
     
     return applicable
 
-def generate_response(query: str, applicable_guidelines: Dict[str, Any], guidelines: Dict[str, Any]) -> str:
-    """Generate a response following the applicable guidelines"""
-    print("\nGenerating response...")
-    
+@lru_cache(maxsize=None)
+def get_response_templates() -> Dict[str, Dict[str, Any]]:
+    """Response templates keyed by query type, built once per process"""
     # Map query types to detailed responses
     response_templates = {
         # VIP Customer Analytics
@@ -631,15 +733,27 @@ Would you like to explore any specific aspect of our market position?""",
         },
     }
     
+    # Keyword sets used for matching, computed once with the templates.
+    # Per-platform snippet entries have no example query and are never matched.
+    for template in response_templates.values():
+        if "query" in template:
+            template["keywords"] = frozenset(template["query"].lower().split())
+    return response_templates
+
+def generate_response(query: str, applicable_guidelines: Dict[str, Any], guidelines: Dict[str, Any]) -> str:
+    """Generate a response following the applicable guidelines"""
+    print("\nGenerating response...")
+    
     # Determine the most relevant template based on query content
-    query_lower = query.lower()
+    query_keywords = set(query.lower().split())
     best_match = None
     best_match_score = 0
     
-    for template_key, template in response_templates.items():
+    for template_key, template in get_response_templates().items():
+        if "keywords" not in template:
+            continue
         # Calculate match score based on keyword overlap
-        template_keywords = set(template["query"].lower().split())
-        query_keywords = set(query_lower.split())
+        template_keywords = template["keywords"]
         overlap = len(template_keywords.intersection(query_keywords))
         score = overlap / len(template_keywords)
         
@@ -648,7 +762,7 @@ Would you like to explore any specific aspect of our market position?""",
             best_match = template
     
     if best_match and best_match_score > 0.3:  # Threshold for minimum match
-        return best_match["response"], best_match["metadata"]
+        return best_match["response"], dict(best_match["metadata"])
     
     # Default response if no specific template matches
     return f"""Based on our analysis of the query "{query}", here are the key insights:
@@ -682,11 +796,9 @@ Would you like me to elaborate on any specific aspect of this analysis?""", {
         "context": "strategic_analysis"
     }
 
-def store_training_data(supabase: Client, query: str, response: str, 
-                       applicable_guidelines: Dict[str, Any], version: str = "1.0") -> None:
-    """Store the generated response and metadata in training_data table"""
-    print("\nStoring training data...")
-    
+def build_training_record(query: str, response: str, applicable_guidelines: Dict[str, Any],
+                          version: str = "1.0") -> Dict[str, Any]:
+    """Build the training_data row for a generated response"""
     # Determine primary category from guidelines
     category = "system"
     if applicable_guidelines['workflow_context']:
@@ -697,7 +809,7 @@ def store_training_data(supabase: Client, query: str, response: str,
     current_time = datetime.now(est).replace(year=datetime.now().year)
     formatted_time = current_time.strftime("%Y-%m-%d %I:%M:%S %p EST")
     
-    training_data = {
+    return {
         'id': str(uuid.uuid4()),
         'tool': 'system',
         'intent': 'response',
@@ -709,6 +821,13 @@ def store_training_data(supabase: Client, query: str, response: str,
         'source': ['system_generated'],
         'is_active': True
     }
+
+def store_training_data(supabase: Client, query: str, response: str, 
+                       applicable_guidelines: Dict[str, Any], version: str = "1.0") -> None:
+    """Store the generated response and metadata in training_data table"""
+    print("\nStoring training data...")
+    
+    training_data = build_training_record(query, response, applicable_guidelines, version)
     
     print("Training data to store:")
     print(json.dumps(training_data, indent=2))
@@ -725,11 +844,11 @@ def process_training_query(query: str, version: str = "1.0"):
         print(f"\n{'='*50}")
         print(f"Original query: {query}")
         
-        # Connect to Supabase
-        supabase = connect_to_supabase()
+        # Guidelines are loaded once per process and re-fetched only when system_training changes
+        cache = get_guideline_cache()
         
         # Get executive guidelines
-        executive_guidelines = get_executive_guidelines(supabase)
+        executive_guidelines = cache.executive_guidelines()
         
         # Always transform if not in executive perspective
         if not validate_executive_perspective(query, executive_guidelines):
@@ -741,7 +860,7 @@ def process_training_query(query: str, version: str = "1.0"):
         print(f"{'='*50}")
         
         # Get system guidelines
-        guidelines = get_system_guidelines(supabase)
+        guidelines = cache.system_guidelines()
         
         # Determine applicable guidelines
         applicable_guidelines = determine_applicable_guidelines(query, guidelines)
@@ -750,7 +869,7 @@ def process_training_query(query: str, version: str = "1.0"):
         response, metadata = generate_response(query, applicable_guidelines, guidelines)
         
         # Store in training_data table
-        store_training_data(supabase, query, response, applicable_guidelines, version)
+        store_training_data(cache.supabase, query, response, applicable_guidelines, version)
         
         print("\nSummary:")
         print(f"Query: {query}")
@@ -764,6 +883,74 @@ def process_training_query(query: str, version: str = "1.0"):
         if hasattr(e, 'response'):
             print(f"Response: {e.response.text if hasattr(e.response, 'text') else e.response}")
 
+def prepare_training_record(query: str, executive_guidelines: Dict[str, Any], guidelines: Dict[str, Any],
+                            version: str = "1.0") -> Dict[str, Any]:
+    """Transform, match and render one query into a training_data row without storing it"""
+    if not validate_executive_perspective(query, executive_guidelines):
+        query = transform_to_executive_perspective(query, executive_guidelines)
+    applicable_guidelines = determine_applicable_guidelines(query, guidelines)
+    response, metadata = generate_response(query, applicable_guidelines, guidelines)
+    return build_training_record(query, response, applicable_guidelines, version)
+
+def process_training_queries(queries: List[str], version: str = "1.0", workers: int = 4,
+                             batch_size: int = INSERT_BATCH_SIZE) -> Dict[str, Any]:
+    """
+    Process many training queries in one run.
+
+    Guidelines and the response template table are loaded once. Queries are
+    split into batches that worker threads render and bulk-insert, so
+    rendering one batch overlaps with inserting the others.
+
+    Args:
+        queries (list): Queries to process
+        version (str): Version recorded on every row
+        workers (int): Batches processed concurrently
+        batch_size (int): Rows per insert
+
+    Returns:
+        dict: Counts of stored and failed queries, and the elapsed time
+    """
+    start = time.perf_counter()
+    cache = get_guideline_cache()
+    executive_guidelines = cache.executive_guidelines()
+    guidelines = cache.system_guidelines()
+    get_response_templates()
+
+    def process_batch(batch: List[str]) -> Dict[str, int]:
+        records = []
+        failed = 0
+        for query in batch:
+            try:
+                records.append(prepare_training_record(query, executive_guidelines, guidelines, version))
+            except Exception as e:
+                print(f"\nError processing query {query!r}: {str(e)}")
+                failed += 1
+        if records:
+            try:
+                result = cache.supabase.table('training_data').insert(records).execute()
+                if hasattr(result, 'error') and result.error:
+                    raise Exception(result.error)
+            except Exception as e:
+                print(f"\nError storing batch of {len(records)} rows: {str(e)}")
+                return {"stored": 0, "failed": failed + len(records)}
+        return {"stored": len(records), "failed": failed}
+
+    batches = [queries[i:i + batch_size] for i in range(0, len(queries), batch_size)]
+    stats = {"queries": len(queries), "stored": 0, "failed": 0, "guidelines_version": cache.version}
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        for batch_stats in executor.map(process_batch, batches):
+            stats["stored"] += batch_stats["stored"]
+            stats["failed"] += batch_stats["failed"]
+    stats["elapsed_seconds"] = round(time.perf_counter() - start, 2)
+    return stats
+
+def load_queries(path: str) -> List[str]:
+    """Read queries from a JSON list or a text file with one query per line"""
+    with open(path) as f:
+        if path.endswith('.json'):
+            return [str(q) for q in json.load(f)]
+        return [line.strip() for line in f if line.strip()]
+
 def main():
     """Main function"""
     # Example queries to process from e-commerce executive perspective
@@ -851,9 +1038,25 @@ def main():
         "What are the key financial metrics we should track and improve?"
     ]
     
+    parser = argparse.ArgumentParser(description="Generate training data responses from queries")
+    parser.add_argument("--queries-file", help="JSON list or text file (one query per line) of queries to process")
+    parser.add_argument("--version", default="1.0", help="Version recorded on the stored rows")
+    parser.add_argument("--workers", type=int, default=4, help="Batches processed concurrently")
+    parser.add_argument("--batch-size", type=int, default=INSERT_BATCH_SIZE, help="Rows per insert")
+    parser.add_argument("--one-by-one", action="store_true",
+                        help="Process and store each query individually with full output")
+    args = parser.parse_args()
+
+    queries = load_queries(args.queries_file) if args.queries_file else example_queries
+
     print("Starting training data generation...")
-    for query in example_queries:
-        process_training_query(query)
+    if args.one_by_one:
+        for query in queries:
+            process_training_query(query, args.version)
+    else:
+        stats = process_training_queries(queries, args.version, args.workers, args.batch_size)
+        print(f"\nStored {stats['stored']} of {stats['queries']} queries "
+              f"({stats['failed']} failed) in {stats['elapsed_seconds']}s")
     print("\nProcessing completed")
 
 if __name__ == "__main__":
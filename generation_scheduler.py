@@ -0,0 +1,105 @@
+"""
+Async bounded-concurrency scheduler for LLM generation jobs
+
+Keeps up to N requests in flight at once and paces each provider/model
+with its own token bucket, so throughput is bounded by the provider quota
+instead of fixed sleeps or the number of worker processes.
+
+Usage:
+    scheduler = GenerationScheduler(concurrency=8, default_rate=2.0)
+    results = await scheduler.run([
+        (("together", model), lambda: generator.generate_examples_batch(tool, intent, 5)),
+        ...
+    ])
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+RateKey = Tuple[str, str]  # (provider, model)
+JobFactory = Callable[[], Awaitable[Any]]
+
+class TokenBucket:
+    """
+    Async token bucket: `rate` tokens per second, holding at most `capacity`.
+    Each acquire() takes one token, waiting until one is available.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class GenerationScheduler:
+    """
+    Run generation jobs with at most `concurrency` in flight, each job
+    first taking a token from the bucket for its (provider, model).
+
+    Args:
+        concurrency (int): Maximum number of jobs running at once
+        default_rate (float): Requests per second for keys without an explicit limit
+        rate_limits (dict): Optional {(provider, model): requests per second} overrides
+    """
+
+    def __init__(self, concurrency: int = 8, default_rate: float = 2.0,
+                 rate_limits: Optional[Dict[RateKey, float]] = None):
+        self.concurrency = concurrency
+        self.default_rate = default_rate
+        self.rate_limits = dict(rate_limits or {})
+        self._buckets: Dict[RateKey, TokenBucket] = {}
+        self.completed = 0
+        self.failed = 0
+
+    def bucket_for(self, key: RateKey) -> TokenBucket:
+        if key not in self._buckets:
+            self._buckets[key] = TokenBucket(self.rate_limits.get(key, self.default_rate))
+        return self._buckets[key]
+
+    async def run(self, jobs: Iterable[Tuple[RateKey, JobFactory]]) -> List[Any]:
+        """
+        Run all jobs and return their results in submission order.
+        A job that raises contributes None to the results.
+        """
+        semaphore = asyncio.Semaphore(self.concurrency)
+        start = time.monotonic()
+
+        async def run_job(key: RateKey, factory: JobFactory):
+            async with semaphore:
+                await self.bucket_for(key).acquire()
+                try:
+                    result = await factory()
+                    self.completed += 1
+                    return result
+                except Exception as e:
+                    self.failed += 1
+                    logging.error(f"Generation job for {key[0]}/{key[1]} failed: {str(e)}")
+                    return None
+
+        results = await asyncio.gather(*(run_job(key, factory) for key, factory in jobs))
+
+        elapsed = time.monotonic() - start
+        logging.info(
+            f"Scheduler finished {self.completed} jobs ({self.failed} failed) in {elapsed:.1f}s "
+            f"at concurrency {self.concurrency}"
+        )
+        return results
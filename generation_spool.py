@@ -0,0 +1,168 @@
+"""
+Write-ahead spool for training data generation runs
+
+Every generated batch is committed to a local SQLite file as soon as it
+comes back from the LLM, and marked again once it has been inserted into
+the database. A crashed run can then be resumed: batches that were already
+generated are skipped (no paying twice for the same LLM output) and
+batches that were generated but never inserted are replayed.
+
+Usage:
+    spool = GenerationSpool.open("bulk_runner_with_log", resume=args.resume)
+    if not spool.is_generated(work_key, 0):
+        spool.record_generated(work_key, 0, rows)
+    ...
+    spool.mark_inserted(work_key, 0, inserted_count)
+"""
+
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+SPOOL_PATH = os.getenv("GENERATION_SPOOL_PATH", "generation_spool.db")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS spool_batches (
+    run_id TEXT NOT NULL,
+    work_key TEXT NOT NULL,
+    batch_index INTEGER NOT NULL,
+    rows TEXT NOT NULL,
+    row_count INTEGER NOT NULL,
+    generated_at TEXT NOT NULL,
+    inserted_at TEXT,
+    inserted_count INTEGER,
+    PRIMARY KEY (run_id, work_key, batch_index)
+);
+CREATE INDEX IF NOT EXISTS idx_spool_batches_pending ON spool_batches(run_id, inserted_at);
+"""
+
+class GenerationSpool:
+    """
+    Durable record of generated and inserted batches for one run.
+
+    Args:
+        run_id (str): Identifier of the run the batches belong to
+        path (str): SQLite file holding the spool
+    """
+
+    def __init__(self, run_id: str, path: str = SPOOL_PATH):
+        self.run_id = run_id
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(SCHEMA)
+
+    @classmethod
+    def open(cls, name: str, resume: bool = False, run_id: Optional[str] = None,
+             path: str = SPOOL_PATH) -> "GenerationSpool":
+        """
+        Open the spool for a runner.
+
+        With `resume`, continues `run_id` or, if not given, the most recent run
+        recorded for `name`. Otherwise starts a new run named after `name`.
+        """
+        if run_id is None and resume:
+            run_id = cls.latest_run_id(name, path)
+        if run_id is None:
+            run_id = f"{name}-{datetime.now().strftime('%Y%m%d%H%M%S')}"
+        return cls(run_id, path)
+
+    @staticmethod
+    def latest_run_id(name: str, path: str = SPOOL_PATH) -> Optional[str]:
+        if not os.path.exists(path):
+            return None
+        conn = sqlite3.connect(path)
+        try:
+            conn.executescript(SCHEMA)
+            row = conn.execute(
+                "SELECT run_id FROM spool_batches WHERE run_id LIKE ? "
+                "ORDER BY generated_at DESC LIMIT 1",
+                (f"{name}-%",)
+            ).fetchone()
+            return row[0] if row else None
+        finally:
+            conn.close()
+
+    def record_generated(self, work_key: str, batch_index: int, rows: List[Dict[str, Any]]):
+        """Durably record a generated batch before anything else happens to it"""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO spool_batches "
+                "(run_id, work_key, batch_index, rows, row_count, generated_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (self.run_id, work_key, batch_index, json.dumps(rows), len(rows), datetime.now().isoformat())
+            )
+
+    def mark_inserted(self, work_key: str, batch_index: int, inserted_count: int):
+        with self._lock:
+            self._conn.execute(
+                "UPDATE spool_batches SET inserted_at = ?, inserted_count = ? "
+                "WHERE run_id = ? AND work_key = ? AND batch_index = ?",
+                (datetime.now().isoformat(), inserted_count, self.run_id, work_key, batch_index)
+            )
+
+    def is_generated(self, work_key: str, batch_index: int) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM spool_batches WHERE run_id = ? AND work_key = ? AND batch_index = ?",
+                (self.run_id, work_key, batch_index)
+            ).fetchone()
+        return row is not None
+
+    def is_inserted(self, work_key: str, batch_index: int) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM spool_batches WHERE run_id = ? AND work_key = ? AND batch_index = ? "
+                "AND inserted_at IS NOT NULL",
+                (self.run_id, work_key, batch_index)
+            ).fetchone()
+        return row is not None
+
+    def get_rows(self, work_key: str, batch_index: int) -> Optional[List[Dict[str, Any]]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT rows FROM spool_batches WHERE run_id = ? AND work_key = ? AND batch_index = ?",
+                (self.run_id, work_key, batch_index)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def pending_inserts(self) -> Iterator[Tuple[str, int, List[Dict[str, Any]]]]:
+        """Yield (work_key, batch_index, rows) for generated batches not yet inserted"""
+        with self._lock:
+            pending = self._conn.execute(
+                "SELECT work_key, batch_index, rows FROM spool_batches "
+                "WHERE run_id = ? AND inserted_at IS NULL ORDER BY generated_at",
+                (self.run_id,)
+            ).fetchall()
+        for work_key, batch_index, rows in pending:
+            yield work_key, batch_index, json.loads(rows)
+
+    def next_batch_index(self, work_key: str) -> int:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MAX(batch_index) FROM spool_batches WHERE run_id = ? AND work_key = ?",
+                (self.run_id, work_key)
+            ).fetchone()
+        return 0 if row[0] is None else row[0] + 1
+
+    def summary(self) -> Dict[str, int]:
+        with self._lock:
+            batches, generated, inserted_batches, inserted = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(row_count), 0), COUNT(inserted_at), "
+                "COALESCE(SUM(inserted_count), 0) FROM spool_batches WHERE run_id = ?",
+                (self.run_id,)
+            ).fetchone()
+        return {
+            "batches": batches,
+            "generated_rows": generated,
+            "inserted_batches": inserted_batches,
+            "inserted_rows": inserted
+        }
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
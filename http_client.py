@@ -0,0 +1,74 @@
+"""
+Shared connection-pooled HTTP clients for the training data generators
+
+Every generator used to call `requests.post(...)` directly, which opens a
+new TCP + TLS connection per call. These helpers hand out one process-wide
+client per flavour so connections are kept alive and reused:
+- get_session(): requests.Session with a sized urllib3 pool
+- get_httpx_client(): httpx.Client for the OpenAI-compatible SDKs, with
+  HTTP/2 enabled when the `h2` package is installed
+
+Pool sizes are configured through HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+and HTTP_KEEPALIVE_EXPIRY.
+"""
+
+import os
+import threading
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))  # Number of hosts to keep pools for
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "32"))  # Connections kept per host
+HTTP_KEEPALIVE_EXPIRY = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", "60"))
+HTTP_TIMEOUT = float(os.getenv("HTTP_TIMEOUT", "120"))
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_httpx_client = None
+
+def create_session(pool_connections: int = HTTP_POOL_CONNECTIONS,
+                   pool_maxsize: int = HTTP_POOL_MAXSIZE) -> requests.Session:
+    """Create a requests.Session whose adapters keep `pool_maxsize` connections per host alive"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled requests.Session"""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = create_session()
+        return _session
+
+def http2_available() -> bool:
+    try:
+        import h2  # noqa: F401
+        return True
+    except ImportError:
+        return False
+
+def get_httpx_client():
+    """
+    Return the process-wide pooled httpx.Client, for passing as `http_client`
+    to OpenAI-compatible SDK clients.
+    """
+    global _httpx_client
+    import httpx
+
+    with _lock:
+        if _httpx_client is None:
+            _httpx_client = httpx.Client(
+                http2=http2_available(),
+                timeout=HTTP_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=HTTP_POOL_MAXSIZE,
+                    max_keepalive_connections=HTTP_POOL_MAXSIZE,
+                    keepalive_expiry=HTTP_KEEPALIVE_EXPIRY
+                )
+            )
+        return _httpx_client
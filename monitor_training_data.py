@@ -7,10 +7,16 @@ This script connects to Supabase and displays statistics about the training data
 import os
 import sys
 import time
-from datetime import datetime, timedelta
+import argparse
+from collections import deque
+from datetime import datetime, timedelta, timezone
 from tabulate import tabulate
 from supabase import create_client, Client
 
+COUNTERS_TABLE = "training_data_counters"
+PAGE_SIZE = 1000
+WATCH_OVERLAP_SECONDS = 5
+
 def connect_to_supabase() -> Client:
     """Connect to Supabase using environment variables"""
     supabase_url = os.environ.get("SUPABASE_URL")
@@ -21,43 +27,146 @@ def connect_to_supabase() -> Client:
         
     return create_client(supabase_url, supabase_key)
 
+def _parse_time(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+def _paged(query_factory):
+    """Yield every row of a PostgREST query, PAGE_SIZE rows per request"""
+    start = 0
+    while True:
+        rows = query_factory().range(start, start + PAGE_SIZE - 1).execute().data or []
+        yield from rows
+        if len(rows) < PAGE_SIZE:
+            break
+        start += PAGE_SIZE
+
+def get_counters(supabase: Client):
+    """Read total/per-tool/per-intent counts from the trigger-maintained counter table"""
+    result = supabase.table(COUNTERS_TABLE).select('dimension, value, count').execute()
+    if not result.data:
+        raise ValueError(f"{COUNTERS_TABLE} is empty; run create_training_data_counters.sql")
+    counts = {'total_count': 0, 'tool_counts': {}, 'intent_counts': {}}
+    for row in result.data:
+        if row['dimension'] == 'total':
+            counts['total_count'] = row['count']
+        elif row['count']:
+            counts[f"{row['dimension']}_counts"][row['value']] = row['count']
+    return counts
+
+def scan_counts(supabase: Client):
+    """Count tools and intents by reading both columns of every row (fallback without the counter table)"""
+    counts = {'total_count': 0, 'tool_counts': {}, 'intent_counts': {}}
+    for record in _paged(lambda: supabase.table('training_data').select('tool, intent').order('id')):
+        counts['total_count'] += 1
+        counts['tool_counts'][record['tool']] = counts['tool_counts'].get(record['tool'], 0) + 1
+        counts['intent_counts'][record['intent']] = counts['intent_counts'].get(record['intent'], 0) + 1
+    return counts
+
+def load_counts(supabase: Client):
+    try:
+        return get_counters(supabase)
+    except Exception as e:
+        print(f"Counter table unavailable ({str(e)}); scanning training_data instead")
+        return scan_counts(supabase)
+
 def get_training_stats(supabase: Client):
     """Get training data statistics from Supabase"""
     try:
-        # Get total count
-        result = supabase.table('training_data').select('*', count='exact').execute()
-        total_count = result.count if result.count is not None else 0
+        # Total, per-tool and per-intent counts from the counter table
+        stats = load_counts(supabase)
         
-        # Get counts by tool
-        tools_result = supabase.table('training_data').select('tool').execute()
-        tool_counts = {}
-        for record in tools_result.data:
-            tool = record['tool']
-            tool_counts[tool] = tool_counts.get(tool, 0) + 1
-            
-        # Get counts by intent
-        intents_result = supabase.table('training_data').select('intent').execute()
-        intent_counts = {}
-        for record in intents_result.data:
-            intent = record['intent']
-            intent_counts[intent] = intent_counts.get(intent, 0) + 1
-            
         # Get recent additions (last 24 hours)
         one_day_ago = (datetime.now() - timedelta(days=1)).isoformat()
-        recent_result = supabase.table('training_data').select('*', count='exact').gte('created_at', one_day_ago).execute()
-        recent_count = recent_result.count if recent_result.count is not None else 0
+        recent_result = supabase.table('training_data').select('id', count='exact', head=True).gte('created_at', one_day_ago).execute()
+        stats['recent_count'] = recent_result.count if recent_result.count is not None else 0
         
-        return {
-            'total_count': total_count,
-            'tool_counts': tool_counts,
-            'intent_counts': intent_counts,
-            'recent_count': recent_count
-        }
+        return stats
         
     except Exception as e:
         print(f"Error getting statistics: {str(e)}")
         return None
 
+class TrainingDataWatcher:
+    """
+    Live statistics that only read rows added since the last poll.
+
+    The baseline comes from the counter table. Each poll then fetches rows
+    newer than a (created_at, id) watermark, minus a small overlap window for
+    transactions that commit late, and folds them into the counts, so a
+    refresh costs time proportional to the new rows. Deletes and updates
+    aren't visible as new rows, so the counts are re-read from the counter
+    table every `resync_every` polls.
+
+    Args:
+        supabase: Supabase client
+        overlap_seconds (float): How far behind the watermark each poll re-reads
+        resync_every (int): Polls between re-reads of the counter table (0 = never)
+    """
+
+    def __init__(self, supabase: Client, overlap_seconds: float = WATCH_OVERLAP_SECONDS, resync_every: int = 60):
+        self.supabase = supabase
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.resync_every = resync_every
+        self.polls = 0
+        self.counts = None
+        self.recent = deque()  # created_at of rows from the last 24 hours, oldest first
+        self.watermark = None
+        self.seen = {}  # id -> created_at for rows inside the overlap window
+
+    def _fetch_since(self, since: datetime, columns: str):
+        return _paged(lambda: (
+            self.supabase.table('training_data')
+            .select(columns)
+            .gte('created_at', since.isoformat())
+            .order('created_at')
+            .order('id')
+        ))
+
+    def start(self):
+        """Load the baseline counts and the last 24 hours of creation times"""
+        self.counts = load_counts(self.supabase)
+        one_day_ago = datetime.now(timezone.utc) - timedelta(days=1)
+        for row in self._fetch_since(one_day_ago, 'id, created_at'):
+            created_at = _parse_time(row['created_at'])
+            self.recent.append(created_at)
+            self.seen[row['id']] = created_at
+        if self.recent:
+            self.watermark = self.recent[-1]
+        else:
+            latest = self.supabase.table('training_data').select('created_at').order('created_at', desc=True).limit(1).execute()
+            self.watermark = _parse_time(latest.data[0]['created_at']) if latest.data else one_day_ago
+        self._prune()
+
+    def _prune(self):
+        one_day_ago = datetime.now(timezone.utc) - timedelta(days=1)
+        while self.recent and self.recent[0] < one_day_ago:
+            self.recent.popleft()
+        horizon = self.watermark - self.overlap
+        self.seen = {row_id: created_at for row_id, created_at in self.seen.items() if created_at >= horizon}
+
+    def poll(self):
+        """Fold rows added since the last poll into the counts and return the current statistics"""
+        if self.counts is None:
+            self.start()
+        self.polls += 1
+        new_rows = 0
+        for row in self._fetch_since(self.watermark - self.overlap, 'id, tool, intent, created_at'):
+            if row['id'] in self.seen:
+                continue
+            created_at = _parse_time(row['created_at'])
+            self.seen[row['id']] = created_at
+            self.counts['total_count'] += 1
+            self.counts['tool_counts'][row['tool']] = self.counts['tool_counts'].get(row['tool'], 0) + 1
+            self.counts['intent_counts'][row['intent']] = self.counts['intent_counts'].get(row['intent'], 0) + 1
+            self.recent.append(created_at)
+            self.watermark = max(self.watermark, created_at)
+            new_rows += 1
+        # Resync after folding in the new rows: the counters already include them
+        if self.resync_every and self.polls % self.resync_every == 0:
+            self.counts = load_counts(self.supabase)
+        self._prune()
+        return dict(self.counts, recent_count=len(self.recent), new_rows=new_rows)
+
 def display_stats(stats):
     """Display training data statistics in a formatted table"""
     if not stats:
@@ -80,19 +189,37 @@ def display_stats(stats):
     print(tabulate(intent_rows, headers=['Intent', 'Count'], tablefmt='grid'))
 
 def main():
+    parser = argparse.ArgumentParser(description="Monitor training data generation progress")
+    parser.add_argument("--watch", action="store_true", help="Keep refreshing, reading only rows added since the last refresh")
+    parser.add_argument("--interval", type=float, default=10, help="Seconds between refreshes in --watch mode")
+    parser.add_argument("--resync-every", type=int, default=60,
+                        help="Refreshes between re-reads of the counter table in --watch mode")
+    args = parser.parse_args()
+    
     try:
         # Connect to Supabase
         supabase = connect_to_supabase()
         
-        # Get and display statistics
-        stats = get_training_stats(supabase)
-        display_stats(stats)
+        if not args.watch:
+            # Get and display statistics
+            stats = get_training_stats(supabase)
+            display_stats(stats)
+            return 0
         
+        watcher = TrainingDataWatcher(supabase, resync_every=args.resync_every)
+        while True:
+            start = time.perf_counter()
+            stats = watcher.poll()
+            display_stats(stats)
+            print(f"\n{stats['new_rows']} new records, refreshed in {time.perf_counter() - start:.2f}s "
+                  f"at {datetime.now().strftime('%H:%M:%S')}")
+            time.sleep(args.interval)
+        
+    except KeyboardInterrupt:
+        return 0
     except Exception as e:
         print(f"Error: {str(e)}")
         return 1
-        
-    return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -1,14 +1,18 @@
 """
 Parallel training data generator for MCP
 
-This script runs multiple worker processes in parallel to generate
-training data much faster than sequential approaches. Each worker:
+This script keeps many LLM requests in flight at once from a single
+asyncio scheduler (see generation_scheduler.py) to generate training data
+much faster than sequential approaches. The scheduler:
 1. Generates examples for specific tool/intent combinations
 2. Stores examples in local files to minimize DB writes
 3. Combines and batch inserts results at the end
 
+Throughput is bounded by --concurrency and the per-model --rps token
+bucket rather than by fixed sleeps between calls.
+
 Usage:
-    python parallel_training_generator.py --workers 4 --examples 1000 --batch-size 50
+    python parallel_training_generator.py --examples 20 --batch-size 5 --concurrency 8 --rps 2
 """
 
 print("Starting training data generator...")
@@ -18,9 +22,7 @@ import json
 import time
 import random
 import argparse
-import multiprocessing
 from datetime import datetime, timezone
-from concurrent.futures import ProcessPoolExecutor, as_completed
 import requests
 import logging
 from typing import Dict, List, Any, Optional
@@ -29,7 +31,14 @@ from supabase import create_client, Client
 import pytz
 import asyncio
 import traceback
-from together import Together
+from together import Together, AsyncTogether
+from generation_scheduler import GenerationScheduler
+from rate_control import get_rate_limiter, rate_limit_info
+from http_client import get_session, HTTP_TIMEOUT
+from generation_spool import GenerationSpool
+from quality_validator import QualityValidator, QUALITY_MONITORING_DIR
+from endpoint_catalog import get_endpoint_catalog
+from endpoint_sync import sync_endpoints
 
 # Load environment variables from .env file
 load_dotenv()
@@ -44,8 +53,10 @@ MODEL = MODELS['mistral']  # Using Mistral 7B Instruct v0.2 model
 TEMPERATURE = 0.8
 BATCH_SIZE = 5
 OUTPUT_DIR = "enhanced_training_data"
-QUALITY_MONITORING_DIR = "quality_monitoring"
 GPT4_PERCENTAGE = 0.05  # 5% of examples will be generated by GPT-4
+GENERATION_MODEL = MODELS['llama']  # Model used for single-service batches
+DEFAULT_CONCURRENCY = 8  # Maximum LLM requests in flight
+DEFAULT_REQUESTS_PER_SECOND = float(os.getenv("GENERATION_RPS", "2.0"))  # Token bucket rate per provider/model
 
 # Tool intents mapping - all the different combinations we can generate examples for
 TOOL_INTENTS = {
@@ -171,157 +182,14 @@ except Exception as e:
     logging.error(f"Failed to connect to Supabase: {str(e)}")
     raise
 
-class QualityValidator:
-    def __init__(self):
-        # Technical terms that should not appear in user-facing responses
-        self.technical_terms = [
-            'api', 'endpoint', 'authentication', 'token', 'request', 'implementation',
-            'integration', 'webhook', 'callback', 'sdk', 'framework', 'database',
-            'server', 'client', 'protocol', 'http', 'https', 'json', 'xml',
-            'rest', 'soap', 'oauth', 'jwt', 'cors', 'rate limit', 'timeout',
-            'error handling', 'exception', 'stack trace', 'debug', 'log',
-            'configuration', 'environment variable', 'deployment', 'hosting'
-        ]
-        
-        # Phrases that should not appear in responses
-        self.forbidden_phrases = [
-            'if you need more details go to',
-            'for more information visit',
-            'check out our documentation at',
-            'refer to our docs',
-            'see our documentation',
-            'visit our website',
-            'go to our website',
-            'check our website',
-            'visit us at',
-            'go to',
-            'check out',
-            'refer to',
-            'see',
-            'visit'
-        ]
-        
-        # Required elements in responses
-        self.required_elements = [
-            'clear explanation',
-            'step-by-step guidance',
-            'practical examples',
-            'user-friendly language',
-            'actionable steps'
-        ]
-
-    def calculate_response_parameters(self, response: str) -> Dict[str, Any]:
-        """Calculate response parameters for metadata"""
-        response_lower = response.lower()
-        
-        # Check for technical terms
-        has_technical_terms = any(term in response_lower for term in self.technical_terms)
-        
-        # Check for forbidden phrases
-        has_external_references = any(phrase in response_lower for phrase in self.forbidden_phrases)
-        
-        # Check for required elements
-        has_step_by_step = any('step' in response_lower or 'first' in response_lower or 'next' in response_lower)
-        has_practical_examples = any('example' in response_lower or 'for instance' in response_lower or 'like' in response_lower)
-        uses_simple_language = not has_technical_terms and len(response.split()) > 0
-        has_actionable_steps = has_step_by_step and any('do this' in response_lower or 'follow these' in response_lower)
-        
-        # Calculate quality score (0-1)
-        quality_score = 0.0
-        if not has_technical_terms: quality_score += 0.2
-        if not has_external_references: quality_score += 0.2
-        if has_step_by_step: quality_score += 0.2
-        if has_practical_examples: quality_score += 0.2
-        if has_actionable_steps: quality_score += 0.2
-        
-        return {
-            "is_user_friendly": not has_technical_terms and not has_external_references,
-            "has_step_by_step_guidance": has_step_by_step,
-            "has_practical_examples": has_practical_examples,
-            "uses_simple_language": uses_simple_language,
-            "has_actionable_steps": has_actionable_steps,
-            "is_self_contained": not has_external_references,
-            "has_external_references": has_external_references,
-            "has_technical_terms": has_technical_terms,
-            "response_length": len(response),
-            "has_error_handling": "error" in response_lower or "if something goes wrong" in response_lower,
-            "quality_score": quality_score,
-            "validation_status": "valid" if quality_score >= 0.8 else "needs_improvement"
-        }
-
-    def validate_quality(self, example: Dict[str, Any]) -> bool:
-        """Validate the quality of a generated example."""
-        try:
-            # Check required fields
-            required_fields = ['tool', 'intent', 'query', 'response', 'systems', 'workflow']
-            if not all(field in example for field in required_fields):
-                return False
-
-            # Check response length
-            if len(example['response']) < 50:
-                return False
-
-            # Calculate response parameters
-            response_params = self.calculate_response_parameters(example['response'])
-            
-            # Update example metadata with response parameters
-            if 'metadata' not in example:
-                example['metadata'] = {}
-            example['metadata'].update(response_params)
-
-            # Check for technical terms in response
-            if response_params['has_technical_terms']:
-                return False
-
-            # Check for forbidden phrases
-            if response_params['has_external_references']:
-                return False
-
-            # Check for required elements
-            if not response_params['has_step_by_step_guidance']:
-                return False
-
-            # Check workflow structure
-            if not isinstance(example['workflow'], list):
-                return False
-
-            # Check each step in workflow
-            for step in example['workflow']:
-                if not isinstance(step, dict):
-                    return False
-                if 'action' not in step or 'parameters' not in step:
-                    return False
-                if not isinstance(step['parameters'], dict):
-                    return False
-
-            return True
-
-        except Exception as e:
-            print(f"Error validating example: {str(e)}")
-            return False
-
-    @staticmethod
-    def log_quality_metrics(example: Dict, model: str):
-        """Log quality metrics for monitoring."""
-        metrics = {
-            'timestamp': datetime.now().isoformat(),
-            'model': model,
-            'response_length': len(example['response']),
-            'has_execution_details': bool(example.get('execution_details')),
-            'is_user_friendly': not any(term in example['response'].lower() for term in ['api', 'endpoint', 'authentication', 'token']),
-            'has_error_handling': 'error_handling' in example.get('execution_details', {})
-        }
-        
-        os.makedirs(QUALITY_MONITORING_DIR, exist_ok=True)
-        metrics_file = os.path.join(QUALITY_MONITORING_DIR, 'quality_metrics.jsonl')
-        
-        with open(metrics_file, 'a') as f:
-            f.write(json.dumps(metrics) + '\n')
-
 class TrainingGenerator:
     def __init__(self):
         self.validator = QualityValidator()
         self.client = Together(api_key=TOGETHER_API_KEY)
+        self.async_client = AsyncTogether(api_key=TOGETHER_API_KEY)
+        # Adaptive limiters shared with every other generator process on this machine
+        self.generation_limiter = get_rate_limiter("together", GENERATION_MODEL)
+        self.cross_service_limiter = get_rate_limiter("together", MODELS['mistral'])
         self.system_prompt = """You are helping generate realistic training data for a comprehensive business operations management system.
         Generate realistic queries from the perspective of founders and executives using this system to manage their entire business operations through a unified chat interface.
         
@@ -341,6 +209,8 @@ class TrainingGenerator:
         self.valid_examples = 0
         self.gpt4_examples = 0
         self.supabase = supabase
+        # Loaded once per process and shared by every generator instance
+        self.endpoint_catalog = get_endpoint_catalog(supabase)
         
     def get_system_prompt(self, tool: str, intent: str) -> str:
         """Get the system prompt for a specific tool and intent."""
@@ -380,21 +250,13 @@ class TrainingGenerator:
         """Generate a batch of examples for a given tool and intent"""
         examples = []
         max_retries = 3
-        base_delay = 2  # Base delay in seconds
         
         for attempt in range(max_retries):
             try:
-                # Add exponential backoff delay between attempts
-                if attempt > 0:
-                    delay = base_delay * (2 ** (attempt - 1))
-                    print(f"Retrying after {delay} seconds...")
-                    await asyncio.sleep(delay)
-                
-                # Add a small delay between API calls to avoid rate limiting
-                await asyncio.sleep(1)
-                
-                response = await self.client.chat.completions.create(
-                    model="meta-llama/Llama-3.3-70B-Instruct-Turbo-Free",
+                # Wait for the adaptive limiter; it backs off after 429s
+                await self.generation_limiter.acquire_async()
+                raw_response = await self.async_client.chat.completions.with_raw_response.create(
+                    model=GENERATION_MODEL,
                     messages=[
                         {"role": "system", "content": self.system_prompt},
                         {"role": "user", "content": f"""Generate {count} different example user queries for {tool} with intent {intent}.
@@ -404,6 +266,12 @@ class TrainingGenerator:
                     temperature=0.7,
                     max_tokens=500
                 )
+                response = raw_response.parse()
+                usage = getattr(response, "usage", None)
+                await asyncio.to_thread(
+                    self.generation_limiter.record_success,
+                    raw_response.headers, getattr(usage, "total_tokens", 0) or 0
+                )
                 
                 if response and response.choices:
                     try:
@@ -431,6 +299,9 @@ class TrainingGenerator:
                         continue
                 
             except Exception as e:
+                limited, headers = rate_limit_info(e)
+                if limited:
+                    await asyncio.to_thread(self.generation_limiter.record_rate_limited, headers)
                 print(f"Error generating examples (attempt {attempt + 1}/{max_retries}): {str(e)}")
                 if attempt == max_retries - 1:
                     print("Max retries reached, giving up")
@@ -453,7 +324,6 @@ class TrainingGenerator:
             list: The generated examples
         """
         all_examples = []
-        tools_str = ", ".join(scenario["tools"])
         
         # Calculate number of batches needed
         num_batches = (count + batch_size - 1) // batch_size
@@ -461,82 +331,97 @@ class TrainingGenerator:
         for batch_idx in range(num_batches):
             # Calculate actual batch size (might be smaller for last batch)
             current_batch_size = min(batch_size, count - batch_idx * batch_size)
+            all_examples.extend(self.generate_cross_service_batch(
+                scenario, current_batch_size, batch_idx, num_batches, worker_id
+            ))
+        
+        return all_examples
+
+    def generate_cross_service_batch(self, scenario, batch_size, batch_idx=0, num_batches=1, worker_id=0):
+        """
+        Generate a single batch of cross-service examples
+        
+        Args:
+            scenario (dict): The scenario information
+            batch_size (int): Number of examples in this batch
+            batch_idx (int): Index of this batch, for logging
+            num_batches (int): Total number of batches, for logging
+            worker_id (int): ID of the caller, for logging
             
-            system_prompt = f"""
-            You are helping generate realistic training data for a multi-service assistant.
-            Generate {current_batch_size} different realistic user queries that require using multiple services: {tools_str}.
-            These queries should be for the scenario: {scenario["name"]} - {scenario["description"]}
+        Returns:
+            list: The generated examples (empty on failure)
+        """
+        tools_str = ", ".join(scenario["tools"])
+        content = ""
+        
+        system_prompt = f"""
+        You are helping generate realistic training data for a multi-service assistant.
+        Generate {batch_size} different realistic user queries that require using multiple services: {tools_str}.
+        These queries should be for the scenario: {scenario["name"]} - {scenario["description"]}
+        
+        For each query, also provide a professional, helpful response that addresses the query.
+        Format your response as a JSON array where each item has "query" and "response" fields.
+        
+        Make sure each query explicitly mentions at least 2 of these services: {tools_str}.
+        The queries should have diverse wording, specificity, and complexity.
+        """
+        
+        try:
+            # Call Together AI API
+            headers = {
+                "Authorization": f"Bearer {TOGETHER_API_KEY}",
+                "Content-Type": "application/json"
+            }
             
-            For each query, also provide a professional, helpful response that addresses the query.
-            Format your response as a JSON array where each item has "query" and "response" fields.
+            data = {
+                "model": MODELS['mistral'],
+                "prompt": f"<system>{system_prompt}</system><user>Generate {batch_size} cross-service queries for scenario: {scenario['name']}</user><assistant>",
+                "temperature": TEMPERATURE,
+                "max_tokens": 2500,
+                "stop": ["</assistant>"]
+            }
             
-            Make sure each query explicitly mentions at least 2 of these services: {tools_str}.
-            The queries should have diverse wording, specificity, and complexity.
-            """
+            response = self.cross_service_limiter.call(
+                get_session().post,
+                "https://api.together.xyz/inference",
+                headers=headers,
+                json=data,
+                timeout=HTTP_TIMEOUT
+            )
             
-            try:
-                # Call Together AI API
-                headers = {
-                    "Authorization": f"Bearer {TOGETHER_API_KEY}",
-                    "Content-Type": "application/json"
-                }
-                
-                data = {
-                    "model": MODELS['mistral'],
-                    "prompt": f"<system>{system_prompt}</system><user>Generate {current_batch_size} cross-service queries for scenario: {scenario['name']}</user><assistant>",
-                    "temperature": TEMPERATURE,
-                    "max_tokens": 2500,
-                    "stop": ["</assistant>"]
-                }
-                
-                response = requests.post(
-                    "https://api.together.xyz/inference",
-                    headers=headers,
-                    json=data
-                )
+            if response.status_code != 200:
+                print(f"Worker {worker_id}: API call failed with status {response.status_code}: {response.text}")
+                return []
                 
-                if response.status_code != 200:
-                    print(f"Worker {worker_id}: API call failed with status {response.status_code}: {response.text}")
-                    continue
-                    
-                # Parse response
-                try:
-                    content = response.json()["output"]["choices"][0]["text"]
-                    examples_json = json.loads(content)
-                    
-                    # Extract examples
-                    if "examples" in examples_json:
-                        batch_examples = examples_json["examples"]
-                    else:
-                        # Sometimes the model returns an array directly
-                        batch_examples = examples_json.get("data", [])
-                        if not batch_examples and isinstance(examples_json, list):
-                            batch_examples = examples_json
-                    
-                    # Add metadata
-                    for example in batch_examples:
-                        example["scenario"] = scenario["name"]
-                        example["tools"] = scenario["tools"]
-                        example["created_at"] = datetime.now().isoformat()
-                        example["is_multi_service"] = True
-                    
-                    all_examples.extend(batch_examples)
-                    
-                    print(f"Worker {worker_id}: Generated {len(batch_examples)} examples for scenario {scenario['name']} (Batch {batch_idx+1}/{num_batches})")
-                    
-                except json.JSONDecodeError as e:
-                    print(f"Worker {worker_id}: Failed to parse response as JSON: {str(e)}")
-                    print(f"Raw response: {content}")
-                    continue
-                
-                # Small pause to avoid rate limits
-                time.sleep(0.2)
-                
-            except Exception as e:
-                print(f"Worker {worker_id}: Error generating examples for scenario {scenario['name']} (Batch {batch_idx+1}): {str(e)}")
-                time.sleep(1)  # Wait a bit longer on error
-        
-        return all_examples
+            # Parse response
+            content = response.json()["output"]["choices"][0]["text"]
+            examples_json = json.loads(content)
+            
+            # Extract examples
+            if isinstance(examples_json, list):
+                batch_examples = examples_json
+            elif "examples" in examples_json:
+                batch_examples = examples_json["examples"]
+            else:
+                batch_examples = examples_json.get("data", [])
+            
+            # Add metadata
+            for example in batch_examples:
+                example["scenario"] = scenario["name"]
+                example["tools"] = scenario["tools"]
+                example["created_at"] = datetime.now().isoformat()
+                example["is_multi_service"] = True
+            
+            print(f"Worker {worker_id}: Generated {len(batch_examples)} examples for scenario {scenario['name']} (Batch {batch_idx+1}/{num_batches})")
+            return batch_examples
+            
+        except json.JSONDecodeError as e:
+            print(f"Worker {worker_id}: Failed to parse response as JSON: {str(e)}")
+            print(f"Raw response: {content}")
+            return []
+        except Exception as e:
+            print(f"Worker {worker_id}: Error generating examples for scenario {scenario['name']} (Batch {batch_idx+1}): {str(e)}")
+            return []
 
     def print_quality_report(self):
         """Print a quality report of the generated data."""
@@ -611,24 +496,8 @@ class TrainingGenerator:
     def get_endpoints_for_tool_intent(self, tool: str, intent: str) -> List[Dict[str, Any]]:
         """Retrieve endpoints from api_endpoints table for the given tool and intent."""
         try:
-            # Query the api_endpoints table
-            result = self.supabase.table('api_endpoints').select("*").eq('service', tool).execute()
-            
-            if result.data:
-                # Filter endpoints based on intent
-                intent_keywords = intent.lower().split()
-                matching_endpoints = []
-                
-                for endpoint in result.data:
-                    # Check if endpoint matches intent
-                    if any(keyword in endpoint['action'].lower() or 
-                          keyword in endpoint['resource'].lower() 
-                          for keyword in intent_keywords):
-                        matching_endpoints.append(endpoint)
-                
-                return matching_endpoints
-            
-            return []
+            # Served from the indexed process-local catalog; no round-trip once loaded
+            return self.endpoint_catalog.endpoints_for(tool, intent)
             
         except Exception as e:
             logging.error(f"Error retrieving endpoints for {tool}/{intent}: {str(e)}")
@@ -923,109 +792,28 @@ def store_system_context():
         raise
 
 def store_api_endpoints():
-    """Store API endpoints and their details in Supabase."""
+    """Sync API endpoints and their details into Supabase, skipping unchanged rows."""
     try:
-        logging.info("Importing endpoints from api_endpoints.py...")
-        from api_endpoints import (
-            SHOPIFY_ENDPOINTS,
-            KLAVIYO_ENDPOINTS,
-            POSTSCRIPT_ENDPOINTS,
-            GORGIAS_ENDPOINTS,
-            NORTHBEAM_ENDPOINTS,
-            TRIPLE_WHALE_ENDPOINTS,
-            ELEVAR_ENDPOINTS,
-            NOTION_ENDPOINTS,
-            GOOGLE_CALENDAR_ENDPOINTS,
-            ASANA_ENDPOINTS,
-            GOOGLE_DRIVE_ENDPOINTS,
-            FIGMA_ENDPOINTS,
-            SLACK_ENDPOINTS
-        )
-        logging.info("Endpoints imported successfully")
-        
-        # Process each service's endpoints
-        all_endpoints = [
-            ("Shopify", SHOPIFY_ENDPOINTS),
-            ("Klaviyo", KLAVIYO_ENDPOINTS),
-            ("Postscript", POSTSCRIPT_ENDPOINTS),
-            ("Gorgias", GORGIAS_ENDPOINTS),
-            ("Northbeam", NORTHBEAM_ENDPOINTS),
-            ("Triple Whale", TRIPLE_WHALE_ENDPOINTS),
-            ("Elevar", ELEVAR_ENDPOINTS),
-            ("Notion", NOTION_ENDPOINTS),
-            ("Google Calendar", GOOGLE_CALENDAR_ENDPOINTS),
-            ("Asana", ASANA_ENDPOINTS),
-            ("Google Drive", GOOGLE_DRIVE_ENDPOINTS),
-            ("Figma", FIGMA_ENDPOINTS),
-            ("Slack", SLACK_ENDPOINTS)
+        services = [
+            "Shopify",
+            "Klaviyo",
+            "Postscript",
+            "Gorgias",
+            "Northbeam",
+            "Triple Whale",
+            "Elevar",
+            "Notion",
+            "Google Calendar",
+            "Asana",
+            "Google Drive",
+            "Figma",
+            "Slack"
         ]
-        
-        total_endpoints = 0
-        for service_name, service_endpoints in all_endpoints:
-            logging.info(f"Processing endpoints for {service_name}...")
-            for category, category_endpoints in service_endpoints.items():
-                for action, endpoint_data in category_endpoints.items():
-                    try:
-                        # Construct full endpoint URL
-                        base_url = {
-                            "Shopify": "https://{shop_name}.myshopify.com",
-                            "Klaviyo": "https://a.klaviyo.com",
-                            "Postscript": "https://api.postscript.io",
-                            "Gorgias": "https://api.gorgias.com",
-                            "Northbeam": "https://api.northbeam.io",
-                            "Triple Whale": "https://api.triplewhale.com",
-                            "Elevar": "https://api.getelevar.com",
-                            "Notion": "https://api.notion.com",
-                            "Google Calendar": "https://www.googleapis.com/calendar/v3",
-                            "Asana": "https://app.asana.com/api/1.0",
-                            "Google Drive": "https://www.googleapis.com/drive/v3",
-                            "Figma": "https://api.figma.com/v1",
-                            "Slack": "https://slack.com/api"
-                        }.get(service_name, f"https://{service_name.lower().replace(' ', '')}.com")
-                        
-                        endpoint = f"{base_url}{endpoint_data['path']}"
-                        
-                        # Prepare parameters
-                        parameters = endpoint_data.get('parameters', {})
-                        
-                        # Get authentication details
-                        auth = endpoint_data.get('auth', {})
-                        auth_type = auth.get('type', 'Unknown')
-                        
-                        # Get rate limit
-                        rate_limit = endpoint_data.get('rate_limit', 'Not specified')
-                        
-                        # Get response format if available
-                        response_format = endpoint_data.get('response_format', {})
-                        
-                        # Insert or update endpoint using Supabase upsert
-                        data = {
-                            "service": service_name,
-                            "resource": category,
-                            "action": action,
-                            "method": endpoint_data['method'],
-                            "path": endpoint_data['path'],
-                            "parameters": parameters,
-                            "auth_type": auth_type,
-                            "auth_key": auth.get('key', 'Unknown'),
-                            "rate_limit": rate_limit,
-                            "created_at": datetime.now().isoformat()
-                        }
-                        
-                        result = supabase.table('api_endpoints').upsert(data).execute()
-                        total_endpoints += 1
-                        
-                    except Exception as e:
-                        logging.error(f"Error processing endpoint for {service_name} - {category} - {action}: {str(e)}")
-                        continue
-        
-        logging.info(f"Successfully stored {total_endpoints} API endpoints for all services")
-        
-        # Verify the data was stored
-        result = supabase.table('api_endpoints').select('count').execute()
-        count = result.data[0]['count'] if result.data else 0
-        logging.info(f"Total endpoints in database: {count}")
-        
+
+        stats = sync_endpoints(supabase, services)
+        logging.info(f"Successfully stored {stats['inserted'] + stats['updated']} API endpoints for all services "
+                     f"({stats['skipped']} unchanged skipped, {stats['deleted']} removed)")
+
     except Exception as e:
         logging.error(f"Error storing API endpoints: {str(e)}")
         raise
@@ -1108,16 +896,80 @@ def insert_examples_to_db(examples: List[Dict]) -> int:
         logging.error(f"Data that failed to store: {training_data}")
         return 0
 
-def worker_process(worker_id, work_items, examples_per_item, batch_size, output_dir):
+def work_item_key(item):
+    """Stable spool key for a (tool, intent) tuple or scenario dict"""
+    if isinstance(item, tuple):
+        tool, intent = item
+        return f"{tool}/{intent}"
+    return f"scenario/{item['name']}"
+
+def build_generation_jobs(generator, work_items, examples_per_item, batch_size, spool=None):
+    """
+    Split work items into one scheduler job per LLM call
+    
+    Args:
+        generator (TrainingGenerator): Generator used to make the calls
+        work_items (list): List of (tool, intent) tuples or scenario dicts to process
+        examples_per_item (int): Number of examples to generate per work item
+        batch_size (int): Number of examples requested per LLM call
+        spool (GenerationSpool): If given, batches already in the spool are skipped
+            and each new batch is recorded as soon as it completes
+        
+    Returns:
+        tuple: (jobs, owners) where owners[i] is the work item for jobs[i]
+    """
+    jobs = []
+    owners = []
+    num_batches = (examples_per_item + batch_size - 1) // batch_size
+    
+    for item in work_items:
+        work_key = work_item_key(item)
+        for batch_idx in range(num_batches):
+            if spool is not None and spool.is_generated(work_key, batch_idx):
+                continue
+            count = min(batch_size, examples_per_item - batch_idx * batch_size)
+            if isinstance(item, tuple):
+                # Single-service batch via the async Together client
+                tool, intent = item
+                key = ("together", GENERATION_MODEL)
+                factory = (lambda t=tool, i=intent, c=count:
+                           generator.generate_examples_batch(t, i, c))
+            else:
+                # Cross-service batch uses the blocking HTTP client, so run it in a thread
+                key = ("together", MODELS['mistral'])
+                factory = (lambda sc=item, c=count, b=batch_idx:
+                           asyncio.to_thread(generator.generate_cross_service_batch, sc, c, b, num_batches))
+            if spool is not None:
+                factory = _spooled_factory(spool, factory, work_key, batch_idx)
+            jobs.append((key, factory))
+            owners.append(item)
+    
+    return jobs, owners
+
+def _spooled_factory(spool, factory, work_key, batch_idx):
+    async def run():
+        batch = await factory()
+        if batch:
+            spool.record_generated(work_key, batch_idx, batch)
+        return batch
+    return run
+
+async def generate_work_items(work_items, examples_per_item, batch_size, output_dir,
+                              concurrency=DEFAULT_CONCURRENCY,
+                              requests_per_second=DEFAULT_REQUESTS_PER_SECOND,
+                              spool=None):
     """
-    Worker process that generates examples for assigned work items
+    Generate examples for all work items from a single asyncio scheduler
     
     Args:
-        worker_id (int): ID of this worker process
         work_items (list): List of (tool, intent) tuples or scenario dicts to process
         examples_per_item (int): Number of examples to generate per work item
         batch_size (int): Batch size for API calls
         output_dir (str): Directory to save output files
+        concurrency (int): Maximum number of LLM requests in flight
+        requests_per_second (float): Default token bucket rate per provider/model
+        spool (GenerationSpool): Spool recording completed batches; pass one opened
+            with resume=True to skip batches generated by an earlier run
         
     Returns:
         int: Count of examples generated
@@ -1125,48 +977,70 @@ def worker_process(worker_id, work_items, examples_per_item, batch_size, output_
     # Ensure the output directory exists
     os.makedirs(output_dir, exist_ok=True)
     
-    total_examples = 0
+    generator = TrainingGenerator()
+    scheduler = GenerationScheduler(
+        concurrency=concurrency,
+        default_rate=requests_per_second
+    )
+    if spool is None:
+        spool = GenerationSpool.open("parallel_training_generator")
+    jobs, owners = build_generation_jobs(generator, work_items, examples_per_item, batch_size, spool)
+    logging.info(f"Scheduling {len(jobs)} generation calls for {len(work_items)} work items "
+                 f"(spool run {spool.run_id})")
     
-    # Process each assigned work item
-    for idx, item in enumerate(work_items):
-        examples = []
-        
-        if isinstance(item, tuple):
-            # Single-service example
-            tool, intent = item
-            print(f"Worker {worker_id}: Starting generation for {tool} - {intent} ({idx+1}/{len(work_items)})")
-            examples = generate_examples_batch(
-                tool, intent, examples_per_item, batch_size, worker_id
-            )
-            
-            # Save to a tool-intent specific file
-            if examples:
-                output_file = os.path.join(output_dir, f"worker{worker_id}_{tool}_{intent.replace(' ', '_')}_{len(examples)}.json")
-                with open(output_file, 'w') as f:
-                    json.dump(examples, f, indent=2)
-                
-                total_examples += len(examples)
+    await scheduler.run(jobs)
+    
+    # Collect every spooled batch, including those from a resumed run, by work item
+    num_batches = (examples_per_item + batch_size - 1) // batch_size
+    examples_by_item = {}
+    for item in work_items:
+        key = item if isinstance(item, tuple) else item['name']
+        for batch_idx in range(num_batches):
+            batch = spool.get_rows(work_item_key(item), batch_idx)
+            examples_by_item.setdefault(key, []).extend(batch or [])
+    
+    total_examples = 0
+    for key, examples in examples_by_item.items():
+        if not examples:
+            continue
+        if isinstance(key, tuple):
+            tool, intent = key
+            file_name = f"{tool}_{intent.replace(' ', '_')}_{len(examples)}.json"
         else:
-            # Cross-service example
-            scenario = item
-            print(f"Worker {worker_id}: Starting generation for scenario {scenario['name']} ({idx+1}/{len(work_items)})")
-            examples = generate_cross_service_examples(
-                scenario, examples_per_item, batch_size, worker_id
-            )
-            
-            # Save to a scenario-specific file
-            if examples:
-                output_file = os.path.join(output_dir, f"worker{worker_id}_scenario_{scenario['name'].replace(' ', '_')}_{len(examples)}.json")
-                with open(output_file, 'w') as f:
-                    json.dump(examples, f, indent=2)
-                
-                total_examples += len(examples)
-        
-        # Small delay between work items to avoid rate limits
-        time.sleep(0.5)
+            file_name = f"scenario_{key.replace(' ', '_')}_{len(examples)}.json"
+        with open(os.path.join(output_dir, file_name), 'w') as f:
+            json.dump(examples, f, indent=2)
+        total_examples += len(examples)
     
     return total_examples
 
+def insert_spooled_batches(spool):
+    """
+    Insert every spooled batch that has not been inserted yet
+    
+    Args:
+        spool (GenerationSpool): Spool for the current run
+        
+    Returns:
+        int: Total number of examples inserted
+    """
+    total_inserted = 0
+    for work_key, batch_idx, examples in spool.pending_inserts():
+        try:
+            inserted = insert_examples_to_db(examples)
+        except Exception as e:
+            logging.error(f"Error inserting batch {batch_idx} of {work_key}: {str(e)}")
+            continue
+        # Only a fully written batch counts; otherwise the next --resume sends it again
+        if inserted == len(examples):
+            spool.mark_inserted(work_key, batch_idx, inserted)
+        else:
+            logging.warning(f"Batch {batch_idx} of {work_key} only inserted {inserted}/{len(examples)} examples; "
+                            f"left pending in the spool")
+        total_inserted += inserted
+        print(f"Inserted {inserted} examples from batch {batch_idx} of {work_key}")
+    return total_inserted
+
 def process_output_files(output_dir):
     """
     Process all output files and insert them into the database
@@ -1209,40 +1083,29 @@ def process_output_files(output_dir):
         logging.error(f"Error processing output files: {str(e)}")
         return 0
 
-def distribute_work(num_workers, include_cross_service=True):
+def build_work_items(include_cross_service=True):
     """
-    Distribute work items among workers
+    Build the list of all work items
     
     Args:
-        num_workers (int): Number of worker processes
         include_cross_service (bool): Whether to include cross-service scenarios
         
     Returns:
-        list: List of work items for each worker
+        list: (tool, intent) tuples and scenario dicts, shuffled
     """
     # Create a list of all possible (tool, intent) combinations
-    single_service_work = []
+    all_work = []
     for tool, intents in TOOL_INTENTS.items():
         for intent in intents:
-            single_service_work.append((tool, intent))
-    
-    # Shuffle to distribute work evenly
-    random.shuffle(single_service_work)
+            all_work.append((tool, intent))
     
     # Add cross-service scenarios if requested
-    all_work = single_service_work.copy()
     if include_cross_service:
         all_work.extend(CROSS_SERVICE_SCENARIOS)
-        random.shuffle(all_work)
     
-    # Distribute work among workers
-    work_per_worker = []
-    for i in range(num_workers):
-        # Each worker gets approximately the same number of items
-        worker_items = [item for idx, item in enumerate(all_work) if idx % num_workers == i]
-        work_per_worker.append(worker_items)
-    
-    return work_per_worker
+    # Shuffle to mix providers/models across the run
+    random.shuffle(all_work)
+    return all_work
 
 def test_llama_model():
     """Test the Llama model with a simple query."""
@@ -1263,8 +1126,8 @@ def test_llama_model():
             "stop": ["</assistant>"]
         }
         
-        # Add timeout to the request
-        response = requests.post(
+        # Add timeout to the request (pooled session so the connection is reused afterwards)
+        response = get_session().post(
             "https://api.together.xyz/inference",
             headers=headers,
             json=data,
@@ -1285,7 +1148,7 @@ def test_llama_model():
         logging.error(f"Error testing model: {str(e)}")
         return False
 
-def main():
+def main(args):
     """Main function to test and generate training data."""
     try:
         logging.info("\n=== Starting Training Data Generator ===")
@@ -1306,37 +1169,39 @@ def main():
         logging.info("\n=== Storing System Context and Rules ===")
         store_system_context()
         
-        # Generate and store training data
-        generator = TrainingGenerator()
+        # Generate examples for every work item from one scheduler
+        work_items = build_work_items(include_cross_service=not args.no_cross_service)
+        if args.tools:
+            work_items = [
+                item for item in work_items
+                if set([item[0]] if isinstance(item, tuple) else item["tools"]) & set(args.tools)
+            ]
+        logging.info(f"\n=== Generating {args.examples} examples for {len(work_items)} work items ===")
         
-        # Generate examples for Shopify - Check Order Status
-        tool = "Shopify"
-        intent = "Check Order Status"
-        logging.info(f"\nGenerating examples for {tool} - {intent}")
+        spool = GenerationSpool.open("parallel_training_generator", resume=args.resume)
+        if args.resume:
+            logging.info(f"Resuming spool run {spool.run_id}: {spool.summary()}")
         
-        # Generate examples with original batch size
-        examples = generator.generate_examples_batch(tool, intent, count=5, batch_size=2)
+        start_time = time.monotonic()
+        total = asyncio.run(generate_work_items(
+            work_items,
+            args.examples,
+            args.batch_size,
+            args.output_dir,
+            concurrency=args.concurrency,
+            requests_per_second=args.rps,
+            spool=spool
+        ))
+        elapsed = time.monotonic() - start_time
+        logging.info(f"Generated {total} examples in {elapsed:.1f}s ({total / max(elapsed, 1e-9):.2f} examples/s)")
+        for limiter_model in (GENERATION_MODEL, MODELS['mistral']):
+            logging.info(get_rate_limiter("together", limiter_model).format_stats())
         
-        if examples:
-            # Save to file
-            output_file = os.path.join(OUTPUT_DIR, f"{tool}_{intent.replace(' ', '_')}_{len(examples)}.json")
-            with open(output_file, 'w') as f:
-                json.dump(examples, f, indent=2)
-            logging.info(f"Saved examples to: {output_file}")
-            
-            # Insert into Supabase
-            inserted = insert_examples_to_db(examples)
-            logging.info(f"Inserted {inserted} examples for {tool} - {intent}")
-            
-            # Print the generated examples for verification
-            logging.info("\nGenerated Examples:")
-            for i, example in enumerate(examples, 1):
-                logging.info(f"\nExample {i}:")
-                logging.info(f"Query: {example['query']}")
-                logging.info(f"Response: {example['response']}")
-                logging.info(f"Follow-up: {example.get('follow_up', False)}")
-        else:
-            logging.warning(f"No examples were generated for {tool} - {intent}")
+        # Insert into Supabase
+        if args.insert:
+            inserted = insert_spooled_batches(spool)
+            logging.info(f"Inserted {inserted} examples")
+        spool.close()
             
     except Exception as e:
         logging.error(f"Error: {str(e)}")
@@ -1354,8 +1219,29 @@ if __name__ == "__main__":
         ]
     )
     
+    parser = argparse.ArgumentParser(description="Parallel MCP training data generator")
+    parser.add_argument("--examples", type=int, default=5,
+                        help="Number of examples to generate per work item")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE,
+                        help="Number of examples requested per LLM call")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+                        help="Maximum number of LLM requests in flight")
+    parser.add_argument("--rps", type=float, default=DEFAULT_REQUESTS_PER_SECOND,
+                        help="Default requests per second per provider/model")
+    parser.add_argument("--tools", nargs="+",
+                        help="Only generate for specific tools (space-separated)")
+    parser.add_argument("--no-cross-service", action="store_true",
+                        help="Skip cross-service scenarios")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR,
+                        help="Directory to save generated examples")
+    parser.add_argument("--insert", action="store_true",
+                        help="Insert generated examples into Supabase when done")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume the last run from the generation spool, skipping completed batches")
+    args = parser.parse_args()
+    
     try:
-        main()
+        main(args)
     except KeyboardInterrupt:
         logging.info("\nScript interrupted by user")
     except Exception as e:
@@ -0,0 +1,212 @@
+"""
+Buffered quality metrics sink
+
+QualityValidator.log_quality_metrics used to open quality_metrics.jsonl,
+append one line and close it for every example, which serialized workers on
+filesystem syscalls and interleaved lines across processes. MetricsSink
+instead:
+- buffers metrics in memory and flushes every `flush_every` records or
+  `flush_interval` seconds (from a background thread), and at exit
+- writes one shard per process (quality_metrics.<host>.<pid>.jsonl), so
+  writers never share a file
+- optionally gzip-compresses shards (QUALITY_METRICS_FORMAT=jsonl.gz); each
+  flush appends a gzip member, which gzip readers concatenate transparently;
+  flushes are serialized, so members (and lines) never interleave
+
+iter_metrics() streams records from every shard (and the legacy single
+file), and aggregate_metrics() summarizes them without loading every line
+into memory.
+
+Usage:
+    get_metrics_sink().write({"model": "...", "response_length": 512, ...})
+    print(aggregate_metrics())
+
+    python quality_metrics.py --dir quality_monitoring
+"""
+
+import argparse
+import atexit
+import glob
+import gzip
+import json
+import multiprocessing.util
+import os
+import socket
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Iterator, List, Optional
+
+QUALITY_MONITORING_DIR = "quality_monitoring"
+METRICS_FORMAT = os.getenv("QUALITY_METRICS_FORMAT", "jsonl")  # "jsonl" or "jsonl.gz"
+FLUSH_EVERY = int(os.getenv("QUALITY_METRICS_FLUSH_EVERY", "500"))
+FLUSH_INTERVAL_SECONDS = float(os.getenv("QUALITY_METRICS_FLUSH_INTERVAL", "5"))
+LEGACY_METRICS_FILE = "quality_metrics.jsonl"
+
+class MetricsSink:
+    """
+    Per-process buffered writer for metric records.
+
+    Args:
+        directory (str): Directory holding the shards
+        metrics_format (str): "jsonl" or "jsonl.gz"
+        flush_every (int): Flush once this many records are buffered
+        flush_interval (float): Flush buffered records at least this often, in seconds
+    """
+
+    def __init__(self, directory: str = QUALITY_MONITORING_DIR, metrics_format: str = METRICS_FORMAT,
+                 flush_every: int = FLUSH_EVERY, flush_interval: float = FLUSH_INTERVAL_SECONDS):
+        if metrics_format not in ("jsonl", "jsonl.gz"):
+            raise ValueError(f"Unsupported metrics format: {metrics_format}")
+        self.directory = directory
+        self.metrics_format = metrics_format
+        self.flush_every = flush_every
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._reset()
+        atexit.register(self.close)
+
+    def _reset(self):
+        """(Re)initialize per-process state; also runs in forked children"""
+        self._pid = os.getpid()
+        self._buffer: List[str] = []
+        # Held while a flush takes the buffer and appends it, so concurrent
+        # flushes write whole batches in order (taken before _lock)
+        self._write_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.path = os.path.join(
+            self.directory,
+            f"quality_metrics.{socket.gethostname()}.{self._pid}.{self.metrics_format}"
+        )
+        # multiprocessing workers leave via os._exit, which skips atexit handlers
+        multiprocessing.util.Finalize(self, self.flush, exitpriority=10)
+
+    def _ensure_flusher(self):
+        if self._pid != os.getpid():
+            # Forked: drop the parent's buffer and write to our own shard
+            self._reset()
+        if self._thread is None and self.flush_interval > 0:
+            self._thread = threading.Thread(target=self._flush_periodically, daemon=True)
+            self._thread.start()
+
+    def _flush_periodically(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def write(self, record: Dict[str, Any]):
+        """Buffer one metrics record"""
+        line = json.dumps(record) + "\n"
+        with self._lock:
+            self._ensure_flusher()
+            self._buffer.append(line)
+            if len(self._buffer) < self.flush_every:
+                return
+        self.flush()
+
+    def flush(self):
+        """Write out everything buffered so far"""
+        if self._pid != os.getpid():
+            return
+        with self._write_lock:
+            with self._lock:
+                lines, self._buffer = self._buffer, []
+            self._write_lines(lines)
+
+    def _write_lines(self, lines: List[str]):
+        if not lines:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        data = "".join(lines).encode("utf-8")
+        if self.metrics_format == "jsonl.gz":
+            data = gzip.compress(data)
+        with open(self.path, "ab") as f:
+            f.write(data)
+
+    def close(self):
+        self._stop.set()
+        self.flush()
+
+_sink: Optional[MetricsSink] = None
+_sink_lock = threading.Lock()
+
+def get_metrics_sink() -> MetricsSink:
+    """Return the process-wide metrics sink"""
+    global _sink
+    with _sink_lock:
+        if _sink is None:
+            _sink = MetricsSink()
+        return _sink
+
+def metrics_files(directory: str = QUALITY_MONITORING_DIR) -> List[str]:
+    """Every shard in `directory`, plus the legacy single metrics file"""
+    patterns = ("quality_metrics.*.jsonl", "quality_metrics.*.jsonl.gz", LEGACY_METRICS_FILE)
+    files = set()
+    for pattern in patterns:
+        files.update(glob.glob(os.path.join(directory, pattern)))
+    return sorted(files)
+
+def iter_metrics(directory: str = QUALITY_MONITORING_DIR) -> Iterator[Dict[str, Any]]:
+    """Stream metric records from every shard, one line at a time"""
+    for path in metrics_files(directory):
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Partially written line from a crashed writer
+
+def aggregate_metrics(directory: str = QUALITY_MONITORING_DIR) -> Dict[str, Any]:
+    """
+    Summarize all metrics in a single streaming pass.
+
+    Returns:
+        dict: Overall and per-model counts, average response length and the
+        rate of each boolean metric
+    """
+    def new_bucket():
+        return {"count": 0, "response_length_total": 0, "true_counts": defaultdict(int)}
+
+    overall = new_bucket()
+    by_model = defaultdict(new_bucket)
+    first_seen = last_seen = None
+
+    for record in iter_metrics(directory):
+        timestamp = record.get("timestamp")
+        if timestamp:
+            first_seen = timestamp if first_seen is None else min(first_seen, timestamp)
+            last_seen = timestamp if last_seen is None else max(last_seen, timestamp)
+        for bucket in (overall, by_model[record.get("model", "unknown")]):
+            bucket["count"] += 1
+            bucket["response_length_total"] += record.get("response_length", 0) or 0
+            for key, value in record.items():
+                if isinstance(value, bool):
+                    bucket["true_counts"][key] += value
+
+    def finish(bucket):
+        count = bucket["count"]
+        return {
+            "count": count,
+            "average_response_length": round(bucket["response_length_total"] / count, 1) if count else 0,
+            "rates": {key: round(value / count, 4) for key, value in sorted(bucket["true_counts"].items())}
+        }
+
+    return {
+        "files": len(metrics_files(directory)),
+        "first_timestamp": first_seen,
+        "last_timestamp": last_seen,
+        **finish(overall),
+        "by_model": {model: finish(bucket) for model, bucket in sorted(by_model.items())}
+    }
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Aggregate quality metrics shards")
+    parser.add_argument("--dir", default=QUALITY_MONITORING_DIR, help="Directory holding the metrics shards")
+    args = parser.parse_args()
+    start = time.perf_counter()
+    print(json.dumps(aggregate_metrics(args.dir), indent=2))
+    print(f"Aggregated in {time.perf_counter() - start:.2f}s")
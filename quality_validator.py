@@ -0,0 +1,246 @@
+"""
+Quality validation for generated training examples
+
+QualityValidator scores generated responses (technical jargon, external
+references, step-by-step guidance, examples, ...). All phrase lists are
+compiled into one PhraseMatcher per validator, so every flag for a response
+comes out of a single regex pass instead of one substring scan per
+phrase.
+
+Kept free of Supabase/Together setup so it can be imported by benchmarks and
+other generators without credentials.
+"""
+
+import re
+from datetime import datetime
+from typing import Dict, Any, FrozenSet, Iterable, Set
+
+from quality_metrics import QUALITY_MONITORING_DIR, get_metrics_sink
+
+# Maps every byte except a-z and 0-9 to a space, so that words are separated by spaces
+_WORD_TABLE = bytes(c if (48 <= c <= 57 or 97 <= c <= 122) else 32 for c in range(256))
+
+# Plural suffixes accepted after a phrase, so "step" also matches "steps"
+PLURAL_SUFFIXES = (b"", b"s", b"es")
+
+def _normalize(text: str) -> bytes:
+    """Lowercase `text` and turn punctuation, whitespace and non-ASCII characters into spaces"""
+    return text.lower().encode("utf-8").translate(_WORD_TABLE)
+
+def _trie_pattern(phrases: Iterable[bytes]) -> bytes:
+    """Regex alternation for `phrases` factored by common prefix, preferring the longest match"""
+    trie: Dict[int, Any] = {}
+    for phrase in phrases:
+        node = trie
+        for byte in phrase:
+            node = node.setdefault(byte, {})
+        node[-1] = {}  # End of phrase
+
+    def build(node) -> bytes:
+        branches = [re.escape(bytes([byte])) + build(child) for byte, child in sorted(node.items()) if byte != -1]
+        if not branches:
+            return b""
+        body = branches[0] if len(branches) == 1 else b"(?:" + b"|".join(branches) + b")"
+        return b"(?:" + body + b")?" if -1 in node else body
+
+    return build(trie)
+
+class PhraseMatcher:
+    """
+    Whole-word matcher for several phrase categories in one traversal.
+
+    All phrases are compiled into a single prefix-factored regex that runs
+    over the text once, testing only at word starts. The regex reports the
+    longest phrase starting at each word, and shorter phrases that are word
+    prefixes of it ("error" in "error handling") are credited too, so the
+    result matches testing every phrase separately. Like the substring
+    checks this replaces, words of a multi-word phrase must be separated by
+    whitespace alone.
+
+    Args:
+        categories (dict): Category name -> phrases belonging to it
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        phrase_categories: Dict[bytes, Set[str]] = {}
+        for category, phrases in categories.items():
+            for phrase in phrases:
+                key = b" ".join(_normalize(phrase).split())
+                if key:
+                    phrase_categories.setdefault(key, set()).add(category)
+
+        self.categories = frozenset(categories)
+        self._categories_for: Dict[bytes, FrozenSet[str]] = {}
+        for phrase in phrase_categories:
+            found = set()
+            for other, other_categories in phrase_categories.items():
+                if any(phrase == other + suffix or phrase.startswith(other + suffix + b" ")
+                       for suffix in PLURAL_SUFFIXES):
+                    found |= other_categories
+            self._categories_for[phrase] = frozenset(found)
+
+        self._pattern = re.compile(b" (?=(" + _trie_pattern(phrase_categories) + b")(?:e?s)? )")
+
+    def scan(self, text: str) -> Set[str]:
+        """Return the categories with at least one phrase present in `text`"""
+        found = set()
+        for phrase in set(self._pattern.findall(b" " + _normalize(text) + b" ")):
+            found |= self._categories_for[phrase]
+        return found
+
+class QualityValidator:
+    # Terms checked by log_quality_metrics for the is_user_friendly metric
+    USER_FRIENDLY_MATCHER = PhraseMatcher({"technical": ['api', 'endpoint', 'authentication', 'token']})
+
+    def __init__(self):
+        # Technical terms that should not appear in user-facing responses
+        self.technical_terms = [
+            'api', 'endpoint', 'authentication', 'token', 'request', 'implementation',
+            'integration', 'webhook', 'callback', 'sdk', 'framework', 'database',
+            'server', 'client', 'protocol', 'http', 'https', 'json', 'xml',
+            'rest', 'soap', 'oauth', 'jwt', 'cors', 'rate limit', 'timeout',
+            'error handling', 'exception', 'stack trace', 'debug', 'log',
+            'configuration', 'environment variable', 'deployment', 'hosting'
+        ]
+
+        # Phrases that should not appear in responses
+        self.forbidden_phrases = [
+            'if you need more details go to',
+            'for more information visit',
+            'check out our documentation at',
+            'refer to our docs',
+            'see our documentation',
+            'visit our website',
+            'go to our website',
+            'check our website',
+            'visit us at',
+            'go to',
+            'check out',
+            'refer to',
+            'see',
+            'visit'
+        ]
+
+        # Required elements in responses
+        self.required_elements = [
+            'clear explanation',
+            'step-by-step guidance',
+            'practical examples',
+            'user-friendly language',
+            'actionable steps'
+        ]
+
+        # Markers for the positive signals in calculate_response_parameters
+        self.step_markers = ['step', 'first', 'next']
+        self.example_markers = ['example', 'for instance', 'like']
+        self.action_markers = ['do this', 'follow these']
+        self.error_markers = ['error', 'if something goes wrong']
+
+        self.matcher = PhraseMatcher({
+            "technical": self.technical_terms,
+            "external_reference": self.forbidden_phrases,
+            "step": self.step_markers,
+            "example": self.example_markers,
+            "action": self.action_markers,
+            "error": self.error_markers
+        })
+
+    def calculate_response_parameters(self, response: str) -> Dict[str, Any]:
+        """Calculate response parameters for metadata"""
+        found = self.matcher.scan(response)
+
+        has_technical_terms = "technical" in found
+        has_external_references = "external_reference" in found
+        has_step_by_step = "step" in found
+        has_practical_examples = "example" in found
+        uses_simple_language = not has_technical_terms and len(response.split()) > 0
+        has_actionable_steps = has_step_by_step and "action" in found
+
+        # Calculate quality score (0-1)
+        quality_score = 0.0
+        if not has_technical_terms: quality_score += 0.2
+        if not has_external_references: quality_score += 0.2
+        if has_step_by_step: quality_score += 0.2
+        if has_practical_examples: quality_score += 0.2
+        if has_actionable_steps: quality_score += 0.2
+
+        return {
+            "is_user_friendly": not has_technical_terms and not has_external_references,
+            "has_step_by_step_guidance": has_step_by_step,
+            "has_practical_examples": has_practical_examples,
+            "uses_simple_language": uses_simple_language,
+            "has_actionable_steps": has_actionable_steps,
+            "is_self_contained": not has_external_references,
+            "has_external_references": has_external_references,
+            "has_technical_terms": has_technical_terms,
+            "response_length": len(response),
+            "has_error_handling": "error" in found,
+            "quality_score": quality_score,
+            "validation_status": "valid" if quality_score >= 0.8 else "needs_improvement"
+        }
+
+    def validate_quality(self, example: Dict[str, Any]) -> bool:
+        """Validate the quality of a generated example."""
+        try:
+            # Check required fields
+            required_fields = ['tool', 'intent', 'query', 'response', 'systems', 'workflow']
+            if not all(field in example for field in required_fields):
+                return False
+
+            # Check response length
+            if len(example['response']) < 50:
+                return False
+
+            # Calculate response parameters
+            response_params = self.calculate_response_parameters(example['response'])
+
+            # Update example metadata with response parameters
+            if 'metadata' not in example:
+                example['metadata'] = {}
+            example['metadata'].update(response_params)
+
+            # Check for technical terms in response
+            if response_params['has_technical_terms']:
+                return False
+
+            # Check for forbidden phrases
+            if response_params['has_external_references']:
+                return False
+
+            # Check for required elements
+            if not response_params['has_step_by_step_guidance']:
+                return False
+
+            # Check workflow structure
+            if not isinstance(example['workflow'], list):
+                return False
+
+            # Check each step in workflow
+            for step in example['workflow']:
+                if not isinstance(step, dict):
+                    return False
+                if 'action' not in step or 'parameters' not in step:
+                    return False
+                if not isinstance(step['parameters'], dict):
+                    return False
+
+            return True
+
+        except Exception as e:
+            print(f"Error validating example: {str(e)}")
+            return False
+
+    @staticmethod
+    def log_quality_metrics(example: Dict, model: str):
+        """Log quality metrics for monitoring."""
+        metrics = {
+            'timestamp': datetime.now().isoformat(),
+            'model': model,
+            'response_length': len(example['response']),
+            'has_execution_details': bool(example.get('execution_details')),
+            'is_user_friendly': not QualityValidator.USER_FRIENDLY_MATCHER.scan(example['response']),
+            'has_error_handling': 'error_handling' in example.get('execution_details', {})
+        }
+
+        # Buffered and sharded per process; see quality_metrics.py
+        get_metrics_sink().write(metrics)
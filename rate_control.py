@@ -0,0 +1,280 @@
+"""
+Adaptive rate control for LLM provider calls
+
+Learns a sustainable request rate per provider/model instead of relying on
+fixed sleeps and ad-hoc exponential backoff:
+- additive increase: each success grows the allowed rate by `increase`
+  req/s, at most once per second, so idle time doesn't count as traffic
+- multiplicative decrease: a 429 multiplies the rate by `decrease`
+- Retry-After and x-ratelimit-remaining/reset headers pause all callers
+  until the provider says requests will be accepted again
+
+The limiter state lives in a small JSON file guarded by an flock, so every
+thread and process on the machine shares one budget per provider/model.
+
+Usage:
+    limiter = get_rate_limiter("openai", "gpt-3.5-turbo")
+    response = limiter.call(openai.chat.completions.with_raw_response.create, model=..., messages=...)
+    logging.info(limiter.format_stats())
+"""
+
+import asyncio
+import email.utils
+import fcntl
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+RATE_CONTROL_DIR = os.getenv("RATE_CONTROL_DIR", ".rate_control")
+INITIAL_RATE = float(os.getenv("RATE_LIMIT_INITIAL_RPS", "1.0"))
+MIN_RATE = float(os.getenv("RATE_LIMIT_MIN_RPS", "0.05"))
+MAX_RATE = float(os.getenv("RATE_LIMIT_MAX_RPS", "20.0"))
+STATS_WINDOW_SECONDS = 60
+
+class RateLimitExceeded(Exception):
+    """Raised when a call is still rate limited after all retries"""
+
+def _parse_duration(value: str) -> Optional[float]:
+    """Parse '2', '1.5', '6m0s', '250ms' or an HTTP date into seconds"""
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    parts = re.findall(r"(\d+(?:\.\d+)?)(ms|h|m|s)", value)
+    if parts:
+        scale = {"h": 3600, "m": 60, "s": 1, "ms": 0.001}
+        return sum(float(amount) * scale[unit] for amount, unit in parts)
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+        return max(0.0, parsed.timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+def _get_header(headers, name: str) -> Optional[str]:
+    if not headers:
+        return None
+    try:
+        return headers.get(name) or headers.get(name.title())
+    except AttributeError:
+        return None
+
+def rate_limit_info(obj: Any) -> Tuple[bool, Any]:
+    """
+    Inspect a response or exception from requests, openai or together.
+
+    Returns:
+        tuple: (is_rate_limited, headers)
+    """
+    status = getattr(obj, "status_code", None) or getattr(obj, "http_status", None)
+    response = getattr(obj, "response", None)
+    if status is None and response is not None:
+        status = getattr(response, "status_code", None)
+    headers = getattr(obj, "headers", None)
+    if headers is None and response is not None:
+        headers = getattr(response, "headers", None)
+    return status == 429, headers
+
+def _usage_tokens(result: Any) -> int:
+    usage = getattr(result, "usage", None)
+    return int(getattr(usage, "total_tokens", 0) or 0) if usage is not None else 0
+
+class AdaptiveRateLimiter:
+    """
+    AIMD rate limiter shared across threads and processes through a state file.
+
+    Args:
+        name (str): Identifier for the provider/model budget
+        initial_rate (float): Starting requests per second
+        min_rate (float): Floor for the learned rate
+        max_rate (float): Ceiling for the learned rate
+        increase (float): Requests per second added per successful second
+        decrease (float): Factor applied to the rate on a 429
+        state_dir (str): Directory holding the shared state files
+    """
+
+    def __init__(self, name: str, initial_rate: float = INITIAL_RATE, min_rate: float = MIN_RATE,
+                 max_rate: float = MAX_RATE, increase: float = 0.1, decrease: float = 0.5,
+                 state_dir: str = RATE_CONTROL_DIR):
+        self.name = name
+        self.initial_rate = min(max(initial_rate, min_rate), max_rate)
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.increase = increase
+        self.decrease = decrease
+        os.makedirs(state_dir, exist_ok=True)
+        safe_name = re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+        self.state_path = os.path.join(state_dir, f"{safe_name}.json")
+        self.lock_path = self.state_path + ".lock"
+        self._thread_lock = threading.Lock()
+
+    def _default_state(self) -> Dict[str, Any]:
+        return {
+            "rate": self.initial_rate,
+            "next_slot": 0.0,
+            "blocked_until": 0.0,
+            "last_increase": time.time(),
+            "throttled": 0,
+            "events": []  # [timestamp, tokens] for requests in the stats window
+        }
+
+    def _update(self, mutate: Callable[[Dict[str, Any], float], Any]) -> Any:
+        """Apply `mutate(state, now)` to the shared state under an exclusive lock"""
+        with self._thread_lock, open(self.lock_path, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                try:
+                    with open(self.state_path) as f:
+                        state = json.load(f)
+                except (FileNotFoundError, json.JSONDecodeError):
+                    state = self._default_state()
+                result = mutate(state, time.time())
+                tmp_path = f"{self.state_path}.{os.getpid()}.tmp"
+                with open(tmp_path, "w") as f:
+                    json.dump(state, f)
+                os.replace(tmp_path, self.state_path)
+                return result
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def reserve(self) -> float:
+        """Reserve the next request slot and return how long to wait for it"""
+        def mutate(state, now):
+            slot = max(now, state["next_slot"], state["blocked_until"])
+            state["next_slot"] = slot + 1.0 / state["rate"]
+            return slot - now
+        return self._update(mutate)
+
+    def acquire(self):
+        """Block until this caller may send its next request"""
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self):
+        """Asyncio variant of acquire()"""
+        delay = await asyncio.to_thread(self.reserve)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def record_success(self, headers=None, tokens: int = 0):
+        """Record a successful request and grow the rate additively"""
+        pause = self._pause_from_headers(headers)
+
+        def mutate(state, now):
+            state["events"] = [e for e in state["events"] if e[0] > now - STATS_WINDOW_SECONDS]
+            state["events"].append([now, tokens])
+            # One step per success at most once a second; time spent idle earns nothing
+            if now - state["last_increase"] >= 1.0:
+                state["rate"] = min(self.max_rate, state["rate"] + self.increase)
+                state["last_increase"] = now
+            if pause:
+                state["blocked_until"] = max(state["blocked_until"], now + pause)
+        self._update(mutate)
+
+    def record_rate_limited(self, headers=None):
+        """Record a 429: cut the rate and pause everyone for Retry-After"""
+        retry_after = self._retry_after(headers)
+
+        def mutate(state, now):
+            state["rate"] = max(self.min_rate, state["rate"] * self.decrease)
+            state["last_increase"] = now
+            state["throttled"] += 1
+            pause = retry_after if retry_after is not None else 1.0 / state["rate"]
+            state["blocked_until"] = max(state["blocked_until"], now + pause)
+            state["next_slot"] = max(state["next_slot"], state["blocked_until"])
+            return state["rate"]
+        rate = self._update(mutate)
+        logging.warning(f"Rate limited by {self.name}; backing off to {rate:.2f} req/s")
+
+    def call(self, fn: Callable, *args, max_retries: int = 5, **kwargs):
+        """
+        Call `fn` under the limiter, retrying on 429s.
+
+        Works with functions that raise on 429 (openai, together) and with
+        ones that return a response object (requests). A 429 response is
+        returned as-is after the final attempt so callers can handle it.
+        Raw SDK responses (`.with_raw_response.create`) have their rate limit
+        headers recorded and are returned parsed.
+        """
+        for attempt in range(max_retries):
+            self.acquire()
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as e:
+                limited, headers = rate_limit_info(e)
+                if not limited:
+                    raise
+                self.record_rate_limited(headers)
+                if attempt == max_retries - 1:
+                    raise RateLimitExceeded(f"{self.name}: still rate limited after {max_retries} attempts") from e
+                continue
+
+            limited, headers = rate_limit_info(result)
+            if limited:
+                self.record_rate_limited(headers)
+                if attempt < max_retries - 1:
+                    continue
+                return result
+            if hasattr(result, "parse") and hasattr(result, "headers"):
+                result = result.parse()
+            self.record_success(headers, _usage_tokens(result))
+            return result
+
+    def stats(self) -> Dict[str, Any]:
+        """Current learned rate and achieved throughput over the last minute"""
+        def mutate(state, now):
+            state["events"] = [e for e in state["events"] if e[0] > now - STATS_WINDOW_SECONDS]
+            events = state["events"]
+            window = min(STATS_WINDOW_SECONDS, now - events[0][0]) if events else 0
+            return {
+                "name": self.name,
+                "allowed_rps": round(state["rate"], 3),
+                "achieved_rps": round(len(events) / window, 3) if window > 0 else 0.0,
+                "achieved_tpm": int(sum(e[1] for e in events) * 60 / window) if window > 0 else 0,
+                "requests_last_minute": len(events),
+                "throttled": state["throttled"]
+            }
+        return self._update(mutate)
+
+    def format_stats(self) -> str:
+        s = self.stats()
+        return (f"{s['name']}: allowed {s['allowed_rps']} req/s, achieved {s['achieved_rps']} req/s, "
+                f"{s['achieved_tpm']} tokens/min, {s['throttled']} throttled")
+
+    def _retry_after(self, headers) -> Optional[float]:
+        for name in ("retry-after", "x-ratelimit-reset-requests", "x-ratelimit-reset"):
+            value = _get_header(headers, name)
+            if value:
+                seconds = _parse_duration(str(value))
+                if seconds is not None:
+                    return seconds
+        return None
+
+    def _pause_from_headers(self, headers) -> Optional[float]:
+        """Pause until the reset time when the provider reports no requests/tokens left"""
+        for kind in ("requests", "tokens"):
+            remaining = _get_header(headers, f"x-ratelimit-remaining-{kind}")
+            reset = _get_header(headers, f"x-ratelimit-reset-{kind}")
+            if remaining is not None and reset is not None:
+                try:
+                    if float(remaining) <= 0:
+                        return _parse_duration(str(reset))
+                except ValueError:
+                    continue
+        return None
+
+_limiters: Dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+def get_rate_limiter(provider: str, model: str, **kwargs) -> AdaptiveRateLimiter:
+    """Return the process-wide limiter for a provider/model budget"""
+    name = f"{provider}_{model}"
+    with _limiters_lock:
+        if name not in _limiters:
+            _limiters[name] = AdaptiveRateLimiter(name, **kwargs)
+        return _limiters[name]
@@ -1,13 +1,20 @@
 #!/usr/bin/env python3
 """
 Script to run the small generator repeatedly until we reach 500 additional examples
+
+Each generated batch is recorded in the generation spool before its batch
+file is written, so `--resume` continues an interrupted loop from where it
+stopped and rewrites any batch files that were never saved.
 """
 
-import os
+import json
 import time
 import sys
+import argparse
 from datetime import datetime
 from run_ms_generator_small import main as generate_small_batch
+from generate_multi_service_examples import save_to_json
+from generation_spool import GenerationSpool
 
 # How many total examples to generate
 TARGET_TOTAL = 500
@@ -18,46 +25,70 @@ EXAMPLES_PER_BATCH = 1
 # Time to sleep between batches (in seconds)
 SLEEP_TIME = 60
 
-def main():
+SMALL_BATCH_FILE = "multi_service_examples_small_batch.json"
+SPOOL_WORK_KEY = "multi_service"
+
+def write_batch_file(spool, batch_num, examples):
+    """Save a spooled batch under a unique filename for later bulk insertion"""
+    batch_filename = f"multi_service_examples_batch_{batch_num}_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
+    save_to_json(examples, batch_filename)
+    spool.mark_inserted(SPOOL_WORK_KEY, batch_num, len(examples))
+    return batch_filename
+
+def main(resume=False):
     """Run the generator in a loop until we reach the target"""
     print(f"Starting generation loop to create {TARGET_TOTAL} examples")
-    
-    total_inserted = 0
-    batch_num = 1
-    
+
+    spool = GenerationSpool.open("run_generator_loop", resume=resume)
+
+    # Write out batches that were generated but never saved before the last run stopped
+    for _, pending_num, examples in spool.pending_inserts():
+        batch_filename = write_batch_file(spool, pending_num, examples)
+        print(f"Recovered batch {pending_num} as {batch_filename}")
+
+    total_inserted = spool.summary()["generated_rows"]
+    batch_num = max(1, spool.next_batch_index(SPOOL_WORK_KEY))
+    if total_inserted:
+        print(f"Resuming run {spool.run_id} at batch {batch_num} ({total_inserted} examples already generated)")
+
     while total_inserted < TARGET_TOTAL:
         print(f"\n--- Batch {batch_num} ---")
         print(f"Generated {total_inserted} of {TARGET_TOTAL} examples so far")
-        
+
         try:
             generated = generate_small_batch()
+            with open(SMALL_BATCH_FILE) as f:
+                examples = json.load(f)
+            spool.record_generated(SPOOL_WORK_KEY, batch_num, examples)
             total_inserted += generated
-            
-            # Generate a unique filename for this batch
-            batch_filename = f"multi_service_examples_batch_{batch_num}_{datetime.now().strftime('%Y%m%d%H%M%S')}.json"
-            
-            # Copy the current batch file to a uniquely named file for later bulk insertion
-            os.system(f"cp multi_service_examples_small_batch.json {batch_filename}")
+
+            # Save the batch under a unique filename for later bulk insertion
+            batch_filename = write_batch_file(spool, batch_num, examples)
             print(f"Saved batch {batch_num} as {batch_filename}")
-            
+
             print(f"Progress: {total_inserted}/{TARGET_TOTAL} examples ({total_inserted/TARGET_TOTAL*100:.1f}%)")
-            
+
             # Break if we've reached or exceeded the target
             if total_inserted >= TARGET_TOTAL:
                 break
-                
+
             # Sleep between batches
             print(f"Sleeping for {SLEEP_TIME} seconds before next batch...")
             time.sleep(SLEEP_TIME)
-            
+
         except Exception as e:
             print(f"Error in batch {batch_num}: {e}")
             print("Sleeping for 60 seconds to recover...")
             time.sleep(60)
-        
+
         batch_num += 1
-    
+
+    spool.close()
     print(f"\nGeneration complete! Generated {total_inserted} examples total.")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Run the small multi-service generator in a loop")
+    parser.add_argument("--resume", action="store_true",
+                        help="Resume the last loop from the generation spool")
+    args = parser.parse_args()
+    main(resume=args.resume)
@@ -0,0 +1,7 @@
+-- Index used by analyze_guideline_effectiveness.py's (updated_at, id) watermark:
+-- incremental runs filter on updated_at and page with
+-- ORDER BY updated_at, id, which without this index scans and sorts the
+-- whole training_data table on every page.
+-- On a large, busy table, run it as CREATE INDEX CONCURRENTLY (outside a
+-- transaction) to avoid blocking writes while it builds.
+CREATE INDEX IF NOT EXISTS idx_training_data_updated_at_id ON public.training_data (updated_at, id);
@@ -0,0 +1,157 @@
+"""
+Version-keyed cache of the active algorithm rows and their compiled code
+
+execute_training_algorithm.py used to fetch the active training_data_algorithm
+row and exec its source on every run, and execute_external_llm_algorithm.py
+re-fetched its active row each time. AlgorithmCache keeps the active row (and,
+for algorithms stored as source, its compiled code object):
+- in memory, trusted for `ttl_seconds` before the version is rechecked
+- on disk under ALGORITHM_CACHE_DIR, keyed by the row's id, version and
+  updated_at, so a fresh process only pays for a version check
+
+The version check selects id/version/updated_at of the active row only; the
+full row (and the source) is fetched and compiled only when that key has
+never been seen.
+
+Usage:
+    cache = AlgorithmCache(supabase, "training_data_algorithm", source_field="algorithm")
+    algorithm = cache.get_active()
+    namespace = {}
+    exec(algorithm.code, namespace)
+"""
+
+import hashlib
+import logging
+import marshal
+import os
+import pickle
+import sys
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+ALGORITHM_CACHE_DIR = os.getenv("ALGORITHM_CACHE_DIR", os.path.join(os.path.dirname(os.path.abspath(__file__)), ".algorithm_cache"))
+ALGORITHM_CACHE_TTL_SECONDS = float(os.getenv("ALGORITHM_CACHE_TTL_SECONDS", "60"))
+
+@dataclass
+class CachedAlgorithm:
+    """An active algorithm row plus its compiled code (None for config-only algorithms)"""
+    version_key: str
+    row: Dict[str, Any]
+    code: Any = None
+
+def version_key(row: Dict[str, Any]) -> str:
+    return f"{row.get('id')}:{row.get('version')}:{row.get('updated_at')}"
+
+class AlgorithmCache:
+    """
+    Memory and disk cache for the active row of an algorithm table.
+
+    Args:
+        supabase: Supabase client
+        table (str): Algorithm table (training_data_algorithm, external_llm_algorithm, ...)
+        source_field (str): Column holding Python source to compile, or None to cache the row only
+        cache_dir (str): Directory for the on-disk cache
+        ttl_seconds (float): How long to trust the in-memory algorithm before rechecking its version
+    """
+
+    def __init__(self, supabase, table: str, source_field: Optional[str] = None,
+                 cache_dir: str = ALGORITHM_CACHE_DIR, ttl_seconds: float = ALGORITHM_CACHE_TTL_SECONDS):
+        self.supabase = supabase
+        self.table = table
+        self.source_field = source_field
+        self.cache_dir = cache_dir
+        self.ttl_seconds = ttl_seconds
+        self._current: Optional[CachedAlgorithm] = None
+        self._checked_at = float("-inf")
+        self.stats = {"version_checks": 0, "memory_hits": 0, "disk_hits": 0, "fetches": 0}
+
+    def _fetch_version_key(self) -> Optional[str]:
+        self.stats["version_checks"] += 1
+        result = self.supabase.table(self.table).select("id, version, updated_at").eq("is_active", True).execute()
+        return version_key(result.data[0]) if result.data else None
+
+    def _fetch_row(self) -> Optional[Dict[str, Any]]:
+        self.stats["fetches"] += 1
+        result = self.supabase.table(self.table).select("*").eq("is_active", True).execute()
+        return result.data[0] if result.data else None
+
+    def _cache_path(self, key: str) -> str:
+        # Code objects are only valid for the interpreter version that compiled them
+        digest = hashlib.sha1(f"{self.table}:{key}".encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{self.table}.{digest}.{sys.implementation.cache_tag}.pickle")
+
+    def _load_from_disk(self, key: str) -> Optional[CachedAlgorithm]:
+        try:
+            with open(self._cache_path(key), "rb") as f:
+                entry = pickle.load(f)
+            code = marshal.loads(entry["code"]) if entry["code"] is not None else None
+            return CachedAlgorithm(key, entry["row"], code)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logging.warning(f"Ignoring unreadable algorithm cache entry for {self.table}: {e}")
+            return None
+
+    def _save_to_disk(self, algorithm: CachedAlgorithm):
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            path = self._cache_path(algorithm.version_key)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump({
+                    "row": algorithm.row,
+                    "code": marshal.dumps(algorithm.code) if algorithm.code is not None else None
+                }, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logging.warning(f"Could not write algorithm cache for {self.table}: {e}")
+
+    def _compile(self, row: Dict[str, Any]) -> CachedAlgorithm:
+        key = version_key(row)
+        code = None
+        if self.source_field:
+            source = row.get(self.source_field) or ""
+            if not source:
+                raise ValueError(f"Active {self.table} row has no {self.source_field}")
+            code = compile(source, f"<{self.table} {row.get('version')}>", "exec")
+        return CachedAlgorithm(key, row, code)
+
+    def get_active(self) -> Optional[CachedAlgorithm]:
+        """
+        Return the active algorithm, compiled if it has a source field.
+
+        Returns:
+            CachedAlgorithm or None if no row is active
+        """
+        now = time.monotonic()
+        if self._current is not None and now - self._checked_at < self.ttl_seconds:
+            self.stats["memory_hits"] += 1
+            return self._current
+
+        key = self._fetch_version_key()
+        self._checked_at = now
+        if key is None:
+            self._current = None
+            return None
+        if self._current is not None and self._current.version_key == key:
+            self.stats["memory_hits"] += 1
+            return self._current
+
+        algorithm = self._load_from_disk(key)
+        if algorithm is not None:
+            self.stats["disk_hits"] += 1
+        else:
+            row = self._fetch_row()
+            if row is None:
+                self._current = None
+                return None
+            algorithm = self._compile(row)
+            self._save_to_disk(algorithm)
+        self._current = algorithm
+        logging.info(f"Loaded {self.table} version {algorithm.row.get('version')}")
+        return algorithm
+
+    def invalidate(self):
+        """Recheck the active version on the next get_active()"""
+        self._checked_at = float("-inf")
@@ -2,18 +2,35 @@
 """
 Script to analyze which system_training guidelines lead to the most effective responses.
 This creates a feedback loop to refine the guidelines based on their effectiveness.
+
+Usage counts and score sums per guideline are kept as running sums in a
+local SQLite state file, together with each analyzed row's contribution and
+an (updated_at, id) watermark. Each run reads only the training_data rows
+added or changed since the watermark, page by page with keyset pagination,
+replaces those rows' contributions and rebuilds the report from the sums, so
+it covers the whole table in time proportional to the changes. Category
+effectiveness is derived from the per-guideline sums with the current
+guidelines. Deleted rows are not seen by the watermark; run with --full to
+rebuild the sums from scratch. The watermark queries rely on the
+(updated_at, id) index from scripts/add_training_data_updated_at_index.sql.
+
+Usage:
+    python scripts/analyze_guideline_effectiveness.py
+    python scripts/analyze_guideline_effectiveness.py --full
 """
 
 import os
 import json
 import logging
+import sqlite3
+import argparse
 import uuid
 from typing import Dict, List, Any, Counter
 from collections import defaultdict
 from pathlib import Path
 from supabase import create_client, Client
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import datetime, timedelta
 
 # Configure logging
 logging.basicConfig(
@@ -25,6 +42,12 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+ANALYSIS_STATE_PATH = os.getenv("GUIDELINE_ANALYSIS_STATE", ".analysis_state/guideline_effectiveness.sqlite")
+PAGE_SIZE = 1000
+# Rows committed late can carry an updated_at just behind the watermark; re-reading them is harmless
+WATERMARK_OVERLAP_SECONDS = 60
+ANALYSIS_COLUMNS = 'id, updated_at, applied_guidelines, execution_details, follow_up_queries, systems, workflow, metadata'
+
 def connect_to_supabase() -> Client:
     """Connect to Supabase using environment variables"""
     supabase_url = os.getenv("SUPABASE_URL")
@@ -35,15 +58,37 @@ def connect_to_supabase() -> Client:
     
     return create_client(supabase_url, supabase_key)
 
-def get_training_data(supabase: Client, limit: int = 1000) -> List[Dict[str, Any]]:
-    """Fetch training data from the training_data table"""
-    logger.info(f"Fetching up to {limit} training data entries")
-    result = supabase.table('training_data').select('*').limit(limit).execute()
-    
-    if hasattr(result, 'error') and result.error:
-        raise Exception(f"Error fetching training data: {result.error}")
-    
-    return result.data
+def get_training_data(supabase: Client, since: str = None, after: tuple = None):
+    """
+    Yield pages of training data ordered by (updated_at, id) using keyset pagination.
+
+    Args:
+        supabase: Supabase client
+        since (str): Only rows with updated_at at or after this timestamp (default: all rows)
+        after (tuple): Resume after this (updated_at, id) key
+
+    Yields:
+        list: Up to PAGE_SIZE rows per page
+    """
+    logger.info(f"Fetching training data changed since {since}" if since else "Fetching all training data")
+    while True:
+        query = supabase.table('training_data').select(ANALYSIS_COLUMNS)
+        if after:
+            updated_at, row_id = after
+            query = query.or_(f'updated_at.gt."{updated_at}",and(updated_at.eq."{updated_at}",id.gt.{row_id})')
+        elif since:
+            query = query.gte('updated_at', since)
+        result = query.order('updated_at').order('id').limit(PAGE_SIZE).execute()
+        
+        if hasattr(result, 'error') and result.error:
+            raise Exception(f"Error fetching training data: {result.error}")
+        
+        if not result.data:
+            return
+        yield result.data
+        if len(result.data) < PAGE_SIZE:
+            return
+        after = (result.data[-1]['updated_at'], result.data[-1]['id'])
 
 def get_guidelines(supabase: Client) -> Dict[str, Dict[str, Any]]:
     """Fetch all guidelines from system_training table and index by ID"""
@@ -62,60 +107,119 @@ def get_guidelines(supabase: Client) -> Dict[str, Dict[str, Any]]:
     
     return guidelines_index
 
-def analyze_guideline_effectiveness(training_data: List[Dict[str, Any]], guidelines_index: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
-    """Analyze which guidelines lead to the most effective responses"""
-    # Initialize counters and metrics
+def extract_guideline_ids(entry: Dict[str, Any]) -> List[str]:
+    """Guideline IDs applied to a training data entry, from all categories"""
+    applied_guidelines = entry.get('applied_guidelines') or {}
+    guideline_ids = []
+    for key in ('general_guidelines', 'domain_guidelines', 'system_guidelines'):
+        for guideline in applied_guidelines.get(key) or []:
+            guideline_id = guideline.get('id', '')
+            if guideline_id:
+                guideline_ids.append(guideline_id)
+    return guideline_ids
+
+class EffectivenessState:
+    """
+    Running per-guideline sums, per-row contributions and the watermark, in SQLite.
+
+    Args:
+        path (str): State file (":memory:" for a throwaway state)
+    """
+
+    def __init__(self, path: str = ANALYSIS_STATE_PATH):
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript("""
+            CREATE TABLE IF NOT EXISTS row_contributions (id TEXT PRIMARY KEY, score REAL NOT NULL, guideline_ids TEXT NOT NULL);
+            CREATE TABLE IF NOT EXISTS guideline_sums (guideline_id TEXT PRIMARY KEY, count INTEGER NOT NULL, score REAL NOT NULL);
+            CREATE TABLE IF NOT EXISTS watermark (singleton INTEGER PRIMARY KEY CHECK (singleton = 1), updated_at TEXT, id TEXT);
+        """)
+
+    def reset(self):
+        self.conn.executescript("DELETE FROM row_contributions; DELETE FROM guideline_sums; DELETE FROM watermark;")
+
+    def get_watermark(self):
+        row = self.conn.execute("SELECT updated_at, id FROM watermark").fetchone()
+        return tuple(row) if row else None
+
+    def _add(self, guideline_ids: List[str], score: float, sign: int):
+        self.conn.executemany(
+            """INSERT INTO guideline_sums (guideline_id, count, score) VALUES (?, ?, ?)
+               ON CONFLICT (guideline_id) DO UPDATE SET count = count + excluded.count, score = score + excluded.score""",
+            [(guideline_id, sign, sign * score) for guideline_id in guideline_ids]
+        )
+
+    def apply(self, entry: Dict[str, Any]):
+        """Replace an entry's previous contribution to the sums with its current one"""
+        previous = self.conn.execute("SELECT score, guideline_ids FROM row_contributions WHERE id = ?", (entry['id'],)).fetchone()
+        if previous:
+            self._add(json.loads(previous[1]), previous[0], -1)
+        guideline_ids = extract_guideline_ids(entry)
+        if guideline_ids:
+            score = calculate_effectiveness_score(entry)
+            self._add(guideline_ids, score, 1)
+            self.conn.execute("INSERT OR REPLACE INTO row_contributions (id, score, guideline_ids) VALUES (?, ?, ?)",
+                              (entry['id'], score, json.dumps(guideline_ids)))
+        elif previous:
+            self.conn.execute("DELETE FROM row_contributions WHERE id = ?", (entry['id'],))
+
+    def advance(self, updated_at: str, row_id: str):
+        """Move the watermark forward and commit everything applied so far"""
+        self.conn.execute("INSERT OR REPLACE INTO watermark (singleton, updated_at, id) VALUES (1, ?, ?)", (updated_at, row_id))
+        self.conn.commit()
+
+    def guideline_sums(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            guideline_id: {'count': count, 'score': score}
+            for guideline_id, count, score in self.conn.execute("SELECT guideline_id, count, score FROM guideline_sums WHERE count > 0")
+        }
+
+def update_effectiveness_state(supabase: Client, state: EffectivenessState, full: bool = False) -> int:
+    """
+    Fold training data rows changed since the watermark into the running sums.
+
+    Args:
+        supabase: Supabase client
+        state (EffectivenessState): Persistent sums
+        full (bool): Discard the sums and reprocess the whole table
+
+    Returns:
+        int: Number of rows processed
+    """
+    if full:
+        state.reset()
+    watermark = state.get_watermark()
+    since = None
+    if watermark:
+        since = (datetime.fromisoformat(watermark[0].replace('Z', '+00:00')) - timedelta(seconds=WATERMARK_OVERLAP_SECONDS)).isoformat()
+    processed = 0
+    for page in get_training_data(supabase, since=since):
+        for entry in page:
+            state.apply(entry)
+        last = page[-1]
+        if not watermark or (last['updated_at'], last['id']) > watermark:
+            watermark = (last['updated_at'], last['id'])
+        state.advance(*watermark)
+        processed += len(page)
+    return processed
+
+def summarize_effectiveness(guideline_sums: Dict[str, Dict[str, Any]], guidelines_index: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the analysis results from per-guideline usage counts and score sums"""
     guideline_usage = Counter()
     guideline_effectiveness = defaultdict(lambda: {'count': 0, 'score': 0})
     category_effectiveness = defaultdict(lambda: {'count': 0, 'score': 0})
     
-    # Process each training data entry
-    for entry in training_data:
-        # Skip entries without applied_guidelines
-        if 'applied_guidelines' not in entry:
-            continue
+    for guideline_id, sums in guideline_sums.items():
+        guideline_usage[guideline_id] += sums['count']
+        guideline_effectiveness[guideline_id]['count'] += sums['count']
+        guideline_effectiveness[guideline_id]['score'] += sums['score']
         
-        applied_guidelines = entry['applied_guidelines']
-        
-        # Extract guideline IDs from all categories
-        guideline_ids = []
-        
-        # General guidelines
-        for guideline in applied_guidelines.get('general_guidelines', []):
-            guideline_id = guideline.get('id', '')
-            if guideline_id:
-                guideline_ids.append(guideline_id)
-        
-        # Domain guidelines
-        for guideline in applied_guidelines.get('domain_guidelines', []):
-            guideline_id = guideline.get('id', '')
-            if guideline_id:
-                guideline_ids.append(guideline_id)
-        
-        # System guidelines
-        for guideline in applied_guidelines.get('system_guidelines', []):
-            guideline_id = guideline.get('id', '')
-            if guideline_id:
-                guideline_ids.append(guideline_id)
-        
-        # Skip if no guidelines were applied
-        if not guideline_ids:
-            continue
-        
-        # Calculate effectiveness score for this entry
-        effectiveness_score = calculate_effectiveness_score(entry)
-        
-        # Update counters and metrics
-        for guideline_id in guideline_ids:
-            guideline_usage[guideline_id] += 1
-            guideline_effectiveness[guideline_id]['count'] += 1
-            guideline_effectiveness[guideline_id]['score'] += effectiveness_score
-            
-            # Update category effectiveness if guideline exists
-            if guideline_id in guidelines_index:
-                category = guidelines_index[guideline_id].get('category', 'unknown')
-                category_effectiveness[category]['count'] += 1
-                category_effectiveness[category]['score'] += effectiveness_score
+        # Update category effectiveness if guideline exists
+        if guideline_id in guidelines_index:
+            category = guidelines_index[guideline_id].get('category', 'unknown')
+            category_effectiveness[category]['count'] += sums['count']
+            category_effectiveness[category]['score'] += sums['score']
     
     # Calculate average effectiveness scores
     for guideline_id, metrics in guideline_effectiveness.items():
@@ -136,6 +240,20 @@ def analyze_guideline_effectiveness(training_data: List[Dict[str, Any]], guideli
     
     return analysis_results
 
+def analyze_guideline_effectiveness(training_data: List[Dict[str, Any]], guidelines_index: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Analyze which guidelines lead to the most effective responses"""
+    guideline_sums = defaultdict(lambda: {'count': 0, 'score': 0})
+    for entry in training_data:
+        # Skip entries without applied guidelines
+        guideline_ids = extract_guideline_ids(entry)
+        if not guideline_ids:
+            continue
+        effectiveness_score = calculate_effectiveness_score(entry)
+        for guideline_id in guideline_ids:
+            guideline_sums[guideline_id]['count'] += 1
+            guideline_sums[guideline_id]['score'] += effectiveness_score
+    return summarize_effectiveness(guideline_sums, guidelines_index)
+
 def calculate_effectiveness_score(entry: Dict[str, Any]) -> float:
     """Calculate an effectiveness score for a training data entry"""
     score = 0.0
@@ -255,22 +373,28 @@ def save_analysis_results(supabase: Client, analysis_results: Dict[str, Any]) ->
 
 def main():
     """Main function to analyze guideline effectiveness"""
+    parser = argparse.ArgumentParser(description='Analyze guideline effectiveness')
+    parser.add_argument('--full', action='store_true', help='Rebuild the running sums from the whole table')
+    parser.add_argument('--state', default=ANALYSIS_STATE_PATH, help='SQLite file holding the running sums and watermark')
+    args = parser.parse_args()
+    
     try:
         logger.info("Starting guideline effectiveness analysis")
         
         # Connect to Supabase
         supabase = connect_to_supabase()
         
-        # Get training data
-        training_data = get_training_data(supabase)
-        logger.info(f"Found {len(training_data)} training data entries")
+        # Fold training data changed since the last run into the running sums
+        state = EffectivenessState(args.state)
+        processed = update_effectiveness_state(supabase, state, full=args.full)
+        logger.info(f"Processed {processed} new or changed training data entries")
         
         # Get guidelines
         guidelines_index = get_guidelines(supabase)
         logger.info(f"Found {len(guidelines_index)} guidelines")
         
         # Analyze guideline effectiveness
-        analysis_results = analyze_guideline_effectiveness(training_data, guidelines_index)
+        analysis_results = summarize_effectiveness(state.guideline_sums(), guidelines_index)
         
         # Save analysis results
         save_analysis_results(supabase, analysis_results)
@@ -287,4 +411,4 @@ def main():
         raise
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
@@ -6,6 +6,7 @@ from typing import List, Dict, Any, Optional
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from datetime import datetime
+from bulk_update import bulk_update
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -294,12 +295,14 @@ def analyze_training_data_batch(training_ids: List[int], ratings: List[int], fee
         logger.error("Number of training IDs, ratings, and feedbacks must match")
         return False
     
-    success = True
-    for training_id, rating, feedback in zip(training_ids, ratings, feedbacks):
-        if not update_training_data_with_rating(training_id, rating, feedback):
-            success = False
+    result = bulk_update(supabase, 'training_data', [
+        (training_id, {'rating': rating, 'feedback': feedback})
+        for training_id, rating, feedback in zip(training_ids, ratings, feedbacks)
+    ])
+    for training_id, error in result.errors.items():
+        logger.error(f"Error updating training data {training_id}: {error}")
     
-    return success
+    return result.ok
 
 def main():
     parser = argparse.ArgumentParser(description='Analyze training data and update ratings/feedback')
@@ -0,0 +1,146 @@
+"""
+Benchmark: per-row update loop vs chunked bulk updates
+
+Runs both update paths against a local SQLite stand-in for training_data
+(JSONB stored as JSON text) and reports rows/sec:
+- per-row: one `UPDATE ... WHERE id = ?` statement per row, as the
+  update().eq('id', ...) loops did
+- bulk: the SQLite form of bulk_update_rows(), one multi-row
+  `UPDATE ... FROM json_each(?)` per chunk, falling back to one statement per
+  row inside savepoints when a chunk fails, to report the failing rows
+
+--latency-ms adds a simulated round trip per statement, the cost that
+dominates against a remote Supabase. --bad-rows makes a share of the patches
+violate a CHECK constraint, so the bulk path has to isolate the errors.
+
+Usage:
+    python scripts/benchmark_bulk_update.py --rows 5000 --latency-ms 0 1 5
+"""
+
+import argparse
+import json
+import os
+import random
+import sqlite3
+import tempfile
+import time
+import uuid
+
+COLUMNS = ["rating", "feedback", "applied_guidelines"]
+
+def create_stand_in(path, rows):
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("DROP TABLE IF EXISTS training_data")
+    conn.execute("""
+        CREATE TABLE training_data (
+            id TEXT PRIMARY KEY,
+            query TEXT NOT NULL,
+            rating INTEGER CHECK (rating BETWEEN 1 AND 10),
+            feedback TEXT,
+            applied_guidelines TEXT
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO training_data (id, query) VALUES (?, ?)",
+        ((str(uuid.UUID(int=random.getrandbits(128))), f"query {i}") for i in range(rows))
+    )
+    return conn
+
+def make_patches(ids, bad_share):
+    patches = []
+    for row_id in ids:
+        patch = {"rating": random.randint(1, 10), "feedback": "Reviewed"}
+        if random.random() < 0.5:
+            patch["applied_guidelines"] = {"general_guidelines": [{"id": str(uuid.UUID(int=random.getrandbits(128)))}], "domain_guidelines": [], "system_guidelines": []}
+        if random.random() < bad_share:
+            patch["rating"] = 42
+        patches.append((row_id, patch))
+    return patches
+
+def sql_value(value):
+    return json.dumps(value) if isinstance(value, (dict, list)) else value
+
+def run_per_row(conn, patches, latency):
+    errors = {}
+    for row_id, patch in patches:
+        time.sleep(latency)
+        columns = list(patch)
+        try:
+            conn.execute(
+                f"UPDATE training_data SET {', '.join(f'{c} = ?' for c in columns)} WHERE id = ?",
+                [sql_value(patch[c]) for c in columns] + [row_id]
+            )
+        except sqlite3.Error as e:
+            errors[row_id] = str(e)
+    return errors
+
+# Columns a patch doesn't mention keep their value, as jsonb_populate_record(t, patch) does in Postgres
+BULK_UPDATE_SQL = "UPDATE training_data AS t SET " + ", ".join(
+    f"{c} = CASE WHEN json_type(r.value, '$.patch.{c}') IS NULL THEN t.{c} ELSE json_extract(r.value, '$.patch.{c}') END"
+    for c in COLUMNS
+) + " FROM json_each(?) AS r WHERE t.id = json_extract(r.value, '$.id')"
+
+def run_bulk(conn, patches, latency, chunk_size):
+    errors = {}
+    for start in range(0, len(patches), chunk_size):
+        chunk = [{"id": row_id, "patch": patch} for row_id, patch in patches[start:start + chunk_size]]
+        time.sleep(latency)
+        conn.execute("BEGIN")
+        try:
+            conn.execute(BULK_UPDATE_SQL, (json.dumps(chunk),))
+        except sqlite3.Error:
+            # Isolate the failing rows, each in its own savepoint
+            for row in chunk:
+                conn.execute("SAVEPOINT row_update")
+                try:
+                    conn.execute(BULK_UPDATE_SQL, (json.dumps([row]),))
+                    conn.execute("RELEASE row_update")
+                except sqlite3.Error as e:
+                    conn.execute("ROLLBACK TO row_update")
+                    conn.execute("RELEASE row_update")
+                    errors[row["id"]] = str(e)
+        conn.execute("COMMIT")
+    return errors
+
+def snapshot(conn):
+    return [
+        (row_id, rating, feedback, json.loads(guidelines) if guidelines else None)
+        for row_id, rating, feedback, guidelines in conn.execute(
+            "SELECT id, rating, feedback, applied_guidelines FROM training_data ORDER BY id"
+        )
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-row vs chunked bulk updates on a SQLite stand-in")
+    parser.add_argument("--rows", type=int, default=5000, help="Rows updated per run")
+    parser.add_argument("--chunk-size", type=int, default=500, help="Rows per bulk statement")
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[0, 1, 5], help="Simulated round trip per statement")
+    parser.add_argument("--bad-rows", type=float, default=0.001, help="Share of patches that violate a constraint")
+    args = parser.parse_args()
+
+    random.seed(0)
+    directory = tempfile.mkdtemp()
+    print(f"{args.rows} rows, chunks of {args.chunk_size}, {args.bad_rows:.1%} failing rows, SQLite {sqlite3.sqlite_version}")
+    print(f"{'latency ms':>10} {'per-row rows/s':>15} {'bulk rows/s':>12} {'speedup':>8} {'errors':>7}")
+    for latency_ms in args.latency_ms:
+        results = {}
+        for name in ("per-row", "bulk"):
+            random.seed(1)
+            conn = create_stand_in(os.path.join(directory, f"{name}.sqlite"), args.rows)
+            ids = [row[0] for row in conn.execute("SELECT id FROM training_data")]
+            patches = make_patches(ids, args.bad_rows)
+            start = time.perf_counter()
+            if name == "per-row":
+                errors = run_per_row(conn, patches, latency_ms / 1000)
+            else:
+                errors = run_bulk(conn, patches, latency_ms / 1000, args.chunk_size)
+            elapsed = time.perf_counter() - start
+            results[name] = (len(patches) / elapsed, errors, snapshot(conn))
+            conn.close()
+        (per_row_rate, per_row_errors, per_row_rows), (bulk_rate, bulk_errors, bulk_rows) = results["per-row"], results["bulk"]
+        if per_row_rows != bulk_rows or set(per_row_errors) != set(bulk_errors):
+            raise RuntimeError("Bulk updates left the table in a different state than per-row updates")
+        print(f"{latency_ms:>10.1f} {per_row_rate:>15,.0f} {bulk_rate:>12,.0f} {bulk_rate / per_row_rate:>7.1f}x {len(bulk_errors):>7}")
+
+if __name__ == "__main__":
+    main()
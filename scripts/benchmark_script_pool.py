@@ -0,0 +1,96 @@
+"""
+Benchmark: per-script latency of cold subprocesses vs the warm script pool
+
+Runs the same stored-script bodies the way run_script used to (temp file +
+`subprocess.run([sys.executable, ...])`) and through WarmScriptPool, and
+reports the median/p95 wall time per run alongside the time the script body
+itself reported, so the remainder is process startup and import overhead.
+
+Usage:
+    python scripts/benchmark_script_pool.py --runs 20 --work-ms 50
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from warm_script_pool import WarmScriptPool
+
+# Typical stored script prologue plus `work_ms` of CPU work; prints its own run time
+SCRIPT_TEMPLATE = """
+import time
+_start = time.perf_counter()
+import os
+import json
+import logging
+from dotenv import load_dotenv
+from supabase import create_client, Client
+load_dotenv()
+while (time.perf_counter() - _start) * 1000 < {work_ms}:
+    pass
+print(f"{{(time.perf_counter() - _start) * 1000:.2f}}")
+"""
+
+def run_cold(source, args=None):
+    """run_script_from_supabase.run_script before the pool"""
+    with tempfile.NamedTemporaryFile(suffix='.py', delete=False) as temp_file:
+        temp_file.write(source.encode('utf-8'))
+        temp_file_path = temp_file.name
+    cmd = [sys.executable, temp_file_path] + (args or [])
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    os.unlink(temp_file_path)
+    return result.returncode, result.stdout
+
+def measure(run, source, runs):
+    latencies, script_times = [], []
+    for _ in range(runs):
+        start = time.perf_counter()
+        returncode, stdout = run(source)
+        latencies.append((time.perf_counter() - start) * 1000)
+        if returncode != 0:
+            raise RuntimeError(f"Benchmark script failed with exit code {returncode}")
+        script_times.append(float(stdout.strip().splitlines()[-1]))
+    return latencies, script_times
+
+def report(label, latencies, script_times):
+    latency = statistics.median(latencies)
+    p95 = sorted(latencies)[max(0, int(len(latencies) * 0.95) - 1)]
+    script = statistics.median(script_times)
+    print(f"{label:<22} {latency:>10.1f} {p95:>10.1f} {script:>10.1f} {latency - script:>10.1f} {script / latency:>9.0%}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark cold subprocess vs warm pool script runs")
+    parser.add_argument("--runs", type=int, default=20, help="Runs per method")
+    parser.add_argument("--work-ms", type=float, default=50, help="CPU work done by the script body")
+    parser.add_argument("--pool-size", type=int, default=2, help="Idle workers kept by the pool")
+    args = parser.parse_args()
+
+    source = SCRIPT_TEMPLATE.format(work_ms=args.work_ms)
+    print(f"{args.runs} runs of a script doing {args.work_ms:.0f} ms of work after importing dotenv/supabase")
+    print(f"{'method':<22} {'median ms':>10} {'p95 ms':>10} {'script ms':>10} {'overhead':>10} {'script %':>9}")
+
+    report("cold subprocess", *measure(run_cold, source, args.runs))
+
+    with WarmScriptPool(size=args.pool_size) as pool:
+        # Let the initial workers finish preloading, as a long-lived pool would have
+        time.sleep(3)
+
+        def run_pooled(source):
+            result = pool.run(source)
+            return result.returncode, result.stdout
+
+        latencies, script_times = [], []
+        for _ in range(args.runs):
+            # Pace runs like a caller doing other work between scripts, so replenishment keeps up
+            time.sleep(0.2)
+            run_latencies, run_script_times = measure(run_pooled, source, 1)
+            latencies += run_latencies
+            script_times += run_script_times
+        report("warm pool", latencies, script_times)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Bulk (id, patch) updates for the maintenance scripts
+
+migrate_user_data, validate_training_data_regular.save_fixed_entries and
+analyze_training_data used to send one `update(patch).eq('id', ...)` request
+per row. bulk_update sends the patches in chunks to the bulk_update_rows()
+Postgres function (create_bulk_update_function.sql), which applies each chunk
+with one multi-row UPDATE:
+- patches for the same id are merged in order (later keys win), so a chunk
+  never updates a row twice
+- columns a patch doesn't mention keep their current value, as with update()
+- if a chunk's statement fails, the function retries its rows one at a time
+  and reports which rows failed and why; ids that match no row are reported
+  as "not found"
+- without the function installed, the same result comes from the per-row
+  update() loop
+
+Usage:
+    result = bulk_update(supabase, "training_data", [(entry_id, {"rating": 8}), ...])
+    print(result.updated, result.errors)
+"""
+
+import logging
+import os
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Tuple
+
+BULK_UPDATE_CHUNK_SIZE = int(os.getenv("BULK_UPDATE_CHUNK_SIZE", "500"))
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class BulkUpdateResult:
+    """Outcome of a bulk update; errors maps row id to the error message"""
+    updated: int = 0
+    errors: Dict[Any, str] = field(default_factory=dict)
+    requests: int = 0
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+def merge_patches(patches: Iterable[Tuple[Any, Dict[str, Any]]]) -> Dict[Any, Dict[str, Any]]:
+    """Combine (id, patch) pairs into one patch per id, in first-seen order"""
+    merged: Dict[Any, Dict[str, Any]] = {}
+    for row_id, patch in patches:
+        patch = {key: value for key, value in patch.items() if key != "id"}
+        merged.setdefault(row_id, {}).update(patch)
+    return merged
+
+def _function_missing(error: Exception) -> bool:
+    message = str(error)
+    return "PGRST202" in message or ("bulk_update_rows" in message and "not find" in message)
+
+def _update_rows_one_by_one(supabase, table: str, rows: List[Tuple[Any, Dict[str, Any]]], result: BulkUpdateResult):
+    for row_id, patch in rows:
+        result.requests += 1
+        try:
+            response = supabase.table(table).update(patch).eq("id", row_id).execute()
+        except Exception as e:
+            result.errors[row_id] = str(e)
+            continue
+        if hasattr(response, "error") and response.error:
+            result.errors[row_id] = str(response.error)
+        elif not response.data:
+            result.errors[row_id] = "not found"
+        else:
+            result.updated += 1
+
+def bulk_update(supabase, table: str, patches: Iterable[Tuple[Any, Dict[str, Any]]],
+                chunk_size: int = BULK_UPDATE_CHUNK_SIZE) -> BulkUpdateResult:
+    """
+    Apply (id, patch) pairs to a table in chunked multi-row statements.
+
+    Args:
+        supabase: Supabase client
+        table (str): Table in the public schema with an id column
+        patches (iterable): (id, {column: value}) pairs
+        chunk_size (int): Rows per request
+
+    Returns:
+        BulkUpdateResult: Rows updated and per-row errors
+    """
+    rows = [(row_id, patch) for row_id, patch in merge_patches(patches).items() if patch]
+    result = BulkUpdateResult()
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        result.requests += 1
+        try:
+            response = supabase.rpc("bulk_update_rows", {
+                "p_table": table,
+                "p_rows": [{"id": row_id, "patch": patch} for row_id, patch in chunk]
+            }).execute()
+        except Exception as e:
+            if _function_missing(e):
+                logger.warning("bulk_update_rows() is not installed (see scripts/create_bulk_update_function.sql); "
+                               "updating rows one at a time")
+                result.requests -= 1
+                _update_rows_one_by_one(supabase, table, rows[start:], result)
+                break
+            # The whole chunk failed before any row was applied (bad table or column)
+            for row_id, _ in chunk:
+                result.errors[row_id] = str(e)
+            continue
+        outcome = response.data or {}
+        result.updated += outcome.get("updated", 0)
+        ids_by_text = {str(row_id): row_id for row_id, _ in chunk}
+        for error in outcome.get("errors", []):
+            result.errors[ids_by_text.get(str(error.get("id")), error.get("id"))] = error.get("error")
+    if result.errors:
+        logger.error(f"{len(result.errors)} of {len(rows)} {table} rows failed to update")
+    return result
@@ -0,0 +1,95 @@
+-- Create bulk_update_rows: apply many (id, patch) pairs to a table in one call
+--
+-- p_rows is a JSON array of {"id": ..., "patch": {column: value, ...}}. Columns
+-- missing from a row's patch keep their current value. The whole array is
+-- applied with one multi-row UPDATE; if that statement fails, the rows are
+-- retried one at a time, each in its own subtransaction, so one bad row only
+-- fails itself. Returns {"updated": n, "errors": [{"id": ..., "error": ...}]},
+-- where ids that matched no row are reported as "not found".
+CREATE OR REPLACE FUNCTION public.bulk_update_rows(p_table text, p_rows jsonb)
+RETURNS jsonb
+LANGUAGE plpgsql
+AS $$
+DECLARE
+  table_oid regclass;
+  id_type text;
+  set_columns text;
+  select_columns text;
+  update_sql text;
+  updated_ids text[];
+  row_item jsonb;
+  row_count integer;
+  errors jsonb := '[]'::jsonb;
+BEGIN
+  table_oid := to_regclass(format('public.%I', p_table));
+  IF table_oid IS NULL THEN
+    RAISE EXCEPTION 'Table public.% does not exist', p_table;
+  END IF;
+
+  SELECT format_type(a.atttypid, a.atttypmod) INTO id_type
+  FROM pg_attribute a
+  WHERE a.attrelid = table_oid AND a.attname = 'id' AND NOT a.attisdropped;
+  IF id_type IS NULL THEN
+    RAISE EXCEPTION 'Table public.% has no id column', p_table;
+  END IF;
+
+  -- Union of the patched columns; unknown keys are rejected rather than silently dropped
+  SELECT string_agg(format('%I', key), ', ' ORDER BY key), string_agg(format('m.%I', key), ', ' ORDER BY key)
+  INTO set_columns, select_columns
+  FROM (SELECT DISTINCT jsonb_object_keys(item->'patch') AS key FROM jsonb_array_elements(p_rows) AS item) keys
+  WHERE key <> 'id';
+  IF set_columns IS NULL THEN
+    RETURN jsonb_build_object('updated', 0, 'errors', errors);
+  END IF;
+  PERFORM 1 FROM (SELECT DISTINCT jsonb_object_keys(item->'patch') AS key FROM jsonb_array_elements(p_rows) AS item) keys
+  WHERE key <> 'id' AND NOT EXISTS (
+    SELECT 1 FROM pg_attribute a WHERE a.attrelid = table_oid AND a.attname = keys.key AND a.attnum > 0 AND NOT a.attisdropped
+  );
+  IF FOUND THEN
+    RAISE EXCEPTION 'Patch contains columns that public.% does not have', p_table;
+  END IF;
+
+  -- jsonb_populate_record(t, patch) overlays the patch on the current row, so
+  -- columns a row doesn't patch are written back unchanged
+  update_sql := format(
+    'UPDATE public.%I AS t SET (%s) = (SELECT %s FROM jsonb_populate_record(t, r.patch) AS m) '
+    'FROM jsonb_to_recordset($1) AS r(id text, patch jsonb) '
+    'WHERE t.id = r.id::%s RETURNING t.id::text',
+    p_table, set_columns, select_columns, id_type
+  );
+
+  BEGIN
+    EXECUTE 'WITH updated AS (' || update_sql || ') SELECT array_agg(id) FROM updated'
+    INTO updated_ids USING p_rows;
+  EXCEPTION WHEN OTHERS THEN
+    -- Isolate the failing rows
+    updated_ids := '{}';
+    FOR row_item IN SELECT * FROM jsonb_array_elements(p_rows) LOOP
+      BEGIN
+        EXECUTE update_sql USING jsonb_build_array(row_item);
+        GET DIAGNOSTICS row_count = ROW_COUNT;
+        IF row_count > 0 THEN
+          updated_ids := updated_ids || (row_item->>'id');
+        END IF;
+      EXCEPTION WHEN OTHERS THEN
+        errors := errors || jsonb_build_object('id', row_item->'id', 'error', SQLERRM);
+      END;
+    END LOOP;
+  END;
+
+  SELECT errors || COALESCE(jsonb_agg(jsonb_build_object('id', item->'id', 'error', 'not found')), '[]'::jsonb)
+  INTO errors
+  FROM jsonb_array_elements(p_rows) AS item
+  WHERE NOT (item->>'id' = ANY (COALESCE(updated_ids, '{}')))
+    AND NOT EXISTS (SELECT 1 FROM jsonb_array_elements(errors) AS e WHERE e->>'id' = item->>'id');
+
+  RETURN jsonb_build_object('updated', COALESCE(cardinality(updated_ids), 0), 'errors', errors);
+END;
+$$;
+
+-- Functions are executable by PUBLIC by default, and this one can update any
+-- public table, so only the service role used by the maintenance scripts may call it
+REVOKE EXECUTE ON FUNCTION public.bulk_update_rows(text, jsonb) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.bulk_update_rows(text, jsonb) TO service_role;
+
+COMMENT ON FUNCTION public.bulk_update_rows(text, jsonb) IS 'Applies (id, patch) pairs to a public table in one multi-row UPDATE, falling back to per-row updates to report row errors';
@@ -21,6 +21,8 @@ CREATE INDEX IF NOT EXISTS idx_user_data_user_id ON user_data(user_id);
 CREATE INDEX IF NOT EXISTS idx_user_data_tool ON user_data(tool);
 CREATE INDEX IF NOT EXISTS idx_user_data_intent ON user_data(intent);
 CREATE INDEX IF NOT EXISTS idx_user_data_created_at ON user_data(created_at);
+-- Supports keyset pagination of chat history by (created_at, id)
+CREATE INDEX IF NOT EXISTS idx_user_data_user_created_id ON user_data(user_id, created_at, id);
 
 -- Create user_endpoints table to store user-specific API endpoints
 CREATE TABLE IF NOT EXISTS user_endpoints (
@@ -1,11 +1,13 @@
 import os
 import json
 import time
+import argparse
 from datetime import datetime
 from typing import List, Dict, Any
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from openai import OpenAI
+from algorithm_cache import AlgorithmCache
 
 # Load environment variables from .env file
 load_dotenv()
@@ -15,6 +17,9 @@ url: str = os.environ.get("SUPABASE_URL")
 key: str = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
 supabase: Client = create_client(url, key)
 
+# Active LLM algorithm, cached in memory and on disk by version
+algorithm_cache = AlgorithmCache(supabase, "external_llm_algorithm")
+
 # Initialize OpenAI client
 client = OpenAI(api_key=os.environ.get("OPENAI_API_KEY"))
 
@@ -33,11 +38,11 @@ def get_python_path() -> str:
         return "C:\\Users\\matth\\AppData\\Local\\Programs\\Python\\Python313\\python.exe"
 
 def get_active_llm_algorithm():
-    """Retrieve the active external LLM algorithm from Supabase."""
+    """Retrieve the active external LLM algorithm from the cache or Supabase."""
     try:
-        result = supabase.table("external_llm_algorithm").select("*").eq("is_active", True).execute()
-        if result.data:
-            return result.data[0]
+        algorithm = algorithm_cache.get_active()
+        if algorithm:
+            return algorithm.row
         else:
             print("No active external LLM algorithm found")
             return None
@@ -220,22 +225,41 @@ def insert_training_data(data: List[Dict[str, Any]]):
         print(f"Error inserting training data: {str(e)}")
         return False
 
-if __name__ == "__main__":
+def run_once() -> bool:
+    """Fetch (or reuse) the active LLM algorithm, generate training data and insert it."""
     # Get the active LLM algorithm
     algorithm_data = get_active_llm_algorithm()
     if not algorithm_data:
         print("Failed to get active LLM algorithm")
-        exit(1)
+        return False
 
     # Generate training data using the LLM
     training_data = generate_training_data_with_llm(algorithm_data)
     if not training_data:
         print("Failed to generate training data")
-        exit(1)
+        return False
 
     # Insert the generated data
     success = insert_training_data(training_data)
     if success:
         print("Training data generation and insertion completed successfully!")
     else:
-        print("Failed to insert training data") 
\ No newline at end of file
+        print("Failed to insert training data")
+    return success
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Generate training data with the active external LLM algorithm")
+    parser.add_argument("--serve", action="store_true",
+                        help="Keep running and generate every --interval seconds, "
+                             "reusing the cached algorithm until its version changes")
+    parser.add_argument("--interval", type=float, default=300, help="Seconds between runs in --serve mode")
+    args = parser.parse_args()
+
+    if not args.serve:
+        if not run_once():
+            exit(1)
+    else:
+        while True:
+            run_once()
+            print(f"Next run in {args.interval:.0f} seconds...")
+            time.sleep(args.interval)
@@ -1,8 +1,11 @@
 import os
 import json
+import time
+import argparse
 from datetime import datetime
 from supabase import create_client, Client
 from dotenv import load_dotenv
+from algorithm_cache import AlgorithmCache
 
 # Load environment variables from .env file
 load_dotenv()
@@ -12,12 +15,15 @@ url: str = os.environ.get("SUPABASE_URL")
 key: str = os.environ.get("SUPABASE_SERVICE_ROLE_KEY")
 supabase: Client = create_client(url, key)
 
+# Active algorithm, compiled once per version and cached in memory and on disk
+algorithm_cache = AlgorithmCache(supabase, "training_data_algorithm", source_field="algorithm")
+
 def get_active_algorithm():
-    """Retrieve the active training data algorithm from Supabase."""
+    """Retrieve the active training data algorithm, compiled, from the cache or Supabase."""
     try:
-        result = supabase.table("training_data_algorithm").select("*").eq("is_active", True).execute()
-        if result.data:
-            return result.data[0]
+        algorithm = algorithm_cache.get_active()
+        if algorithm:
+            return algorithm
         else:
             print("No active training data algorithm found")
             return None
@@ -25,20 +31,14 @@ def get_active_algorithm():
         print(f"Error retrieving algorithm: {str(e)}")
         return None
 
-def execute_algorithm(algorithm_data):
-    """Execute the training data algorithm and generate training data."""
+def execute_algorithm(algorithm):
+    """Execute the compiled training data algorithm and generate training data."""
     try:
-        # Extract the algorithm code
-        algorithm_code = algorithm_data.get("algorithm", "")
-        if not algorithm_code:
-            print("No algorithm code found")
-            return None
-
         # Create a namespace for the algorithm execution
         namespace = {}
         
-        # Execute the algorithm code
-        exec(algorithm_code, namespace)
+        # Execute the precompiled algorithm code
+        exec(algorithm.code, namespace)
         
         # Call the generate_training_data function
         if "generate_training_data" in namespace:
@@ -77,22 +77,41 @@ def insert_training_data(data):
         print(f"Error inserting training data: {str(e)}")
         return False
 
-if __name__ == "__main__":
+def run_once() -> bool:
+    """Fetch (or reuse) the active algorithm, run it and insert its output."""
     # Get the active algorithm
-    algorithm_data = get_active_algorithm()
-    if not algorithm_data:
+    algorithm = get_active_algorithm()
+    if not algorithm:
         print("Failed to get active algorithm")
-        exit(1)
+        return False
 
     # Execute the algorithm to generate training data
-    training_data = execute_algorithm(algorithm_data)
+    training_data = execute_algorithm(algorithm)
     if not training_data:
         print("Failed to generate training data")
-        exit(1)
+        return False
 
     # Insert the generated data
     success = insert_training_data(training_data)
     if success:
         print("Training data generation and insertion completed successfully!")
     else:
-        print("Failed to insert training data") 
\ No newline at end of file
+        print("Failed to insert training data")
+    return success
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run the active training data algorithm")
+    parser.add_argument("--serve", action="store_true",
+                        help="Keep running and execute the algorithm every --interval seconds, "
+                             "reusing the compiled algorithm until its version changes")
+    parser.add_argument("--interval", type=float, default=300, help="Seconds between runs in --serve mode")
+    args = parser.parse_args()
+
+    if not args.serve:
+        if not run_once():
+            exit(1)
+    else:
+        while True:
+            run_once()
+            print(f"Next run in {args.interval:.0f} seconds...")
+            time.sleep(args.interval)
@@ -17,6 +17,7 @@ from datetime import datetime
 from pathlib import Path
 from supabase import create_client, Client
 from dotenv import load_dotenv
+from bulk_update import bulk_update
 
 # Configure logging
 logging.basicConfig(
@@ -162,26 +163,21 @@ def standardize_user_data(entry: Dict[str, Any], guidelines_index: Dict[str, Dic
     
     return standardized
 
-def update_user_data(supabase: Client, entry: Dict[str, Any]) -> bool:
-    """Update user data in Supabase"""
-    entry_id = entry.get('id')
-    
-    if not entry_id:
-        logger.error("Cannot update entry without an ID")
-        return False
-    
-    # Remove the id field for the update
-    update_data = entry.copy()
-    del update_data['id']
-    
-    result = supabase.table("user_data").update(update_data).eq("id", entry_id).execute()
-    
-    if hasattr(result, 'error') and result.error:
-        logger.error(f"Error updating user data entry {entry_id}: {result.error}")
-        return False
-    
-    logger.info(f"Successfully updated user data entry {entry_id}")
-    return True
+def update_user_data_entries(supabase: Client, entries: List[Dict[str, Any]]) -> int:
+    """Update many user data entries in chunked bulk updates and return how many were updated"""
+    patches = []
+    for entry in entries:
+        if not entry.get('id'):
+            logger.error("Cannot update entry without an ID")
+            continue
+        patches.append((entry['id'], {key: value for key, value in entry.items() if key != 'id'}))
+    
+    result = bulk_update(supabase, "user_data", patches)
+    for entry_id, error in result.errors.items():
+        logger.error(f"Error updating user data entry {entry_id}: {error}")
+    
+    logger.info(f"Successfully updated {result.updated} user data entries in {result.requests} requests")
+    return result.updated
 
 def migrate_user_data_to_training(supabase: Client, user_id: str, tool: str, intent: str) -> bool:
     """Migrate user data to training data"""
@@ -267,10 +263,7 @@ def main():
             standardized_data.append(standardized_entry)
         
         # Update user data in Supabase
-        updated_count = 0
-        for entry in standardized_data:
-            if update_user_data(supabase, entry):
-                updated_count += 1
+        updated_count = update_user_data_entries(supabase, standardized_data)
         
         logger.info(f"Updated {updated_count} user data entries")
         
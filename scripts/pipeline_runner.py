@@ -0,0 +1,215 @@
+"""
+Declarative stage graph runner for the maintenance scripts
+
+A pipeline is a list of Stage(name, script, args, depends_on). PipelineRunner
+starts every stage whose dependencies have succeeded, runs independent
+stages in parallel on a WarmScriptPool, and keeps going with unaffected
+branches when a stage fails (its dependents are marked blocked). Each run:
+- records per-stage status, start/end times and durations to a state file,
+  so `run(resume=True)` reuses stages that already succeeded with the same
+  script and arguments and restarts from the failed ones
+- reports the critical path, the chain of dependent stages that bounds the
+  wall time, next to the wall time and the sequential sum
+
+Usage:
+    stages = [
+        Stage("guidelines", "scripts/update_system_training_guidelines.py"),
+        Stage("validation", "scripts/validate_training_data_regular.py", ["--fix"], depends_on=["guidelines"]),
+    ]
+    runner = PipelineRunner("update_training_data", stages)
+    ok = runner.run(resume=True)
+    print(runner.format_report())
+"""
+
+import json
+import logging
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from warm_script_pool import WarmScriptPool
+
+PIPELINE_STATE_DIR = os.getenv("PIPELINE_STATE_DIR", ".pipeline_state")
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class Stage:
+    """One script in a pipeline"""
+    name: str
+    script: str
+    args: List[str] = field(default_factory=list)
+    depends_on: List[str] = field(default_factory=list)
+    skip: bool = False
+    timeout: Optional[float] = None
+
+    def signature(self) -> List[Any]:
+        """What a previous success must match to be reused on resume"""
+        return [self.script, list(self.args)]
+
+class PipelineRunner:
+    """
+    Run a stage graph with dependencies in parallel.
+
+    Args:
+        name (str): Pipeline name, used for the state file
+        stages (list): Stage definitions; names must be unique and dependencies acyclic
+        max_parallel (int): Stages run at the same time (default: all ready stages)
+        state_dir (str): Directory holding <name>.json with the last run's stage states
+    """
+
+    def __init__(self, name: str, stages: List[Stage], max_parallel: Optional[int] = None,
+                 state_dir: str = PIPELINE_STATE_DIR):
+        self.name = name
+        self.stages = {stage.name: stage for stage in stages}
+        if len(self.stages) != len(stages):
+            raise ValueError("Stage names must be unique")
+        for stage in stages:
+            for dependency in stage.depends_on:
+                if dependency not in self.stages:
+                    raise ValueError(f"Stage {stage.name} depends on unknown stage {dependency}")
+        self.order = self._topological_order()
+        self.max_parallel = max_parallel or len(stages)
+        self.state_path = os.path.join(state_dir, f"{name}.json")
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.wall_time = 0.0
+
+    def _topological_order(self) -> List[str]:
+        order, visiting, done = [], set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through stage {name}")
+            visiting.add(name)
+            for dependency in self.stages[name].depends_on:
+                visit(dependency)
+            visiting.discard(name)
+            done.add(name)
+            order.append(name)
+
+        for name in self.stages:
+            visit(name)
+        return order
+
+    def _load_state(self) -> Dict[str, Any]:
+        try:
+            with open(self.state_path) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self):
+        os.makedirs(os.path.dirname(self.state_path) or ".", exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump({"pipeline": self.name, "updated_at": datetime.now().isoformat(), "stages": self.results}, f, indent=2)
+        os.replace(tmp_path, self.state_path)
+
+    def _run_stage(self, pool: WarmScriptPool, stage: Stage) -> Dict[str, Any]:
+        logger.info(f"[{stage.name}] Running {stage.script} {' '.join(stage.args)}".rstrip())
+        started_at = datetime.now().isoformat()
+        result = pool.run_file(stage.script, stage.args, name=stage.name, timeout=stage.timeout)
+        if result.ok:
+            logger.info(f"[{stage.name}] Completed in {result.duration:.1f}s")
+            logger.debug(result.stdout)
+        else:
+            reason = "timed out" if result.timed_out else f"failed with exit code {result.returncode}"
+            logger.error(f"[{stage.name}] {stage.script} {reason}")
+            for output in (result.stdout, result.stderr):
+                if output:
+                    logger.error(output)
+        return {
+            "status": "succeeded" if result.ok else "failed",
+            "signature": stage.signature(),
+            "started_at": started_at,
+            "finished_at": datetime.now().isoformat(),
+            "duration": round(result.duration, 3),
+            "returncode": result.returncode
+        }
+
+    def run(self, resume: bool = False) -> bool:
+        """
+        Run the pipeline.
+
+        Args:
+            resume (bool): Reuse stages that succeeded in the previous run
+
+        Returns:
+            bool: True if every stage succeeded, was reused or was skipped
+        """
+        previous = self._load_state().get("stages", {}) if resume else {}
+        self.results = {}
+        for name in self.order:
+            stage = self.stages[name]
+            if stage.skip:
+                self.results[name] = {"status": "skipped", "duration": 0.0}
+            elif previous.get(name, {}).get("status") in ("succeeded", "reused") \
+                    and previous[name].get("signature") == stage.signature():
+                self.results[name] = dict(previous[name], status="reused")
+                logger.info(f"[{name}] Reusing result from the previous run")
+
+        start = time.perf_counter()
+        pending = [name for name in self.order if name not in self.results]
+        with WarmScriptPool(size=min(self.max_parallel, max(1, len(pending)))) as pool, \
+                ThreadPoolExecutor(max_workers=self.max_parallel) as executor:
+            running = {}
+            while pending or running:
+                for name in list(pending):
+                    dependency_states = [self.results.get(d, {}).get("status") for d in self.stages[name].depends_on]
+                    if any(state in ("failed", "blocked") for state in dependency_states):
+                        self.results[name] = {"status": "blocked", "duration": 0.0}
+                        logger.warning(f"[{name}] Blocked by a failed dependency")
+                        pending.remove(name)
+                    elif all(state in ("succeeded", "reused", "skipped") for state in dependency_states) \
+                            and len(running) < self.max_parallel:
+                        running[executor.submit(self._run_stage, pool, self.stages[name])] = name
+                        pending.remove(name)
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    try:
+                        self.results[name] = future.result()
+                    except Exception as e:
+                        logger.error(f"[{name}] Error running stage: {str(e)}")
+                        self.results[name] = {"status": "failed", "duration": 0.0, "error": str(e)}
+                    self._save_state()
+        self.wall_time = time.perf_counter() - start
+        self._save_state()
+        return all(r["status"] in ("succeeded", "reused", "skipped") for r in self.results.values())
+
+    def critical_path(self) -> Tuple[List[str], float]:
+        """Longest chain of dependent stages by this run's durations"""
+        best: Dict[str, Tuple[float, List[str]]] = {}
+        for name in self.order:
+            result = self.results.get(name, {})
+            duration = result.get("duration", 0.0) if result.get("status") in ("succeeded", "failed") else 0.0
+            chain_time, chain = max(
+                (best[d] for d in self.stages[name].depends_on), default=(0.0, []), key=lambda item: item[0]
+            )
+            best[name] = (chain_time + duration, chain + [name])
+        if not best:
+            return [], 0.0
+        total, chain = max(best.values(), key=lambda item: item[0])
+        return chain, total
+
+    def format_report(self) -> str:
+        """Per-stage timing plus the critical path"""
+        lines = [f"Pipeline {self.name}:", f"{'stage':<24} {'status':<10} {'seconds':>8}  depends on"]
+        for name in self.order:
+            result = self.results.get(name, {})
+            lines.append(
+                f"{name:<24} {result.get('status', '-'):<10} {result.get('duration', 0.0):>8.1f}  "
+                f"{', '.join(self.stages[name].depends_on) or '-'}"
+            )
+        chain, total = self.critical_path()
+        sequential = sum(r.get("duration", 0.0) for r in self.results.values() if r.get("status") in ("succeeded", "failed"))
+        lines.append(f"Critical path: {' -> '.join(chain) or '-'} ({total:.1f}s)")
+        lines.append(f"Wall time: {self.wall_time:.1f}s (stages run back to back: {sequential:.1f}s)")
+        return "\n".join(lines)
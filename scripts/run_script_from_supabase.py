@@ -3,11 +3,10 @@ import sys
 import json
 import logging
 import argparse
-import tempfile
-import subprocess
 from typing import Dict, Any, List
 from supabase import create_client, Client
 from dotenv import load_dotenv
+from warm_script_pool import get_script_pool
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -52,34 +51,21 @@ def list_scripts(category: str = None) -> List[Dict[str, Any]]:
         logger.error(f"Error listing scripts: {str(e)}")
         return []
 
-def run_script(script: Dict[str, Any], args: List[str] = None) -> bool:
-    """Run a script from the scripts table."""
+def run_script(script: Dict[str, Any], args: List[str] = None, timeout: float = None) -> bool:
+    """Run a script from the scripts table in a warm worker of the script pool."""
     try:
-        # Create a temporary file
-        with tempfile.NamedTemporaryFile(suffix='.py', delete=False) as temp_file:
-            # Write the script content to the temporary file
-            temp_file.write(script['script_content'].encode('utf-8'))
-            temp_file_path = temp_file.name
-        
-        # Build the command
-        cmd = [sys.executable, temp_file_path]
-        if args:
-            cmd.extend(args)
-        
-        # Run the script
         logger.info(f"Running script: {script['name']}")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = get_script_pool().run(script['script_content'], args, name=script['name'], timeout=timeout)
         
         # Print the output
         if result.stdout:
             print(result.stdout)
         if result.stderr:
             print(result.stderr, file=sys.stderr)
+        if result.timed_out:
+            logger.error(f"Script {script['name']} timed out")
         
-        # Clean up
-        os.unlink(temp_file_path)
-        
-        return result.returncode == 0
+        return result.ok
     except Exception as e:
         logger.error(f"Error running script: {str(e)}")
         return False
@@ -89,6 +75,7 @@ def main():
     parser.add_argument('--list', action='store_true', help='List all available scripts')
     parser.add_argument('--category', type=str, help='Category of scripts to list or run')
     parser.add_argument('--name', type=str, help='Name of the script to run')
+    parser.add_argument('--timeout', type=float, help='Seconds before the script is killed')
     parser.add_argument('args', nargs=argparse.REMAINDER, help='Arguments to pass to the script')
     
     args = parser.parse_args()
@@ -110,7 +97,7 @@ def main():
         # Run a specific script
         script = get_script(args.name, args.category)
         if script:
-            run_script(script, args.args)
+            run_script(script, args.args, args.timeout)
         else:
             print(f"Script not found: {args.name}")
     else:
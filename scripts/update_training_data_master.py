@@ -1,19 +1,27 @@
 #!/usr/bin/env python3
 """
-Master script to run all steps in sequence to update and standardize training data.
+Master script to run all steps to update and standardize training data.
 This script orchestrates the entire process of updating system_training guidelines,
 standardizing training data, enhancing applied guidelines tracking, analyzing effectiveness,
 and validating the results.
+
+The steps are declared as a stage graph (see build_stages) and run by
+PipelineRunner: standardization only touches local files, so it runs in
+parallel with the Supabase stages. Analysis and validation read the
+applied_guidelines that enhancement rewrites, so they wait for it and then run
+in parallel with each other. With --fix-validation, validation rewrites rows
+that analysis reads, so it runs after analysis instead. A failed run can be
+continued from the failed stage with --resume.
 """
 
 import os
 import sys
 import logging
 import argparse
-import subprocess
 from typing import List, Dict, Any
 from pathlib import Path
 from datetime import datetime
+from pipeline_runner import PipelineRunner, Stage
 
 # Configure logging
 logging.basicConfig(
@@ -31,84 +39,59 @@ def parse_arguments():
     parser.add_argument('--skip-validation', action='store_true', help='Skip the validation step')
     parser.add_argument('--fix-validation', action='store_true', help='Fix issues found during validation')
     parser.add_argument('--report-only', action='store_true', help='Only generate reports, do not save to Supabase')
+    parser.add_argument('--resume', action='store_true', help='Reuse stages that succeeded in the previous run')
+    parser.add_argument('--max-parallel', type=int, default=None, help='Maximum number of stages run at once')
     return parser.parse_args()
 
-def run_script(script_name: str, args: List[str] = None) -> bool:
-    """Run a Python script and return True if successful"""
-    logger.info(f"Running script: {script_name}")
-    
-    # Build the command
-    command = [sys.executable, script_name]
-    if args:
-        command.extend(args)
-    
-    # Run the command
-    try:
-        result = subprocess.run(command, check=True, capture_output=True, text=True)
-        logger.info(f"Script {script_name} completed successfully")
-        logger.debug(result.stdout)
-        return True
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Script {script_name} failed with exit code {e.returncode}")
-        logger.error(e.stdout)
-        logger.error(e.stderr)
-        return False
+def build_stages(args) -> List[Stage]:
+    """Stage graph of the training data update"""
+    validation_args = []
+    if args.fix_validation:
+        validation_args.append("--fix")
+    if args.report_only:
+        validation_args.append("--report-only")
+    validation_depends_on = ["enhancement"]
+    if args.fix_validation:
+        validation_depends_on.append("analysis")
+
+    return [
+        # Step 1: Update system_training guidelines
+        Stage("guidelines", "scripts/update_system_training_guidelines.py"),
+        # Step 2: Standardize training data (local training_data_local files only)
+        Stage("standardization", "scripts/standardize_training_data.py",
+              skip=args.skip_standardization),
+        # Step 3: Enhance applied guidelines tracking
+        Stage("enhancement", "scripts/enhance_applied_guidelines.py",
+              depends_on=["guidelines"], skip=args.skip_enhancement),
+        # Step 4: Analyze guideline effectiveness
+        Stage("analysis", "scripts/analyze_guideline_effectiveness.py",
+              depends_on=["enhancement"], skip=args.skip_analysis),
+        # Step 5: Validate training data. With --fix-validation it writes fixed
+        # applied_guidelines/execution_details back to training_data, which
+        # analysis reads, so it waits for analysis to keep the report from
+        # mixing pre- and post-fix rows; report-only validation runs alongside it
+        Stage("validation", "scripts/validate_training_data_regular.py", validation_args,
+              depends_on=validation_depends_on, skip=args.skip_validation)
+    ]
 
 def main():
-    """Main function to run all steps in sequence"""
+    """Main function to run all steps, independent ones in parallel"""
     try:
         # Parse command line arguments
         args = parse_arguments()
         
         logger.info("Starting training data update process")
         
-        # Step 1: Update system_training guidelines
-        logger.info("Step 1: Updating system_training guidelines")
-        if not run_script("scripts/update_system_training_guidelines.py"):
-            logger.error("Failed to update system_training guidelines")
-            return
-        
-        # Step 2: Standardize training data
-        if not args.skip_standardization:
-            logger.info("Step 2: Standardizing training data")
-            if not run_script("scripts/standardize_training_data.py"):
-                logger.error("Failed to standardize training data")
-                return
-        else:
-            logger.info("Skipping standardization step")
-        
-        # Step 3: Enhance applied guidelines tracking
-        if not args.skip_enhancement:
-            logger.info("Step 3: Enhancing applied guidelines tracking")
-            if not run_script("scripts/enhance_applied_guidelines.py"):
-                logger.error("Failed to enhance applied guidelines tracking")
-                return
-        else:
-            logger.info("Skipping enhancement step")
+        runner = PipelineRunner("update_training_data", build_stages(args), max_parallel=args.max_parallel)
+        success = runner.run(resume=args.resume)
+        for line in runner.format_report().splitlines():
+            logger.info(line)
         
-        # Step 4: Analyze guideline effectiveness
-        if not args.skip_analysis:
-            logger.info("Step 4: Analyzing guideline effectiveness")
-            if not run_script("scripts/analyze_guideline_effectiveness.py"):
-                logger.error("Failed to analyze guideline effectiveness")
-                return
-        else:
-            logger.info("Skipping analysis step")
-        
-        # Step 5: Validate training data
-        if not args.skip_validation:
-            logger.info("Step 5: Validating training data")
-            validation_args = []
-            if args.fix_validation:
-                validation_args.append("--fix")
-            if args.report_only:
-                validation_args.append("--report-only")
-            
-            if not run_script("scripts/validate_training_data_regular.py", validation_args):
-                logger.error("Failed to validate training data")
-                return
-        else:
-            logger.info("Skipping validation step")
+        if not success:
+            failed = [name for name, result in runner.results.items() if result["status"] in ("failed", "blocked")]
+            logger.error(f"Training data update failed at: {', '.join(failed)}")
+            logger.error("Fix the failing stage and rerun with --resume to continue from it")
+            return
         
         logger.info("Training data update process completed successfully")
         logger.info("Next steps:")
@@ -121,4 +104,4 @@ def main():
         raise
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
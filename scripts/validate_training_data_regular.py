@@ -3,18 +3,33 @@
 Script to run regular validation of the training data.
 This ensures that all training data continues to follow the standardized format
 and properly references the system_training guidelines.
+
+The whole table is validated as a stream: pages of PAGE_SIZE rows are read
+in id order with keyset pagination and handed to a worker pool, which
+validates each page and writes its fixes back as chunked bulk updates, so memory
+is bounded by the pages in flight rather than the table size. After each
+page finishes, the last id and running totals are written to a checkpoint
+file, and an interrupted run can continue from it with --resume.
+
+Usage:
+    python scripts/validate_training_data_regular.py --fix
+    python scripts/validate_training_data_regular.py --fix --resume
 """
 
 import os
+import copy
 import json
 import logging
 import argparse
 import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any, Tuple
 from pathlib import Path
 from datetime import datetime
 from supabase import create_client, Client
 from dotenv import load_dotenv
+from bulk_update import bulk_update
 
 # Configure logging
 logging.basicConfig(
@@ -26,12 +41,20 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+VALIDATION_CHECKPOINT = os.getenv("VALIDATION_CHECKPOINT", ".validation_state/training_data_validation.json")
+PAGE_SIZE = 500
+UPDATE_BATCH_SIZE = 100
+# Columns fix mode may write back; only the ones a fix actually changed are sent
+FIXED_COLUMNS = ['execution_details', 'applied_guidelines']
+
 def parse_arguments():
     """Parse command line arguments"""
     parser = argparse.ArgumentParser(description='Validate training data')
     parser.add_argument('--fix', action='store_true', help='Fix issues found during validation')
     parser.add_argument('--report-only', action='store_true', help='Only generate a report, do not save to Supabase')
-    parser.add_argument('--limit', type=int, default=1000, help='Limit the number of training data entries to validate')
+    parser.add_argument('--limit', type=int, default=None, help='Stop after this many training data entries (default: whole table)')
+    parser.add_argument('--workers', type=int, default=4, help='Pages validated and saved in parallel')
+    parser.add_argument('--resume', action='store_true', help='Continue from the checkpoint of an interrupted run')
     return parser.parse_args()
 
 def connect_to_supabase() -> Client:
@@ -44,15 +67,34 @@ def connect_to_supabase() -> Client:
     
     return create_client(supabase_url, supabase_key)
 
-def get_training_data(supabase: Client, limit: int = 1000) -> List[Dict[str, Any]]:
-    """Fetch training data from the training_data table"""
-    logger.info(f"Fetching up to {limit} training data entries")
-    result = supabase.table('training_data').select('*').limit(limit).execute()
-    
-    if hasattr(result, 'error') and result.error:
-        raise Exception(f"Error fetching training data: {result.error}")
-    
-    return result.data
+def get_training_data(supabase: Client, after_id: str = None, page_size: int = PAGE_SIZE):
+    """
+    Yield pages of training data in id order using keyset pagination.
+
+    Args:
+        supabase: Supabase client
+        after_id (str): Start after this id (default: from the beginning)
+        page_size (int): Rows per page
+
+    Yields:
+        list: Up to page_size rows per page
+    """
+    logger.info(f"Fetching training data after id {after_id}" if after_id else "Fetching training data")
+    while True:
+        query = supabase.table('training_data').select('*')
+        if after_id:
+            query = query.gt('id', after_id)
+        result = query.order('id').limit(page_size).execute()
+        
+        if hasattr(result, 'error') and result.error:
+            raise Exception(f"Error fetching training data: {result.error}")
+        
+        if not result.data:
+            return
+        yield result.data
+        if len(result.data) < page_size:
+            return
+        after_id = result.data[-1]['id']
 
 def get_guidelines(supabase: Client) -> Dict[str, Dict[str, Any]]:
     """Fetch all guidelines from system_training table and index by ID"""
@@ -145,8 +187,9 @@ def validate_training_data(training_data: List[Dict[str, Any]], guidelines_index
             # Fix issues if requested
             if fix:
                 fixed_entry = fix_issues(entry, issues, guidelines_index)
-                if fixed_entry:
-                    fixed_entries.append(fixed_entry)
+                changes = changed_columns(entry, fixed_entry) if fixed_entry else {}
+                if changes:
+                    fixed_entries.append(dict(changes, id=entry_id))
                     validation_results['fixed_entries'] += 1
         else:
             validation_results['valid_entries'] += 1
@@ -183,7 +226,7 @@ def validate_endpoint(endpoint: Dict[str, Any]) -> List[str]:
 
 def fix_issues(entry: Dict[str, Any], issues: List[str], guidelines_index: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
     """Fix issues found during validation"""
-    fixed_entry = entry.copy()
+    fixed_entry = copy.deepcopy(entry)
     
     # Fix missing required fields
     if "Missing required field: tool" in issues:
@@ -252,6 +295,14 @@ def fix_issues(entry: Dict[str, Any], issues: List[str], guidelines_index: Dict[
     
     return fixed_entry
 
+def changed_columns(entry: Dict[str, Any], fixed_entry: Dict[str, Any]) -> Dict[str, Any]:
+    """The FIXED_COLUMNS values that fix_issues changed, so untouched columns aren't overwritten"""
+    return {
+        column: fixed_entry[column]
+        for column in FIXED_COLUMNS
+        if column in fixed_entry and fixed_entry[column] != entry.get(column)
+    }
+
 def save_validation_results(supabase: Client, validation_results: Dict[str, Any], report_only: bool = False) -> None:
     """Save validation results to Supabase"""
     logger.info("Saving validation results")
@@ -282,29 +333,143 @@ def save_validation_results(supabase: Client, validation_results: Dict[str, Any]
     else:
         logger.info("Report-only mode: Not saving validation results to Supabase")
 
-def save_fixed_entries(supabase: Client, fixed_entries: List[Dict[str, Any]]) -> None:
-    """Save fixed entries back to the training_data table"""
+def save_fixed_entries(supabase: Client, fixed_entries: List[Dict[str, Any]], batch_size: int = UPDATE_BATCH_SIZE) -> int:
+    """
+    Save fixed entries back to the training_data table in chunked bulk updates.
+
+    Only the FIXED_COLUMNS present on each entry are written, so entries
+    reduced to their changed columns (see changed_columns) patch nothing else.
+
+    Returns:
+        int: Number of entries saved
+    """
     if not fixed_entries:
         logger.info("No fixed entries to save")
-        return
+        return 0
     
     logger.info(f"Saving {len(fixed_entries)} fixed entries")
     
+    patches = []
     for entry in fixed_entries:
-        # Extract the ID and updated data
-        entry_id = entry['id']
-        updated_data = {
-            'execution_details': entry.get('execution_details', []),
-            'applied_guidelines': entry.get('applied_guidelines', {})
-        }
-        
-        # Update the entry in the database
-        result = supabase.table('training_data').update(updated_data).eq('id', entry_id).execute()
-        
-        if hasattr(result, 'error') and result.error:
-            logger.error(f"Error updating training data entry {entry_id}: {result.error}")
-        else:
-            logger.info(f"Successfully updated training data entry {entry_id}")
+        patch = {column: entry[column] for column in FIXED_COLUMNS if column in entry}
+        if patch:
+            patches.append((entry['id'], patch))
+    
+    result = bulk_update(supabase, 'training_data', patches, chunk_size=batch_size)
+    for entry_id, error in result.errors.items():
+        logger.error(f"Error updating training data entry {entry_id}: {error}")
+    
+    logger.info(f"Successfully updated {result.updated} training data entries")
+    return result.updated
+
+def merge_validation_results(total: Dict[str, Any], page: Dict[str, Any]) -> None:
+    """Add a page's validation results into the running totals"""
+    for key in ('total_entries', 'valid_entries', 'invalid_entries', 'fixed_entries'):
+        total[key] = total.get(key, 0) + page.get(key, 0)
+    issues_by_type = total.setdefault('issues_by_type', {})
+    for issue_type, count in page.get('issues_by_type', {}).items():
+        issues_by_type[issue_type] = issues_by_type.get(issue_type, 0) + count
+
+def load_checkpoint(path: str = VALIDATION_CHECKPOINT) -> Dict[str, Any]:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_checkpoint(checkpoint: Dict[str, Any], path: str = VALIDATION_CHECKPOINT) -> None:
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(dict(checkpoint, updated_at=datetime.now().isoformat()), f, indent=2)
+    os.replace(tmp_path, path)
+
+def validate_training_data_stream(supabase: Client, guidelines_index: Dict[str, Dict[str, Any]], fix: bool = False,
+                                  workers: int = 4, resume: bool = False, limit: int = None,
+                                  checkpoint_path: str = VALIDATION_CHECKPOINT) -> Dict[str, Any]:
+    """
+    Validate the whole training_data table page by page.
+
+    Pages are validated (and, with fix, their fixes saved) in a thread pool
+    while the next pages are fetched. At most 2 * workers pages are held at
+    once. Pages complete in order into the checkpoint, so a resumed run
+    never skips a page that wasn't finished. If a page fails, no more pages
+    are fetched, the ones in flight are waited for, the checkpoint stays at
+    the last page before the failure and the first error is raised.
+
+    Args:
+        supabase: Supabase client
+        guidelines_index (dict): Guidelines by ID
+        fix (bool): Fix issues and save the fixed entries
+        workers (int): Pages processed in parallel
+        resume (bool): Continue after the checkpointed id with its totals
+        limit (int): Stop after about this many entries (default: whole table)
+        checkpoint_path (str): Checkpoint file
+
+    Returns:
+        dict: Validation results for the whole table
+    """
+    checkpoint = load_checkpoint(checkpoint_path) if resume else {}
+    if checkpoint.get('completed') or checkpoint.get('fix', fix) != fix:
+        checkpoint = {}
+    if checkpoint:
+        logger.info(f"Resuming after id {checkpoint['after_id']} ({checkpoint['results']['total_entries']} entries already validated)")
+    results = checkpoint.get('results') or {
+        'total_entries': 0,
+        'valid_entries': 0,
+        'invalid_entries': 0,
+        'issues_by_type': {},
+        'fixed_entries': 0
+    }
+    after_id = checkpoint.get('after_id')
+    first_error = None
+    
+    def process_page(page):
+        page_results, fixed_entries = validate_training_data(page, guidelines_index, fix)
+        if fix and fixed_entries:
+            page_results['fixed_entries'] = save_fixed_entries(supabase, fixed_entries)
+        return page_results, page[-1]['id']
+    
+    def complete(future):
+        nonlocal after_id, first_error
+        try:
+            page_results, page_after_id = future.result()
+        except Exception as e:
+            logger.error(f"Error validating page after id {after_id}: {str(e)}")
+            first_error = first_error or e
+            return
+        if first_error is not None:
+            # An earlier page failed; the checkpoint stays before it, so a resumed run redoes this page
+            return
+        after_id = page_after_id
+        merge_validation_results(results, page_results)
+        save_checkpoint({'after_id': after_id, 'fix': fix, 'results': results}, checkpoint_path)
+        logger.info(f"Validated {results['total_entries']} entries ({results['invalid_entries']} invalid)")
+    
+    fetched = 0
+    in_flight = deque()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        try:
+            for page in get_training_data(supabase, after_id):
+                if limit is not None and fetched >= limit:
+                    break
+                if limit is not None:
+                    page = page[:limit - fetched]
+                fetched += len(page)
+                in_flight.append(executor.submit(process_page, page))
+                while len(in_flight) >= 2 * max(1, workers) or (in_flight and in_flight[0].done()):
+                    complete(in_flight.popleft())
+                if first_error is not None:
+                    break
+        finally:
+            # Checkpoint the pages already submitted (their fixes may be saved) before any error propagates
+            while in_flight:
+                complete(in_flight.popleft())
+    if first_error is not None:
+        raise first_error
+    
+    save_checkpoint({'after_id': after_id, 'fix': fix, 'results': results, 'completed': True}, checkpoint_path)
+    return results
 
 def main():
     """Main function to validate training data"""
@@ -321,16 +486,14 @@ def main():
         # Connect to Supabase
         supabase = connect_to_supabase()
         
-        # Get training data
-        training_data = get_training_data(supabase, args.limit)
-        logger.info(f"Found {len(training_data)} training data entries")
-        
         # Get guidelines
         guidelines_index = get_guidelines(supabase)
         logger.info(f"Found {len(guidelines_index)} guidelines")
         
-        # Validate training data
-        validation_results, fixed_entries = validate_training_data(training_data, guidelines_index, args.fix)
+        # Validate training data, saving fixes page by page in fix mode
+        validation_results = validate_training_data_stream(
+            supabase, guidelines_index, fix=args.fix, workers=args.workers, resume=args.resume, limit=args.limit
+        )
         
         # Print validation results
         logger.info(f"Validation completed: {validation_results['valid_entries']} valid entries, {validation_results['invalid_entries']} invalid entries")
@@ -345,10 +508,6 @@ def main():
         # Save validation results
         save_validation_results(supabase, validation_results, args.report_only)
         
-        # Save fixed entries if in fix mode
-        if args.fix and fixed_entries:
-            save_fixed_entries(supabase, fixed_entries)
-        
         logger.info("Training data validation completed successfully")
         
     except Exception as e:
@@ -0,0 +1,300 @@
+"""
+Pool of warm, pre-forked interpreters for running stored scripts
+
+run_script_from_supabase.run_script and update_training_data_master.run_script
+used to launch a fresh `python script.py` per run, paying interpreter startup
+and the supabase/dotenv/requests imports every time. WarmScriptPool keeps
+`size` idle worker processes ready with those modules already imported:
+- workers are forked from a forkserver that preloaded the modules (spawned
+  and preloaded while idle where fork isn't available), so startup happens
+  off the latency path
+- each job runs in its own worker, which exits afterwards, so scripts can't
+  leak state into each other
+- scripts are compiled once per content hash; the source is written to
+  SCRIPT_CACHE_DIR/<hash>.py so __file__ and tracebacks still work
+- stdout/stderr are captured at the file descriptor level; jobs run to
+  completion unless the caller (or SCRIPT_TIMEOUT_SECONDS) sets a timeout,
+  and jobs that exceed it are killed (output up to that point is kept)
+
+Usage:
+    with WarmScriptPool(size=2) as pool:
+        result = pool.run(script["script_content"], ["--fix"], name=script["name"], timeout=600)
+        print(result.returncode, result.stdout)
+
+        result = pool.run_file("scripts/validate_training_data_regular.py", ["--report-only"])
+"""
+
+import atexit
+import hashlib
+import logging
+import marshal
+import multiprocessing
+import os
+import queue
+import sys
+import tempfile
+import threading
+import time
+import traceback
+import types
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+SCRIPT_POOL_SIZE = int(os.getenv("SCRIPT_POOL_SIZE", "2"))
+# Default per-job timeout; unset means scripts run to completion, as subprocess.run did
+SCRIPT_TIMEOUT_SECONDS = float(os.environ["SCRIPT_TIMEOUT_SECONDS"]) if os.getenv("SCRIPT_TIMEOUT_SECONDS") else None
+SCRIPT_CACHE_DIR = os.getenv("SCRIPT_CACHE_DIR", os.path.join(tempfile.gettempdir(), "script_pool_cache"))
+# Modules imported once by the forkserver/idle workers instead of by every script
+SCRIPT_POOL_PRELOAD = [m for m in os.getenv("SCRIPT_POOL_PRELOAD", "dotenv,supabase,requests,json,logging").split(",") if m]
+
+logger = logging.getLogger(__name__)
+
+@dataclass
+class ScriptResult:
+    """Outcome of one pooled script run"""
+    name: str
+    content_hash: str
+    returncode: Optional[int]
+    stdout: str
+    stderr: str
+    duration: float
+    timed_out: bool = False
+
+    @property
+    def ok(self) -> bool:
+        return self.returncode == 0 and not self.timed_out
+
+def content_hash(source: str) -> str:
+    return hashlib.sha256(source.encode("utf-8")).hexdigest()
+
+def _preload(modules: List[str]):
+    for module in modules:
+        try:
+            __import__(module)
+        except ImportError:
+            pass
+
+def _exit_code(code: Any) -> int:
+    """Map a SystemExit code to a process return code like the interpreter does"""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+def _execute(job: Dict[str, Any]) -> int:
+    """Run one job as __main__ in this (fresh) worker; returns its exit code"""
+    out_fd = os.open(job["stdout_path"], os.O_WRONLY)
+    err_fd = os.open(job["stderr_path"], os.O_WRONLY)
+    os.dup2(out_fd, 1)
+    os.dup2(err_fd, 2)
+    os.close(out_fd)
+    os.close(err_fd)
+
+    path = job["path"]
+    module = types.ModuleType("__main__")
+    module.__file__ = path
+    module.__builtins__ = __builtins__
+    sys.modules["__main__"] = module
+    sys.argv = [path] + list(job["args"])
+    sys.path[0] = os.path.dirname(os.path.abspath(path))
+    if job.get("cwd"):
+        os.chdir(job["cwd"])
+
+    try:
+        exec(marshal.loads(job["code"]), module.__dict__)
+        returncode = 0
+    except SystemExit as e:
+        returncode = _exit_code(e.code)
+    except BaseException:
+        traceback.print_exc()
+        returncode = 1
+    finally:
+        # Worker processes leave via os._exit, so run the script's exit handlers here
+        atexit._run_exitfuncs()
+        sys.stdout.flush()
+        sys.stderr.flush()
+    return returncode
+
+def _worker_main(conn, preload: List[str]):
+    """Idle until handed a job, run it, report the exit code and exit"""
+    _preload(preload)
+    try:
+        job = conn.recv()
+    except EOFError:
+        return
+    if job is None:
+        return
+    returncode = _execute(job)
+    conn.send(returncode)
+    conn.close()
+    os._exit(returncode if 0 <= returncode < 256 else 1)
+
+class WarmScriptPool:
+    """
+    Pre-forked pool of warm interpreters, one job per worker.
+
+    Args:
+        size (int): Idle workers kept ready
+        preload (list): Modules imported before a worker receives a job
+        timeout (float): Default per-job timeout in seconds (None: no timeout)
+        cache_dir (str): Where compiled scripts are written by content hash
+    """
+
+    def __init__(self, size: int = SCRIPT_POOL_SIZE, preload: Optional[List[str]] = None,
+                 timeout: Optional[float] = SCRIPT_TIMEOUT_SECONDS, cache_dir: str = SCRIPT_CACHE_DIR):
+        self.size = max(1, size)
+        self.preload = list(SCRIPT_POOL_PRELOAD if preload is None else preload)
+        self.timeout = timeout
+        self.cache_dir = cache_dir
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            self._context = multiprocessing.get_context("forkserver")
+            self._context.set_forkserver_preload(self.preload)
+        else:
+            self._context = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue" = queue.Queue()
+        self._compiled: Dict[Tuple[str, str], bytes] = {}
+        self._compiled_lock = threading.Lock()
+        self._closed = False
+        for _ in range(self.size):
+            self._spawn_worker()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _spawn_worker(self):
+        parent_conn, child_conn = self._context.Pipe()
+        process = self._context.Process(target=_worker_main, args=(child_conn, self.preload), daemon=True)
+        process.start()
+        child_conn.close()
+        self._idle.put((process, parent_conn))
+
+    def _replenish(self):
+        if not self._closed:
+            threading.Thread(target=self._spawn_worker, daemon=True).start()
+
+    def _compile(self, source: str, path: str, digest: str) -> bytes:
+        with self._compiled_lock:
+            code = self._compiled.get((digest, path))
+            if code is None:
+                code = marshal.dumps(compile(source, path, "exec"))
+                self._compiled[(digest, path)] = code
+            return code
+
+    def _cached_path(self, source: str, digest: str) -> str:
+        """Write the script to the cache once per content hash"""
+        path = os.path.join(self.cache_dir, f"{digest}.py")
+        if not os.path.exists(path):
+            os.makedirs(self.cache_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(source)
+            os.replace(tmp_path, path)
+        return path
+
+    def run(self, source: str, args: Optional[List[str]] = None, name: Optional[str] = None,
+            timeout: Optional[float] = None, cwd: Optional[str] = None, path: Optional[str] = None) -> ScriptResult:
+        """
+        Run script source in a warm worker.
+
+        Args:
+            source (str): Python source of the script
+            args (list): Command line arguments (sys.argv[1:])
+            name (str): Name used in logs and the result
+            timeout (float): Seconds before the worker is killed (default: the pool's timeout)
+            cwd (str): Working directory for the script (default: inherited)
+            path (str): Path the script runs as (__file__, sys.path[0]); defaults to the
+                content-hash cache file
+
+        Returns:
+            ScriptResult
+        """
+        if self._closed:
+            raise RuntimeError("WarmScriptPool is closed")
+        digest = content_hash(source)
+        path = path or self._cached_path(source, digest)
+        name = name or os.path.basename(path)
+        timeout = self.timeout if timeout is None else timeout
+        try:
+            code = self._compile(source, path, digest)
+        except SyntaxError:
+            return ScriptResult(name, digest, 1, "", traceback.format_exc(), 0.0)
+
+        with tempfile.NamedTemporaryFile(prefix="script_out_", delete=False) as out_file, \
+                tempfile.NamedTemporaryFile(prefix="script_err_", delete=False) as err_file:
+            stdout_path, stderr_path = out_file.name, err_file.name
+
+        process, conn = self._idle.get()
+        self._replenish()
+        start = time.perf_counter()
+        timed_out = False
+        returncode = None
+        try:
+            conn.send({
+                "code": code, "path": path, "args": args or [], "cwd": cwd,
+                "stdout_path": stdout_path, "stderr_path": stderr_path
+            })
+            if conn.poll(timeout):
+                try:
+                    returncode = conn.recv()
+                except EOFError:
+                    pass  # Worker died before reporting; use its exit code below
+            else:
+                timed_out = True
+                logger.error(f"Script {name} timed out after {timeout}s; killing worker")
+                process.kill()
+            process.join(5)
+            if returncode is None and not timed_out:
+                returncode = process.exitcode
+            duration = time.perf_counter() - start
+            with open(stdout_path, encoding="utf-8", errors="replace") as f:
+                stdout = f.read()
+            with open(stderr_path, encoding="utf-8", errors="replace") as f:
+                stderr = f.read()
+        finally:
+            conn.close()
+            for output_path in (stdout_path, stderr_path):
+                try:
+                    os.unlink(output_path)
+                except OSError:
+                    pass
+
+        return ScriptResult(name, digest, returncode, stdout, stderr, duration, timed_out)
+
+    def run_file(self, script_path: str, args: Optional[List[str]] = None, **kwargs) -> ScriptResult:
+        """Run a script file from disk in a warm worker, as `python script_path args` would"""
+        with open(script_path, encoding="utf-8") as f:
+            source = f.read()
+        return self.run(source, args, name=kwargs.pop("name", script_path), path=os.path.abspath(script_path), **kwargs)
+
+    def close(self):
+        """Shut down the idle workers"""
+        self._closed = True
+        while True:
+            try:
+                process, conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.send(None)
+            except OSError:
+                pass
+            conn.close()
+            process.join(1)
+            if process.is_alive():
+                process.kill()
+
+_pool: Optional[WarmScriptPool] = None
+_pool_lock = threading.Lock()
+
+def get_script_pool() -> WarmScriptPool:
+    """Return the process-wide script pool, starting it on first use"""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = WarmScriptPool()
+        return _pool
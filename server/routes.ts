@@ -759,6 +759,91 @@ export async function registerRoutes(app: Express): Promise<Server> {
     }
   });
   
+  // Create many training data rows in one request.
+  // Body: { items: [{ id?, tool, intent, query, response, metadata }, ...] }
+  // Responds with per-row results so callers can see exactly which rows failed.
+  // Rows whose client-supplied id already exists are skipped and reported as
+  // inserted, so a resent batch doesn't create duplicates.
+  const MAX_TRAINING_BATCH_SIZE = 1000;
+  router.post("/training/batch", async (req, res) => {
+    try {
+      const items = Array.isArray(req.body) ? req.body : req.body?.items;
+      
+      if (!Array.isArray(items) || items.length === 0) {
+        return res.status(400).json({ message: "Request body must include a non-empty items array" });
+      }
+      if (items.length > MAX_TRAINING_BATCH_SIZE) {
+        return res.status(400).json({ 
+          message: `Batch too large: ${items.length} items (max ${MAX_TRAINING_BATCH_SIZE})` 
+        });
+      }
+      
+      const results: Array<{ index: number; status: "inserted" | "failed"; id?: string; error?: string }> = [];
+      const validRows: Array<{ index: number; entry: any }> = [];
+      
+      // Validate each row independently
+      items.forEach((item: any, index: number) => {
+        const { id, tool, intent, query, response, metadata } = item || {};
+        if (id !== undefined && (typeof id !== "string" || id.length === 0)) {
+          results.push({ index, status: "failed", error: "id must be a non-empty string" });
+        } else if (!tool || !intent || !query || !response) {
+          results.push({ 
+            index, 
+            status: "failed", 
+            error: "Missing required fields: tool, intent, query, and response are required" 
+          });
+        } else {
+          validRows.push({ 
+            index, 
+            entry: { 
+              id: id || `${Date.now()}-${Math.random().toString(36).substring(2, 15)}`, 
+              tool, intent, query, response, metadata: metadata || {} 
+            } 
+          });
+        }
+      });
+      
+      if (validRows.length > 0) {
+        try {
+          // Fast path: one multi-row insert for the whole batch
+          await storage.createTrainingDataBatch(validRows.map(row => row.entry));
+          validRows.forEach(row => {
+            results.push({ index: row.index, status: "inserted", id: row.entry.id });
+          });
+        } catch (batchError) {
+          // Isolate the failing rows by inserting them one at a time
+          console.error('Batch insert failed, falling back to per-row inserts:', batchError);
+          for (const row of validRows) {
+            try {
+              await storage.createTrainingDataBatch([row.entry]);
+              results.push({ index: row.index, status: "inserted", id: row.entry.id });
+            } catch (rowError) {
+              results.push({ index: row.index, status: "failed", error: handleError(rowError) });
+            }
+          }
+        }
+      }
+      
+      results.sort((a, b) => a.index - b.index);
+      const insertedCount = results.filter(r => r.status === "inserted").length;
+      const failedCount = results.length - insertedCount;
+      
+      console.log(`Training batch: ${insertedCount} inserted, ${failedCount} failed`);
+      
+      res.status(failedCount === 0 ? 201 : 207).json({
+        inserted: insertedCount,
+        failed: failedCount,
+        results
+      });
+    } catch (error) {
+      console.error('Error creating training data batch:', error);
+      res.status(500).json({ 
+        message: "Failed to create training data batch", 
+        error: handleError(error) 
+      });
+    }
+  });
+  
   // Execute SQL query directly (for internal use only)
   router.post("/execute-sql", async (req, res) => {
     try {
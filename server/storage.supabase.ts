@@ -1478,6 +1478,54 @@ export class SupabaseStorage implements IStorage {
     }
   }
   
+  /**
+   * Create many training data entries with a single multi-row insert.
+   * Either every row is inserted or the whole call throws. Entries may carry
+   * their own id; ids that already exist are skipped (and not returned), so
+   * resending a batch is safe.
+   */
+  async createTrainingDataBatch(entries: Array<InsertTrainingData & { id?: string }>): Promise<TrainingData[]> {
+    if (entries.length === 0) {
+      return [];
+    }
+    
+    const now = new Date().toISOString();
+    const rows = entries.map(entry => ({
+      id: entry.id || `${Date.now()}-${Math.random().toString(36).substring(2, 15)}`,
+      tool: entry.tool,
+      intent: entry.intent,
+      query: entry.query,
+      response: entry.response,
+      metadata: entry.metadata || {},
+      created_at: now,
+      updated_at: now
+    }));
+    
+    const { data, error } = await supabase
+      .from(TABLES.TRAINING_DATA)
+      .upsert(rows, { onConflict: 'id', ignoreDuplicates: true })
+      .select();
+    
+    if (error) {
+      console.error('Error creating training data batch:', error);
+      throw new Error(`Failed to create training data batch: ${error.message}`);
+    }
+    
+    console.log(`Successfully inserted ${data?.length || 0} training data rows`);
+    
+    // Transform to match expected schema
+    return (data || []).map(item => ({
+      id: item.id,
+      tool: item.tool,
+      intent: item.intent,
+      query: item.query,
+      response: item.response,
+      metadata: item.metadata || {},
+      createdAt: item.created_at,
+      updatedAt: item.updated_at
+    }));
+  }
+  
   /**
    * Search training data using text search
    */
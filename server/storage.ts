@@ -31,6 +31,7 @@ export interface IStorage {
   // Training Data methods
   getTrainingData(options?: { tool?: string; intent?: string; limit?: number }): Promise<TrainingData[]>;
   createTrainingData(entry: InsertTrainingData): Promise<TrainingData>;
+  createTrainingDataBatch(entries: Array<InsertTrainingData & { id?: string }>): Promise<TrainingData[]>;
   searchTrainingData(query: string, limit?: number): Promise<TrainingData[]>;
 }
 
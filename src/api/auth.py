@@ -3,9 +3,13 @@ from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Optional, Dict, Set, Tuple
 from pydantic import BaseModel
 from uuid import UUID
+from collections import OrderedDict
+import asyncio
+import threading
+import time
 import os
 from supabase import create_client, Client
 from dotenv import load_dotenv
@@ -24,6 +28,10 @@ SECRET_KEY = os.getenv("JWT_SECRET_KEY", "your-secret-key")
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+# Authenticated user cache configuration
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "1024"))
+
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
@@ -40,6 +48,103 @@ class User(BaseModel):
     full_name: Optional[str] = None
     disabled: Optional[bool] = None
 
+class UserCache:
+    """
+    Bounded TTL/LRU cache of access token -> User.
+
+    Entries expire after `ttl` seconds or when the token itself expires,
+    whichever comes first. The least recently used entry is evicted once
+    `max_size` is reached.
+    """
+    def __init__(self, ttl: float = USER_CACHE_TTL_SECONDS, max_size: int = USER_CACHE_MAX_SIZE):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[str, Tuple[User, float]] = OrderedDict()
+        self._tokens_by_user: Dict[str, Set[str]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[User]:
+        with self._lock:
+            entry = self._entries.get(token)
+            if entry is None:
+                self.misses += 1
+                return None
+            user, expires_at = entry
+            if expires_at <= time.monotonic():
+                self._remove(token)
+                self.misses += 1
+                return None
+            self._entries.move_to_end(token)
+            self.hits += 1
+            return user
+
+    def set(self, token: str, user: User, token_exp: Optional[float] = None):
+        ttl = self.ttl
+        if token_exp is not None:
+            ttl = min(ttl, token_exp - time.time())
+        if ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            if token in self._entries:
+                self._remove(token)
+            self._entries[token] = (user, time.monotonic() + ttl)
+            self._tokens_by_user.setdefault(str(user.id), set()).add(token)
+            while len(self._entries) > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate_token(self, token: str):
+        with self._lock:
+            self._remove(token)
+
+    def invalidate_user(self, user_id):
+        """Drop every cached token for a user, e.g. after their row changes"""
+        with self._lock:
+            for token in list(self._tokens_by_user.get(str(user_id), ())):
+                self._remove(token)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tokens_by_user.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": self.hits / lookups if lookups else 0.0
+            }
+
+    def _remove(self, token: str):
+        entry = self._entries.pop(token, None)
+        if entry is None:
+            return
+        user_id = str(entry[0].id)
+        tokens = self._tokens_by_user.get(user_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self._tokens_by_user[user_id]
+
+user_cache = UserCache()
+
+def invalidate_cached_user(user_id):
+    """Invalidation hook for code that updates or disables a user"""
+    user_cache.invalidate_user(user_id)
+
+def get_user_cache_stats() -> Dict[str, float]:
+    return user_cache.stats()
+
 def verify_password(plain_password: str, hashed_password: str):
     return pwd_context.verify(plain_password, hashed_password)
 
@@ -62,6 +167,14 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+    # Fast path: token already verified and its user loaded recently
+    cached_user = user_cache.get(token)
+    if cached_user is not None:
+        if cached_user.disabled:
+            raise HTTPException(status_code=400, detail="Inactive user")
+        return cached_user
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: str = payload.get("sub")
@@ -72,7 +185,8 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
         raise credentials_exception
     
     # Get user from Supabase
-    result = supabase.table("users").select("*").eq("id", str(token_data.user_id)).execute()
+    query = supabase.table("users").select("*").eq("id", str(token_data.user_id))
+    result = await asyncio.to_thread(query.execute)
     
     if not result.data:
         raise credentials_exception
@@ -84,6 +198,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> User:
         full_name=user_data.get("full_name"),
         disabled=user_data.get("disabled", False)
     )
+    user_cache.set(token, user, token_exp=payload.get("exp"))
     
     if user.disabled:
         raise HTTPException(status_code=400, detail="Inactive user")
@@ -1,12 +1,19 @@
-from fastapi import APIRouter, HTTPException, Depends
+from fastapi import APIRouter, HTTPException, Depends, Query, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from datetime import datetime
+import asyncio
+import base64
+import json
 import os
-from openai import OpenAI
+import time
+import uuid
+from openai import AsyncOpenAI
 from supabase import create_client, Client
 from dotenv import load_dotenv
 from .auth import get_current_user, User
+from .response_cache import response_cache
 
 # Load environment variables
 load_dotenv()
@@ -17,8 +24,8 @@ supabase: Client = create_client(
     os.getenv('SUPABASE_KEY', '')
 )
 
-# Initialize Together AI client
-together_client = OpenAI(
+# Initialize Together AI client (async so a slow completion doesn't block the event loop)
+together_client = AsyncOpenAI(
     api_key=os.getenv('TOGETHER_AI_KEY'),
     base_url="https://api.together.xyz/v1"
 )
@@ -37,114 +44,305 @@ class MessageResponse(BaseModel):
     metadata: Dict[str, Any]
     created_at: str
 
+CHAT_MODEL = "meta-llama/Llama-3.3-70B-Instruct-Turbo"
+SYSTEM_PROMPT = "You are a helpful assistant."
+MAX_TOKENS = 1000
+
+def build_chat_messages(content: str) -> List[Dict[str, str]]:
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": content}
+    ]
+
+def build_user_data_row(message: MessageRequest, current_user: User, ai_response: str,
+                        cached: bool = False) -> Dict[str, Any]:
+    """Build a user_data row with the training_data compatible schema"""
+    return {
+        "user_id": str(current_user.id),
+        "tool": "chat",  # Default tool for general chat
+        "intent": "general_chat",  # Default intent
+        "query": message.content,
+        "response": ai_response,
+        "systems": ["together_ai"],
+        "workflow": ["receive_query", "generate_response"],
+        "execution_details": [
+            {
+                "step": "generate_response",
+                "tool": "response_cache" if cached else "together_ai",
+                "status": "success",
+                "timestamp": datetime.utcnow().isoformat()
+            }
+        ],
+        "metadata": message.metadata,
+        "follow_up_queries": [],
+        "follow_up_responses": [],
+        "follow_up_context": {},
+        "created_at": datetime.utcnow().isoformat()
+    }
+
+async def store_user_data_row(user_message: Dict[str, Any]) -> Dict[str, Any]:
+    # The Supabase client is synchronous, so run it in a worker thread
+    result = await asyncio.to_thread(
+        supabase.table('user_data').insert(user_message).execute
+    )
+
+    if not result.data:
+        raise HTTPException(status_code=500, detail="Failed to store message")
+
+    return result.data[0]
+
+def to_message_response(stored_message: Dict[str, Any], ai_response: str) -> MessageResponse:
+    return MessageResponse(
+        id=stored_message['id'],
+        role="assistant",
+        content=ai_response,
+        metadata={
+            "status": "completed",
+            "execution_details": stored_message['execution_details'],
+            "systems": stored_message['systems'],
+            "workflow": stored_message['workflow']
+        },
+        created_at=stored_message['created_at']
+    )
+
+def format_sse(event: str, data: Dict[str, Any]) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
 @router.post("/messages", response_model=MessageResponse)
 async def create_message(message: MessageRequest, current_user: User = Depends(get_current_user)):
     try:
-        # 1. Generate AI response using Together AI
-        try:
-            response = together_client.chat.completions.create(
-                model="meta-llama/Llama-3.3-70B-Instruct-Turbo",
-                messages=[
-                    {"role": "system", "content": "You are a helpful assistant."},
-                    {"role": "user", "content": message.content}
-                ],
-                max_tokens=1000
-            )
-            ai_response = response.choices[0].message.content
-        except Exception as e:
-            print(f"Error generating AI response: {str(e)}")
-            raise HTTPException(status_code=500, detail="Failed to generate AI response")
-
-        # 2. Store in user_data table with training_data compatible schema
-        user_message = {
-            "user_id": str(current_user.id),
-            "tool": "chat",  # Default tool for general chat
-            "intent": "general_chat",  # Default intent
-            "query": message.content,
-            "response": ai_response,
-            "systems": ["together_ai"],
-            "workflow": ["receive_query", "generate_response"],
-            "execution_details": [
-                {
-                    "step": "generate_response",
-                    "tool": "together_ai",
-                    "status": "success",
-                    "timestamp": datetime.utcnow().isoformat()
-                }
-            ],
-            "metadata": message.metadata,
-            "follow_up_queries": [],
-            "follow_up_responses": [],
-            "follow_up_context": {},
-            "created_at": datetime.utcnow().isoformat()
-        }
-        
-        result = supabase.table('user_data').insert(user_message).execute()
-        
-        if not result.data:
-            raise HTTPException(status_code=500, detail="Failed to store message")
-        
-        stored_message = result.data[0]
-        
-        # 3. Return formatted response
-        return MessageResponse(
-            id=stored_message['id'],
-            role="assistant",
-            content=ai_response,
-            metadata={
-                "status": "completed",
-                "execution_details": stored_message['execution_details'],
-                "systems": stored_message['systems'],
-                "workflow": stored_message['workflow']
-            },
-            created_at=stored_message['created_at']
-        )
+        # 1. Serve repeated questions from the response cache
+        ai_response = response_cache.get(current_user.id, message.content)
+        cached = ai_response is not None
+
+        # 2. Otherwise generate AI response using Together AI
+        if not cached:
+            try:
+                started = time.perf_counter()
+                response = await together_client.chat.completions.create(
+                    model=CHAT_MODEL,
+                    messages=build_chat_messages(message.content),
+                    max_tokens=MAX_TOKENS
+                )
+                ai_response = response.choices[0].message.content
+                response_cache.set(current_user.id, message.content, ai_response,
+                                   generation_seconds=time.perf_counter() - started)
+            except Exception as e:
+                print(f"Error generating AI response: {str(e)}")
+                raise HTTPException(status_code=500, detail="Failed to generate AI response")
+
+        # 3. Store in user_data table with training_data compatible schema
+        user_message = build_user_data_row(message, current_user, ai_response, cached=cached)
+        stored_message = await store_user_data_row(user_message)
+
+        # 4. Return formatted response
+        return to_message_response(stored_message, ai_response)
         
     except Exception as e:
         print(f"Error processing message: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@router.post("/messages/stream")
+async def stream_message(message: MessageRequest, current_user: User = Depends(get_current_user)):
+    """
+    Streaming variant of POST /messages.
+
+    Forwards Together AI tokens as server-sent events as soon as they arrive:
+      event: token  -> {"content": "..."}
+      event: done   -> the stored MessageResponse
+      event: error  -> {"detail": "..."}
+    The user_data row is written once generation finishes, after the last
+    token has already been sent to the client.
+    """
+    async def event_stream():
+        chunks: List[str] = []
+        cached_response = response_cache.get(current_user.id, message.content)
+
+        # 1. Forward tokens from Together AI as they are generated
+        try:
+            if cached_response is not None:
+                chunks.append(cached_response)
+                yield format_sse("token", {"content": cached_response})
+            else:
+                started = time.perf_counter()
+                stream = await together_client.chat.completions.create(
+                    model=CHAT_MODEL,
+                    messages=build_chat_messages(message.content),
+                    max_tokens=MAX_TOKENS,
+                    stream=True
+                )
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta.content
+                    if delta:
+                        chunks.append(delta)
+                        yield format_sse("token", {"content": delta})
+                response_cache.set(current_user.id, message.content, "".join(chunks),
+                                   generation_seconds=time.perf_counter() - started)
+        except Exception as e:
+            print(f"Error streaming AI response: {str(e)}")
+            yield format_sse("error", {"detail": "Failed to generate AI response"})
+            return
+
+        # 2. Persist the completed exchange
+        ai_response = "".join(chunks)
+        try:
+            user_message = build_user_data_row(message, current_user, ai_response,
+                                               cached=cached_response is not None)
+            stored_message = await store_user_data_row(user_message)
+        except Exception as e:
+            print(f"Error storing streamed message: {str(e)}")
+            yield format_sse("error", {"detail": "Failed to store message"})
+            return
+
+        # 3. Send the final message so the client has the stored id
+        yield format_sse("done", to_message_response(stored_message, ai_response).dict())
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+# Columns needed to render chat history; the large execution_details and
+# follow_up_* blobs are only fetched when explicitly requested.
+HISTORY_COLUMNS = "id,query,response,metadata,workflow,systems,feedback_score,feedback_notes,created_at"
+HISTORY_DETAIL_COLUMNS = "execution_details,follow_up_queries,follow_up_responses"
+DEFAULT_HISTORY_PAGE_SIZE = 100
+MAX_HISTORY_PAGE_SIZE = 500
+
+def encode_cursor(record: Dict[str, Any]) -> str:
+    raw = json.dumps([record['created_at'], record['id']])
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode and validate a cursor; its values end up in a PostgREST filter string"""
+    try:
+        created_at, record_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at = datetime.fromisoformat(str(created_at).replace('Z', '+00:00')).isoformat()
+        record_id = str(record_id)
+        if not record_id.isdigit():
+            record_id = str(uuid.UUID(record_id))
+        return created_at, record_id
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+async def fetch_history_page(user_id: str, limit: int, after: Optional[Tuple[str, str]] = None,
+                             include_details: bool = False) -> List[Dict[str, Any]]:
+    """Fetch one page of user_data rows ordered by (created_at, id), starting after `after`"""
+    columns = HISTORY_COLUMNS
+    if include_details:
+        columns = f"{columns},{HISTORY_DETAIL_COLUMNS}"
+
+    query = supabase.table('user_data')\
+        .select(columns)\
+        .eq('user_id', user_id)
+    if after:
+        created_at, record_id = after
+        query = query.or_(
+            f'created_at.gt."{created_at}",'
+            f'and(created_at.eq."{created_at}",id.gt.{record_id})'
+        )
+    query = query.order('created_at').order('id').limit(limit)
+
+    result = await asyncio.to_thread(query.execute)
+    return result.data or []
+
+def record_to_chat_messages(record: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Convert a user_data row into its user and assistant chat messages"""
+    assistant_metadata = {
+        "status": "completed",
+        "feedback_score": record.get('feedback_score'),
+        "feedback_notes": record.get('feedback_notes'),
+        "systems": record['systems'],
+        "workflow": record['workflow']
+    }
+    for column in HISTORY_DETAIL_COLUMNS.split(','):
+        if column in record:
+            assistant_metadata[column] = record[column]
+
+    return [
+        {
+            "id": f"{record['id']}_user",
+            "role": "user",
+            "content": record['query'],
+            "metadata": {
+                **(record.get('metadata') or {}),
+                "workflow": record['workflow'],
+                "systems": record['systems']
+            },
+            "created_at": record['created_at']
+        },
+        {
+            "id": f"{record['id']}_assistant",
+            "role": "assistant",
+            "content": record['response'],
+            "metadata": assistant_metadata,
+            "created_at": record['created_at']
+        }
+    ]
+
 @router.get("/messages")
-async def get_messages(current_user: User = Depends(get_current_user)):
+async def get_messages(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_HISTORY_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    include_details: Optional[bool] = None,
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Return the user's chat history in chronological order.
+
+    Without `limit` or `cursor`, JSON mode returns the full history with
+    the detail columns, as it always has. With either, it returns one page
+    of at most `limit` records (default DEFAULT_HISTORY_PAGE_SIZE); pass the
+    X-Next-Cursor response header back as `cursor` to fetch the next page.
+    NDJSON mode streams every message from `cursor` onwards, one JSON
+    object per line, fetching `limit` records at a time.
+    """
+    user_id = str(current_user.id)
+    after = decode_cursor(cursor) if cursor else None
+    paginated = limit is not None or cursor is not None
+    if include_details is None:
+        include_details = not paginated and format == "json"
+    if limit is None:
+        limit = DEFAULT_HISTORY_PAGE_SIZE if paginated or format == "ndjson" else MAX_HISTORY_PAGE_SIZE
+
+    if format == "ndjson":
+        async def ndjson_stream():
+            page_after = after
+            while True:
+                try:
+                    page = await fetch_history_page(user_id, limit, page_after, include_details)
+                except Exception as e:
+                    print(f"Error streaming messages: {str(e)}")
+                    return
+                for record in page:
+                    for chat_message in record_to_chat_messages(record):
+                        yield json.dumps(chat_message) + "\n"
+                if len(page) < limit:
+                    return
+                page_after = (page[-1]['created_at'], page[-1]['id'])
+
+        return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+
     try:
-        result = supabase.table('user_data')\
-            .select('*')\
-            .eq('user_id', str(current_user.id))\
-            .order('created_at')\
-            .execute()
-        
+        page = await fetch_history_page(user_id, limit, after, include_details)
+        records = list(page)
+        # Unpaginated request: keep reading pages until the history is exhausted
+        while not paginated and len(page) == limit:
+            page = await fetch_history_page(user_id, limit, (page[-1]['created_at'], page[-1]['id']), include_details)
+            records.extend(page)
+
         # Convert to chat format
         messages = []
-        for record in result.data:
-            # Add user message
-            messages.append({
-                "id": f"{record['id']}_user",
-                "role": "user",
-                "content": record['query'],
-                "metadata": {
-                    **record['metadata'],
-                    "workflow": record['workflow'],
-                    "systems": record['systems']
-                },
-                "created_at": record['created_at']
-            })
-            # Add assistant message
-            messages.append({
-                "id": f"{record['id']}_assistant",
-                "role": "assistant",
-                "content": record['response'],
-                "metadata": {
-                    "status": "completed",
-                    "execution_details": record['execution_details'],
-                    "feedback_score": record.get('feedback_score'),
-                    "feedback_notes": record.get('feedback_notes'),
-                    "systems": record['systems'],
-                    "workflow": record['workflow'],
-                    "follow_up_queries": record['follow_up_queries'],
-                    "follow_up_responses": record['follow_up_responses']
-                },
-                "created_at": record['created_at']
-            })
+        for record in records:
+            messages.extend(record_to_chat_messages(record))
+
+        if paginated and len(page) == limit:
+            response.headers["X-Next-Cursor"] = encode_cursor(page[-1])
         
         return messages
     except Exception as e:
@@ -0,0 +1,182 @@
+"""
+Response cache for chat completions.
+Serves repeated questions without paying for another LLM completion.
+
+Two tiers, both scoped per user:
+  - exact: keyed on the normalized query text
+  - semantic (optional): cosine similarity between query embeddings
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+import hashlib
+import math
+import os
+import re
+import threading
+import time
+
+# Response cache configuration
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+RESPONSE_CACHE_MAX_SIZE = int(os.getenv("RESPONSE_CACHE_MAX_SIZE", "2048"))
+RESPONSE_CACHE_SEMANTIC = os.getenv("RESPONSE_CACHE_SEMANTIC", "false").lower() in ("1", "true", "yes")
+RESPONSE_CACHE_SIMILARITY = float(os.getenv("RESPONSE_CACHE_SIMILARITY", "0.92"))
+
+EMBEDDING_DIMENSIONS = 256
+
+def normalize_query(text: str) -> str:
+    """Lowercase, drop punctuation and collapse whitespace"""
+    text = re.sub(r"[^\w\s#]", " ", text.lower())
+    return " ".join(text.split())
+
+def hashing_embedding(text: str, dimensions: int = EMBEDDING_DIMENSIONS) -> List[float]:
+    """
+    Cheap local embedding: hashed word unigrams and bigrams, L2-normalized.
+    Good enough to catch rephrasings that share most of their words.
+    """
+    words = normalize_query(text).split()
+    features = words + [f"{a} {b}" for a, b in zip(words, words[1:])]
+    vector = [0.0] * dimensions
+    for feature in features:
+        digest = hashlib.md5(feature.encode()).digest()
+        index = int.from_bytes(digest[:4], "little") % dimensions
+        vector[index] += 1.0 if digest[4] & 1 else -1.0
+    norm = math.sqrt(sum(v * v for v in vector))
+    return [v / norm for v in vector] if norm else vector
+
+@dataclass
+class CacheEntry:
+    response: str
+    expires_at: float
+    generation_seconds: float
+    embedding: Optional[List[float]] = None
+
+class ResponseCache:
+    """
+    TTL + LRU cache of (user_id, normalized query) -> LLM response.
+
+    When `semantic` is enabled, a miss on the exact key falls back to the
+    most similar cached query for the same user, if its cosine similarity
+    is at least `similarity_threshold`. Entries are also indexed per user, so
+    that scan only covers the caller's own entries, and queries are embedded
+    outside the lock.
+    """
+    def __init__(self,
+                 ttl: float = RESPONSE_CACHE_TTL_SECONDS,
+                 max_size: int = RESPONSE_CACHE_MAX_SIZE,
+                 semantic: bool = RESPONSE_CACHE_SEMANTIC,
+                 similarity_threshold: float = RESPONSE_CACHE_SIMILARITY,
+                 embed: Callable[[str], List[float]] = hashing_embedding):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.semantic = semantic
+        self.similarity_threshold = similarity_threshold
+        self.embed = embed
+        self.exact_hits = 0
+        self.semantic_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.latency_saved_seconds = 0.0
+        self._entries: OrderedDict[Tuple[str, str], CacheEntry] = OrderedDict()
+        self._user_entries: Dict[str, Dict[str, CacheEntry]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, user_id: str, query: str) -> Optional[str]:
+        key = (str(user_id), normalize_query(query))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= now:
+                self._remove(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.exact_hits += 1
+                self.latency_saved_seconds += entry.generation_seconds
+                return entry.response
+            if not self.semantic:
+                self.misses += 1
+                return None
+
+        embedding = self.embed(query)
+        with self._lock:
+            match = self._find_similar(key[0], embedding, now)
+            if match is not None:
+                self._entries.move_to_end(match)
+                entry = self._entries[match]
+                self.semantic_hits += 1
+                self.latency_saved_seconds += entry.generation_seconds
+                return entry.response
+
+            self.misses += 1
+            return None
+
+    def set(self, user_id: str, query: str, response: str, generation_seconds: float = 0.0):
+        if self.max_size <= 0 or self.ttl <= 0 or not response:
+            return
+        key = (str(user_id), normalize_query(query))
+        entry = CacheEntry(
+            response=response,
+            expires_at=time.monotonic() + self.ttl,
+            generation_seconds=generation_seconds,
+            embedding=self.embed(query) if self.semantic else None
+        )
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = entry
+            self._user_entries.setdefault(key[0], {})[key[1]] = entry
+            while len(self._entries) > self.max_size:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def invalidate_user(self, user_id: str):
+        user_id = str(user_id)
+        with self._lock:
+            for query in self._user_entries.pop(user_id, {}):
+                del self._entries[(user_id, query)]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._user_entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            hits = self.exact_hits + self.semantic_hits
+            lookups = hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "ttl_seconds": self.ttl,
+                "semantic": self.semantic,
+                "exact_hits": self.exact_hits,
+                "semantic_hits": self.semantic_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": hits / lookups if lookups else 0.0,
+                "latency_saved_seconds": round(self.latency_saved_seconds, 3)
+            }
+
+    def _remove(self, key: Tuple[str, str]):
+        if self._entries.pop(key, None) is None:
+            return
+        user_entries = self._user_entries[key[0]]
+        del user_entries[key[1]]
+        if not user_entries:
+            del self._user_entries[key[0]]
+
+    def _find_similar(self, user_id: str, embedding: List[float], now: float) -> Optional[Tuple[str, str]]:
+        best_key = None
+        best_score = self.similarity_threshold
+        for query, entry in self._user_entries.get(user_id, {}).items():
+            if entry.embedding is None or entry.expires_at <= now:
+                continue
+            score = sum(a * b for a, b in zip(embedding, entry.embedding))
+            if score >= best_score:
+                best_key, best_score = (user_id, query), score
+        return best_key
+
+response_cache = ResponseCache()
+
+def get_response_cache_stats() -> Dict[str, float]:
+    return response_cache.stats()
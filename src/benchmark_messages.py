@@ -0,0 +1,99 @@
+"""
+Load benchmark for the /api/messages handler.
+
+Replaces the Together AI and Supabase clients with fakes that simulate
+network latency, then fires batches of concurrent create_message calls
+and reports throughput. With the async LLM client and thread-offloaded
+persistence, throughput should grow with the number of in-flight requests
+instead of staying flat at ~1 / latency.
+
+Run from the src directory:
+    python benchmark_messages.py --llm-latency 0.5 --db-latency 0.05
+"""
+import argparse
+import asyncio
+import os
+import time
+import uuid
+from types import SimpleNamespace
+
+# The API modules create their clients at import time, so make sure
+# there is something syntactically valid to hand them.
+os.environ.setdefault('SUPABASE_URL', 'http://localhost:54321')
+os.environ.setdefault('SUPABASE_KEY', 'bench.bench.bench')
+os.environ.setdefault('TOGETHER_AI_KEY', 'bench')
+
+from api import messages
+from api.auth import User
+
+
+class FakeCompletions:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    async def create(self, **kwargs):
+        await asyncio.sleep(self.latency)
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content="Benchmark response"))]
+        )
+
+
+class FakeQuery:
+    def __init__(self, latency: float, row=None):
+        self.latency = latency
+        self.row = row
+
+    def insert(self, row):
+        return FakeQuery(self.latency, row)
+
+    def execute(self):
+        # Blocking sleep, like the real synchronous Supabase client
+        time.sleep(self.latency)
+        return SimpleNamespace(data=[{**self.row, "id": str(uuid.uuid4())}])
+
+
+class FakeSupabase:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def table(self, name):
+        return FakeQuery(self.latency)
+
+
+async def run_level(concurrency: int, user: User) -> float:
+    # Distinct queries so the response cache doesn't short-circuit the LLM call
+    requests = [
+        messages.MessageRequest(role="user", content=f"What were today's sales? ({uuid.uuid4()})")
+        for _ in range(concurrency)
+    ]
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        messages.create_message(request, current_user=user)
+        for request in requests
+    ))
+    return time.perf_counter() - start
+
+
+async def main(args):
+    messages.together_client = SimpleNamespace(
+        chat=SimpleNamespace(completions=FakeCompletions(args.llm_latency))
+    )
+    messages.supabase = FakeSupabase(args.db_latency)
+    user = User(id=uuid.uuid4(), email="bench@example.com")
+
+    print(f"LLM latency: {args.llm_latency}s, DB latency: {args.db_latency}s")
+    print(f"{'in-flight':>10} {'elapsed (s)':>12} {'req/s':>10}")
+    for concurrency in args.levels:
+        elapsed = await run_level(concurrency, user)
+        print(f"{concurrency:>10} {elapsed:>12.3f} {concurrency / elapsed:>10.1f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark concurrent /api/messages throughput")
+    parser.add_argument("--llm-latency", type=float, default=0.5,
+                        help="Simulated completion latency in seconds")
+    parser.add_argument("--db-latency", type=float, default=0.05,
+                        help="Simulated Supabase insert latency in seconds")
+    parser.add_argument("--levels", type=int, nargs="+", default=[1, 4, 16, 32],
+                        help="Number of concurrent requests to run at each level")
+    asyncio.run(main(parser.parse_args()))
@@ -15,13 +15,15 @@ from config.settings import (
     TOOL_INTENTS
 )
 from src.db.supabase_client import SupabaseClient
+from http_client import get_httpx_client
 
 class TrainingDataGenerator:
     def __init__(self):
         """Initialize the generator with OpenAI and Supabase clients"""
         self.openai_client = OpenAI(
             api_key=TOGETHER_API_KEY,
-            base_url="https://api.together.xyz/v1"
+            base_url="https://api.together.xyz/v1",
+            http_client=get_httpx_client()
         )
         self.db = SupabaseClient()
 
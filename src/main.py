@@ -1,9 +1,10 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from api.messages import router as messages_router
-from api.auth import router as auth_router, get_current_user, User
+from api.auth import router as auth_router, get_current_user, get_user_cache_stats, User
 from api.feedback import router as feedback_router
 from api.analytics import router as analytics_router
+from api.response_cache import get_response_cache_stats
 
 app = FastAPI(title="CursorMCP API")
 
@@ -29,3 +30,11 @@ async def root():
 @app.get("/api/me", tags=["auth"])
 async def read_users_me(current_user: User = Depends(get_current_user)):
     return current_user
+
+@app.get("/api/auth/cache-stats", tags=["auth"])
+async def read_user_cache_stats(current_user: User = Depends(get_current_user)):
+    return get_user_cache_stats()
+
+@app.get("/api/messages/cache-stats", tags=["messages"])
+async def read_response_cache_stats(current_user: User = Depends(get_current_user)):
+    return get_response_cache_stats()
@@ -0,0 +1,115 @@
+"""
+Server-side training data statistics
+
+TrainingDataVerifier.get_training_stats used to run five full-table selects
+and count distinct queries, systems/scenarios distributions and workflow
+lengths on the client. The statistics are now computed by the
+get_training_stats() Postgres function (create_training_stats_function.sql)
+in one scan, and only the aggregate numbers come back.
+
+SQLITE_TRAINING_STATS_SQL is the same aggregation for SQLite (array and
+JSONB columns stored as JSON text), used as a local stand-in to check the
+function's results against an export without a database.
+
+Usage:
+    stats = fetch_training_stats(supabase)
+
+    python training_stats.py training_data_export.jsonl
+"""
+
+import argparse
+import json
+import sqlite3
+from collections import defaultdict
+from typing import Any, Dict, Iterable
+
+# Same statistics as public.get_training_stats(), over a SQLite training_data table
+SQLITE_TRAINING_STATS_SQL = """
+    WITH totals AS (
+        SELECT
+            COUNT(*) AS total_examples,
+            COUNT(DISTINCT query) AS unique_queries,
+            COALESCE(ROUND(AVG(COALESCE(json_array_length(workflow), 0)), 2), 0) AS average_workflow_length
+        FROM training_data
+    ),
+    systems_count AS (
+        SELECT system.value AS system, COUNT(*) AS count
+        FROM training_data, json_each(COALESCE(training_data.systems, '[]')) AS system
+        GROUP BY system.value
+    ),
+    scenarios_count AS (
+        SELECT json_extract(metadata, '$.scenario') AS scenario, COUNT(*) AS count
+        FROM training_data
+        WHERE COALESCE(json_extract(metadata, '$.scenario'), '') <> ''
+        GROUP BY json_extract(metadata, '$.scenario')
+    )
+    SELECT json_object(
+        'total_examples', totals.total_examples,
+        'unique_queries', totals.unique_queries,
+        'average_workflow_length', totals.average_workflow_length,
+        'systems_distribution', (SELECT json_group_object(system, count) FROM systems_count),
+        'scenarios_distribution', (SELECT json_group_object(scenario, count) FROM scenarios_count)
+    )
+    FROM totals
+"""
+
+def normalize_stats(aggregate: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape an aggregate row like TrainingDataVerifier.get_training_stats always returned it"""
+    return {
+        "total_examples": int(aggregate.get("total_examples") or 0),
+        "unique_queries": int(aggregate.get("unique_queries") or 0),
+        "systems_distribution": defaultdict(int, aggregate.get("systems_distribution") or {}),
+        "scenarios_distribution": defaultdict(int, aggregate.get("scenarios_distribution") or {}),
+        "average_workflow_length": round(float(aggregate.get("average_workflow_length") or 0), 2)
+    }
+
+def fetch_training_stats(supabase) -> Dict[str, Any]:
+    """Run public.get_training_stats() and return its aggregates"""
+    result = supabase.rpc('get_training_stats').execute()
+    aggregate = result.data[0] if isinstance(result.data, list) else result.data
+    if isinstance(aggregate, dict) and 'get_training_stats' in aggregate:
+        aggregate = aggregate['get_training_stats']
+    return normalize_stats(aggregate or {})
+
+def load_sqlite_stand_in(rows: Iterable[Dict[str, Any]], path: str = ":memory:") -> sqlite3.Connection:
+    """Create a SQLite training_data table from rows (arrays/JSONB stored as JSON text)"""
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE IF NOT EXISTS training_data (query TEXT, systems TEXT, metadata TEXT, workflow TEXT)")
+    conn.executemany(
+        "INSERT INTO training_data (query, systems, metadata, workflow) VALUES (?, ?, ?, ?)",
+        (
+            (
+                row.get('query'),
+                json.dumps(row['systems']) if row.get('systems') is not None else None,
+                json.dumps(row['metadata']) if row.get('metadata') is not None else None,
+                json.dumps(row['workflow']) if row.get('workflow') is not None else None
+            )
+            for row in rows
+        )
+    )
+    conn.commit()
+    return conn
+
+def sqlite_training_stats(conn: sqlite3.Connection) -> Dict[str, Any]:
+    """Compute the statistics from a SQLite stand-in table in one query"""
+    (aggregate,) = conn.execute(SQLITE_TRAINING_STATS_SQL).fetchone()
+    return normalize_stats(json.loads(aggregate))
+
+def main():
+    parser = argparse.ArgumentParser(description="Compute training data statistics from an export via SQLite")
+    parser.add_argument("paths", nargs="+", help="JSON/JSONL exports of training_data")
+    parser.add_argument("--db", default=":memory:", help="SQLite file to load the export into")
+    args = parser.parse_args()
+
+    rows = []
+    for path in args.paths:
+        with open(path) as f:
+            if path.endswith(".jsonl"):
+                rows.extend(json.loads(line) for line in f if line.strip())
+            else:
+                rows.extend(json.load(f))
+    conn = load_sqlite_stand_in(rows, args.db)
+    print(json.dumps(sqlite_training_stats(conn), indent=2))
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ from typing import List, Dict, Any
 import matplotlib.pyplot as plt
 import seaborn as sns
 import logging
+from training_stats import fetch_training_stats
 
 # Set up logging
 logging.basicConfig(
@@ -45,47 +46,13 @@ class TrainingDataVerifier:
         self.supabase = None
             
     def get_training_stats(self) -> Dict[str, Any]:
-        """Get overall training data statistics"""
-        stats = {
-            "total_examples": 0,
-            "unique_queries": 0,
-            "systems_distribution": defaultdict(int),
-            "scenarios_distribution": defaultdict(int),
-            "average_workflow_length": 0
-        }
-        
+        """Get overall training data statistics, aggregated server-side in one query"""
         try:
-            # Get total examples
-            result = self.supabase.table('training_data').select('*', count='exact').execute()
-            stats["total_examples"] = result.count
-            
-            # Get unique queries
-            result = self.supabase.table('training_data').select('query').execute()
-            stats["unique_queries"] = len(set(row['query'] for row in result.data))
-            
-            # Get systems distribution
-            result = self.supabase.table('training_data').select('systems').execute()
-            for row in result.data:
-                for system in row['systems']:
-                    stats["systems_distribution"][system] += 1
-                    
-            # Get scenarios distribution
-            result = self.supabase.table('training_data').select('metadata').execute()
-            for row in result.data:
-                scenario = row['metadata'].get('scenario')
-                if scenario:
-                    stats["scenarios_distribution"][scenario] += 1
-                    
-            # Get average workflow length
-            result = self.supabase.table('training_data').select('workflow').execute()
-            lengths = [len(row['workflow']) for row in result.data]
-            stats["average_workflow_length"] = round(sum(lengths) / len(lengths), 2) if lengths else 0
-            
+            # public.get_training_stats() (create_training_stats_function.sql) returns only the aggregates
+            return fetch_training_stats(self.supabase)
         except Exception as e:
             logging.error(f"Error getting training stats: {str(e)}")
             raise
-            
-        return stats
         
     def analyze_query_quality(self, sample_size: int = 100) -> List[Dict[str, Any]]:
         """Analyze quality of generated queries"""